@@ -7,14 +7,18 @@ from alphaforge.core.component import Component, ComponentState
 from alphaforge.core.config import AlphaForgeConfig
 from alphaforge.core.exceptions import AlphaForgeError, ValidationError
 from alphaforge.core.logging import get_logger
-from alphaforge.core.uuid import uuid4_new, uuid4_bytes, is_valid_uuid4
+from alphaforge.core.uuid import uuid4_new, uuid4_new_batch, uuid4_bytes, is_valid_uuid4
 from alphaforge.core.time import UnixNanos, AtomicTime
 
-# Import Rust components when available
+# Import Rust components when available. alphaforge_pyo3 always imports (it
+# carries its own minimal stubs), so probe the compiled extension directly and
+# otherwise use the full-featured Python fallbacks below.
 try:
+    import alphaforge_pyo3.alphaforge_pyo3
     from alphaforge_pyo3.core import (
         unix_nanos_now,
         uuid4_new as rust_uuid4_new,
+        uuid4_new_batch as rust_uuid4_new_batch,
         Cache,
         CacheConfig,
         CacheStatistics,
@@ -22,18 +26,15 @@ try:
     RUST_AVAILABLE = True
     # Override with Rust implementations if available
     uuid4_new = rust_uuid4_new
+    uuid4_new_batch = rust_uuid4_new_batch
 except ImportError:
     RUST_AVAILABLE = False
-    # Using fallback implementations
-    import time
-    import uuid
+    # Using fallback implementations (uuid4_new/uuid4_new_batch come from
+    # alphaforge.core.uuid)
+    # time.time_ns already returns int nanoseconds; bind it directly rather
+    # than wrapping it in a Python function
+    from time import time_ns as unix_nanos_now
     from alphaforge.core.cache import Cache, CacheConfig, CacheStatistics
-    
-    def unix_nanos_now() -> int:
-        return int(time.time_ns())
-    
-    def uuid4_new() -> str:
-        return str(uuid.uuid4())
 
 __all__ = [
     "Component",
@@ -44,6 +45,7 @@ __all__ = [
     "get_logger",
     "unix_nanos_now",
     "uuid4_new",
+    "uuid4_new_batch",
     "Cache",
     "CacheConfig",
     "CacheStatistics",
@@ -4,16 +4,47 @@ Python fallback implementation for cache system when Rust components are not ava
 This provides the same API but with reduced performance compared to the Rust implementation.
 """
 
-from typing import Dict, Any, Optional, List, TypeVar, Generic
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Iterable, Sequence, Tuple
 from dataclasses import dataclass
-from threading import RLock
-import time
+from threading import Lock, RLock, get_ident
+from time import monotonic_ns, sleep
+from contextlib import ExitStack, contextmanager
 import json
-from collections import OrderedDict
+import os
+
+import msgpack
+
+from alphaforge.core.compat import _SLOTS
+
+try:
+    # orjson is C-implemented and much faster for large snapshots
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    from typing import TypeVar
+    T = TypeVar('T')
+
+# Upper bound on lock stripes; must be a power of two
+_MAX_SHARDS = 32
+# Smallest per-shard capacity worth striping for; smaller caches stay exact LRU
+_MIN_SHARD_SIZE = 256
+
+# Evicted links recycled per cache, split across its shards
+_LINK_POOL_MAX = 1024
+_DEAD_LINK = (None, None, None, None, None)
 
-T = TypeVar('T')
+# Write-ahead log record opcodes
+_WAL_PUT, _WAL_REMOVE, _WAL_CLEAR = 0, 1, 2
 
-@dataclass
+@dataclass(**_SLOTS)
 class CacheStatistics:
     """Cache performance statistics."""
     hits: int = 0
@@ -29,202 +60,491 @@ class CacheStatistics:
         if total == 0:
             return 0.0
         return (self.hits / total) * 100.0
+    
+    def reset(self) -> None:
+        """Zero every counter in place."""
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.evictions = 0
+        self.memory_usage = 0
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class CacheConfig:
-    """Cache configuration."""
+    """Cache configuration. Immutable: a Cache sizes its shards from it once."""
     max_size: int = 10_000
     ttl_seconds: Optional[int] = None
     enable_statistics: bool = True
     enable_persistence: bool = False
     persistence_path: Optional[str] = None
 
-class CacheEntry:
-    """Internal cache entry."""
-    
-    def __init__(self, value: Any, ttl: Optional[float] = None):
-        self.value = value
-        self.created_at = time.time()
-        self.expires_at = ttl + self.created_at if ttl else None
-        self.access_count = 0
-        self.last_accessed = self.created_at
-    
-    def is_expired(self) -> bool:
-        """Check if entry has expired."""
-        if self.expires_at is None:
-            return False
-        return time.time() > self.expires_at
+# Link layout used by the per-shard LRU list, modeled on functools.lru_cache.
+# EXPIRES_AT is a time.monotonic_ns() deadline, or None for no TTL.
+PREV, NEXT, KEY, VALUE, EXPIRES_AT = 0, 1, 2, 3, 4
+
+class _CacheShard:
+    """
+    Independently locked slice of the cache keyspace.
+    
+    Entries live in a circular doubly linked list of ``[PREV, NEXT, KEY, VALUE,
+    EXPIRES_AT]`` links hanging off a sentinel root, indexed by a plain dict.
+    The link after the root is least recently used, the link before it most
+    recently used.
+    """
     
-    def touch(self) -> None:
-        """Update access statistics."""
-        self.access_count += 1
-        self.last_accessed = time.time()
+    __slots__ = ("lock", "map", "root", "max_size", "stats", "pool", "pool_max")
+    
+    def __init__(self, max_size: int, enable_statistics: bool, pool_max: int):
+        self.lock = RLock()
+        self.map: Dict[str, list] = {}
+        self.root: list = []
+        self.root[:] = [self.root, self.root, None, None, None]
+        self.max_size = max_size
+        self.stats = CacheStatistics() if enable_statistics else None
+        # Free list of evicted links, reused by put to avoid reallocating
+        self.pool: List[list] = []
+        self.pool_max = pool_max
+    
+    def unlink(self, link: list) -> None:
+        """Detach a link from the list and the index."""
+        link_prev, link_next = link[PREV], link[NEXT]
+        link_prev[NEXT] = link_next
+        link_next[PREV] = link_prev
+        del self.map[link[KEY]]
+    
+    def collect_live(self, now: Optional[int], field: int, out: list) -> None:
+        """
+        Append ``link[field]`` of every live link to ``out`` in LRU order,
+        dropping links expired as of ``now`` in the same pass. ``now`` is None
+        when the cache has no TTL, which skips the deadline checks. Caller
+        must hold the lock.
+        """
+        append = out.append
+        root = self.root
+        link = root[NEXT]
+        if now is None:
+            while link is not root:
+                append(link[field])
+                link = link[NEXT]
+            return
+        while link is not root:
+            link_next = link[NEXT]
+            expires_at = link[EXPIRES_AT]
+            if expires_at is not None and now > expires_at:
+                self.unlink(link)
+                if self.stats:
+                    self.stats.evictions += 1
+            else:
+                append(link[field])
+            link = link_next
+    
+    def iter_links(self):
+        """Iterate links from least to most recently used. Caller must hold the lock."""
+        root = self.root
+        link = root[NEXT]
+        while link is not root:
+            yield link
+            link = link[NEXT]
 
-class Cache(Generic[T]):
+class Cache:
     """
     Python fallback cache implementation.
     
     Provides the same API as the Rust cache but with reduced performance.
-    Uses OrderedDict for LRU eviction and threading.RLock for thread safety.
+    The keyspace is striped across up to 32 shards, each with its own RLock,
+    so concurrent callers only contend when their keys hash to the same
+    shard. LRU eviction is enforced per shard, with ``max_size`` split evenly
+    between the shards.
+    
+    Until a second thread calls in, the thread that created the cache skips
+    the shard locks entirely (common for asyncio-only services). The first
+    call from any other thread waits for an in-flight lock-free operation to
+    finish and permanently switches the cache to locked mode.
+    
+    With persistence enabled, mutations are appended to a msgpack
+    write-ahead log next to the snapshot file (``<persistence_path>.wal``).
+    ``save_to_disk`` compacts by writing a fresh snapshot and truncating the
+    log; on startup the snapshot is loaded and the log replayed over it.
     """
     
     def __init__(self, config: CacheConfig):
         self.config = config
-        self._lock = RLock()
-        self._data: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._stats = CacheStatistics() if config.enable_statistics else None
+        # Hoisted so the hot path reads plain instance attributes
+        ttl = config.ttl_seconds
+        self._ttl_ns = int(ttl * 1_000_000_000) if ttl else None
+        
+        # Power-of-two shard count so routing is a mask over the key's hash.
+        # str caches its hash, so routing costs no extra hashing after the
+        # first lookup of a given key object.
+        shard_count = 1
+        while (shard_count < _MAX_SHARDS
+               and shard_count * 2 * _MIN_SHARD_SIZE <= config.max_size):
+            shard_count *= 2
+        self._shard_mask = shard_count - 1
+        
+        base, extra = divmod(config.max_size, shard_count)
+        pool_max = max(1, _LINK_POOL_MAX // shard_count)
+        self._shards = [
+            _CacheShard(base + (1 if i < extra else 0), config.enable_statistics, pool_max)
+            for i in range(shard_count)
+        ]
+        
+        # Single-thread fast path: owner thread skips shard locks until contended
+        self._owner = get_ident()
+        self._contended = False
+        self._busy = False
+        
+        self._wal = None
+        self._wal_lock = Lock()
         
         # Load from persistence if enabled
         if config.enable_persistence and config.persistence_path:
             self._load_from_disk()
+            self._wal = open(self._wal_path, 'ab')
+    
+    def _lock_free(self) -> bool:
+        """
+        Decide whether this call may skip the shard lock.
+        
+        Returns True only on the owner thread before any contention, with
+        ``_busy`` set; the caller must clear it when done. ``_busy`` is raised
+        before re-checking ``_contended`` so that a thread switching the cache
+        to locked mode either sees the flag or is seen by us.
+        """
+        if self._contended:
+            return False
+        if get_ident() != self._owner:
+            self._mark_contended()
+            return False
+        self._busy = True
+        if self._contended:
+            self._busy = False
+            return False
+        return True
+    
+    def _mark_contended(self) -> None:
+        """Switch to locked mode, waiting out any in-flight lock-free operation."""
+        self._contended = True
+        while self._busy:
+            sleep(0)
+    
+    def _check_thread(self) -> None:
+        """Called by always-locked operations before touching the shards."""
+        if not self._contended and get_ident() != self._owner:
+            self._mark_contended()
     
     def get(self, key: str) -> Optional[T]:
         """Get value from cache."""
-        with self._lock:
-            entry = self._data.get(key)
-            
-            if entry is None:
-                if self._stats:
-                    self._stats.misses += 1
-                return None
-            
-            if entry.is_expired():
-                self._data.pop(key, None)
-                if self._stats:
-                    self._stats.misses += 1
-                    self._stats.evictions += 1
-                return None
-            
-            # Move to end for LRU
-            self._data.move_to_end(key)
-            entry.touch()
-            
-            if self._stats:
-                self._stats.hits += 1
-            
-            return entry.value
+        shard = self._shards[hash(key) & self._shard_mask]
+        if self._lock_free():
+            try:
+                return self._get(shard, key)
+            finally:
+                self._busy = False
+        with shard.lock:
+            return self._get(shard, key)
     
     def put(self, key: str, value: T) -> bool:
         """Put value into cache."""
-        with self._lock:
-            ttl = self.config.ttl_seconds
-            entry = CacheEntry(value, ttl)
-            
-            # Check if key already exists
-            existed = key in self._data
-            
-            # Add/update entry
-            self._data[key] = entry
-            self._data.move_to_end(key)  # Move to end for LRU
-            
-            if self._stats and not existed:
-                self._stats.inserts += 1
-            
-            # Check size limit
-            while len(self._data) > self.config.max_size:
-                # Remove oldest entry (LRU)
-                oldest_key, _ = self._data.popitem(last=False)
-                if self._stats:
-                    self._stats.evictions += 1
-            
-            return True
+        shard = self._shards[hash(key) & self._shard_mask]
+        if self._lock_free():
+            try:
+                return self._put(shard, key, value)
+            finally:
+                self._busy = False
+        with shard.lock:
+            return self._put(shard, key, value)
     
     def contains(self, key: str) -> bool:
         """Check if key exists in cache."""
-        with self._lock:
-            entry = self._data.get(key)
-            if entry is None:
-                return False
-            
-            if entry.is_expired():
-                self._data.pop(key, None)
-                if self._stats:
-                    self._stats.evictions += 1
-                return False
-            
-            return True
+        shard = self._shards[hash(key) & self._shard_mask]
+        if self._lock_free():
+            try:
+                return self._contains(shard, key)
+            finally:
+                self._busy = False
+        with shard.lock:
+            return self._contains(shard, key)
     
     def remove(self, key: str) -> bool:
         """Remove key from cache."""
-        with self._lock:
-            existed = key in self._data
-            self._data.pop(key, None)
-            return existed
+        shard = self._shards[hash(key) & self._shard_mask]
+        if self._lock_free():
+            try:
+                return self._remove(shard, key)
+            finally:
+                self._busy = False
+        with shard.lock:
+            return self._remove(shard, key)
+    
+    def get_many(self, keys: Sequence[str]) -> List[Optional[T]]:
+        """
+        Get several values at once, in the order of ``keys``.
+        
+        Keys are grouped by shard so each shard lock is taken once per batch.
+        """
+        shards = self._shards
+        mask = self._shard_mask
+        if self._lock_free():
+            try:
+                return [self._get(shards[hash(key) & mask], key) for key in keys]
+            finally:
+                self._busy = False
+        
+        results: List[Optional[T]] = [None] * len(keys)
+        for index, positions in self._group_by_shard(keys).items():
+            shard = shards[index]
+            with shard.lock:
+                for i in positions:
+                    results[i] = self._get(shard, keys[i])
+        return results
+    
+    def put_many(self, items: Iterable[Tuple[str, T]]) -> None:
+        """
+        Put several key/value pairs at once.
+        
+        Pairs are grouped by shard so each shard lock is taken once per batch.
+        Within a shard, pairs are applied in the order given.
+        """
+        shards = self._shards
+        mask = self._shard_mask
+        if self._lock_free():
+            try:
+                for key, value in items:
+                    self._put(shards[hash(key) & mask], key, value)
+                return
+            finally:
+                self._busy = False
+        
+        items = list(items)
+        keys = [key for key, _ in items]
+        for index, positions in self._group_by_shard(keys).items():
+            shard = shards[index]
+            with shard.lock:
+                for i in positions:
+                    key, value = items[i]
+                    self._put(shard, key, value)
+    
+    def _group_by_shard(self, keys: Sequence[str]) -> Dict[int, List[int]]:
+        """Map shard index to the positions in ``keys`` routed to it."""
+        mask = self._shard_mask
+        if mask == 0:
+            return {0: list(range(len(keys)))}
+        groups: Dict[int, List[int]] = {}
+        for i, key in enumerate(keys):
+            index = hash(key) & mask
+            positions = groups.get(index)
+            if positions is None:
+                groups[index] = [i]
+            else:
+                positions.append(i)
+        return groups
+    
+    def _get(self, shard: _CacheShard, key: str) -> Optional[T]:
+        """Body of get(); caller provides exclusion on the shard."""
+        link = shard.map.get(key)
+        
+        if link is None:
+            if shard.stats:
+                shard.stats.misses += 1
+            return None
+        
+        expires_at = link[EXPIRES_AT]
+        if expires_at is not None and monotonic_ns() > expires_at:
+            shard.unlink(link)
+            if shard.stats:
+                shard.stats.misses += 1
+                shard.stats.evictions += 1
+            return None
+        
+        # Move to the most recently used position
+        link_prev, link_next = link[PREV], link[NEXT]
+        link_prev[NEXT] = link_next
+        link_next[PREV] = link_prev
+        root = shard.root
+        last = root[PREV]
+        last[NEXT] = root[PREV] = link
+        link[PREV] = last
+        link[NEXT] = root
+        
+        if shard.stats:
+            shard.stats.hits += 1
+        
+        return link[VALUE]
+    
+    def _put(self, shard: _CacheShard, key: str, value: T) -> bool:
+        """Body of put(); caller provides exclusion on the shard."""
+        ttl_ns = self._ttl_ns
+        expires_at = monotonic_ns() + ttl_ns if ttl_ns is not None else None
+        root = shard.root
+        link = shard.map.get(key)
+        
+        if link is not None:
+            # Update in place and move to the most recently used position
+            link[VALUE] = value
+            link[EXPIRES_AT] = expires_at
+            link_prev, link_next = link[PREV], link[NEXT]
+            link_prev[NEXT] = link_next
+            link_next[PREV] = link_prev
+            last = root[PREV]
+            last[NEXT] = root[PREV] = link
+            link[PREV] = last
+            link[NEXT] = root
+            if self._wal is not None:
+                self._append_wal((_WAL_PUT, key, value))
+            return True
+        
+        last = root[PREV]
+        pool = shard.pool
+        if pool:
+            link = pool.pop()
+            link[:] = (last, root, key, value, expires_at)
+        else:
+            link = [last, root, key, value, expires_at]
+        last[NEXT] = root[PREV] = shard.map[key] = link
+        
+        if shard.stats:
+            shard.stats.inserts += 1
+        
+        # Check size limit
+        while len(shard.map) > shard.max_size:
+            # Remove oldest entry (LRU) and recycle its link
+            oldest = root[NEXT]
+            shard.unlink(oldest)
+            if len(pool) < shard.pool_max:
+                oldest[:] = _DEAD_LINK
+                pool.append(oldest)
+            if shard.stats:
+                shard.stats.evictions += 1
+        
+        if self._wal is not None:
+            self._append_wal((_WAL_PUT, key, value))
+        
+        return True
+    
+    def _contains(self, shard: _CacheShard, key: str) -> bool:
+        """Body of contains(); caller provides exclusion on the shard."""
+        link = shard.map.get(key)
+        if link is None:
+            return False
+        
+        expires_at = link[EXPIRES_AT]
+        if expires_at is not None and monotonic_ns() > expires_at:
+            shard.unlink(link)
+            if shard.stats:
+                shard.stats.evictions += 1
+            return False
+        
+        return True
+    
+    def _remove(self, shard: _CacheShard, key: str) -> bool:
+        """Body of remove(); caller provides exclusion on the shard."""
+        link = shard.map.get(key)
+        if link is None:
+            return False
+        shard.unlink(link)
+        if self._wal is not None:
+            self._append_wal((_WAL_REMOVE, key))
+        return True
     
     def clear(self) -> None:
         """Clear all entries from cache."""
-        with self._lock:
-            self._data.clear()
-            if self._stats:
-                self._stats = CacheStatistics()
+        self._check_thread()
+        with self._all_shards_locked():
+            for shard in self._shards:
+                shard.map.clear()
+                shard.root[:] = [shard.root, shard.root, None, None, None]
+                if shard.stats:
+                    shard.stats.reset()
+            if self._wal is not None:
+                self._append_wal((_WAL_CLEAR,))
     
     def size(self) -> int:
         """Get current cache size."""
-        with self._lock:
-            return len(self._data)
+        return sum(len(shard.map) for shard in self._shards)
     
     def keys(self) -> List[str]:
         """Get all keys in cache."""
-        with self._lock:
-            # Clean expired entries first
-            current_time = time.time()
-            expired_keys = []
-            
-            for key, entry in self._data.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                self._data.pop(key, None)
-                if self._stats:
-                    self._stats.evictions += 1
-            
-            return list(self._data.keys())
+        self._check_thread()
+        keys: List[str] = []
+        now = monotonic_ns() if self._ttl_ns is not None else None
+        for shard in self._shards:
+            with shard.lock:
+                shard.collect_live(now, KEY, keys)
+        return keys
     
     def values(self) -> List[T]:
         """Get all values in cache."""
-        with self._lock:
-            # Clean expired entries first
-            current_time = time.time()
-            expired_keys = []
-            
-            for key, entry in self._data.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
-            
-            for key in expired_keys:
-                self._data.pop(key, None)
-                if self._stats:
-                    self._stats.evictions += 1
-            
-            return [entry.value for entry in self._data.values()]
+        self._check_thread()
+        values: List[T] = []
+        now = monotonic_ns() if self._ttl_ns is not None else None
+        for shard in self._shards:
+            with shard.lock:
+                shard.collect_live(now, VALUE, values)
+        return values
     
     def statistics(self) -> Optional[CacheStatistics]:
-        """Get cache statistics."""
-        if not self._stats:
+        """Get cache statistics, aggregated across shards."""
+        if not self.config.enable_statistics:
             return None
+        self._check_thread()
         
-        with self._lock:
-            # Update memory usage estimate
-            if self._stats:
-                self._stats.memory_usage = len(self._data) * 64  # Rough estimate
-            
-            return self._stats
+        total = CacheStatistics()
+        for shard in self._shards:
+            with shard.lock:
+                stats = shard.stats
+                total.hits += stats.hits
+                total.misses += stats.misses
+                total.inserts += stats.inserts
+                total.evictions += stats.evictions
+                total.memory_usage += len(shard.map) * 64  # Rough estimate
+        
+        return total
     
     def reset_statistics(self) -> None:
         """Reset cache statistics."""
-        if self._stats:
-            with self._lock:
-                self._stats = CacheStatistics()
+        if not self.config.enable_statistics:
+            return
+        self._check_thread()
+        
+        for shard in self._shards:
+            with shard.lock:
+                shard.stats.reset()
+    
+    @contextmanager
+    def _all_shards_locked(self):
+        """Hold every shard lock, always acquired in shard order."""
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard.lock)
+            yield
+    
+    @property
+    def _wal_path(self) -> str:
+        return f"{self.config.persistence_path}.wal"
+    
+    def _append_wal(self, record: tuple) -> None:
+        """Append a record to the write-ahead log from within a shard operation."""
+        try:
+            packed = msgpack.packb(record, use_bin_type=True)
+        except (TypeError, ValueError):
+            # An unserializable value cannot be persisted. Log a removal so
+            # replay drops the key instead of restoring the overwritten value
+            packed = msgpack.packb((_WAL_REMOVE, record[1]), use_bin_type=True)
+        
+        with self._wal_lock:
+            if self._wal is not None:
+                self._wal.write(packed)
+                self._wal.flush()
     
     def _load_from_disk(self) -> None:
-        """Load cache from disk if persistence is enabled."""
+        """Load the snapshot, then replay the write-ahead log over it."""
         if not self.config.persistence_path:
             return
         
         try:
-            with open(self.config.persistence_path, 'r') as f:
-                data = json.load(f)
+            with open(self.config.persistence_path, 'rb') as f:
+                data = _json_loads(f.read())
                 
             for key, value in data.items():
                 self.put(key, value)
@@ -232,30 +552,68 @@ class Cache(Generic[T]):
         except (FileNotFoundError, json.JSONDecodeError):
             # File doesn't exist or is corrupted, start fresh
             pass
+        
+        try:
+            with open(self._wal_path, 'rb') as f:
+                for record in msgpack.Unpacker(f, raw=False):
+                    op = record[0]
+                    if op == _WAL_PUT:
+                        self.put(record[1], record[2])
+                    elif op == _WAL_REMOVE:
+                        self.remove(record[1])
+                    elif op == _WAL_CLEAR:
+                        self.clear()
+        except FileNotFoundError:
+            pass
+        except (ValueError, msgpack.UnpackException):
+            # Torn tail from an interrupted write; keep what was replayed
+            pass
     
     def save_to_disk(self) -> bool:
-        """Save cache to disk if persistence is enabled."""
+        """
+        Compact persistence: write a full snapshot and truncate the log.
+        
+        Entries written since the last compaction are already durable in the
+        write-ahead log, so this only needs calling periodically to bound the
+        log size and startup replay time.
+        """
         if not self.config.persistence_path:
             return False
+        self._check_thread()
         
         try:
-            with self._lock:
+            with self._all_shards_locked():
                 # Only save non-expired entries
                 data = {}
-                current_time = time.time()
+                now = monotonic_ns()
+                for shard in self._shards:
+                    for link in shard.iter_links():
+                        expires_at = link[EXPIRES_AT]
+                        if expires_at is None or now <= expires_at:
+                            data[link[KEY]] = link[VALUE]
                 
-                for key, entry in self._data.items():
-                    if not entry.is_expired():
-                        data[key] = entry.value
-            
-            with open(self.config.persistence_path, 'w') as f:
-                json.dump(data, f, indent=2)
+                # Compact encoding: cache snapshots are machine-read only
+                tmp_path = f"{self.config.persistence_path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(_json_dumps(data))
+                os.replace(tmp_path, self.config.persistence_path)
+                
+                with self._wal_lock:
+                    if self._wal is not None:
+                        self._wal.truncate(0)
                 
             return True
             
         except Exception:
             return False
     
+    def close(self) -> None:
+        """Close the write-ahead log. Further mutations are not persisted."""
+        with self._wal_lock:
+            if self._wal is not None:
+                self._wal.close()
+                self._wal = None
+    
     def __len__(self) -> int:
         """Get cache size."""
         return self.size()
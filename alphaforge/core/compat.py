@@ -0,0 +1,9 @@
+# AlphaForge Compatibility Helpers
+"""
+Interpreter-version switches shared across AlphaForge modules.
+"""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; splat into @dataclass(**_SLOTS)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
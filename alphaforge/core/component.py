@@ -5,12 +5,17 @@ Base component class with finite state machine lifecycle management.
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections import deque
 from enum import Enum
 from typing import Optional, Dict, Any
 import logging
 from alphaforge.core.exceptions import ComponentError
 
 
+# Number of most recent state transitions retained per component
+STATE_HISTORY_SIZE = 64
+
+
 class ComponentState(Enum):
     """Component lifecycle states."""
     INITIALIZING = "INITIALIZING"
@@ -30,16 +35,23 @@ class Component(ABC):
     
     Provides finite state machine lifecycle management with async support.
     All components must implement the abstract lifecycle methods.
+    
+    Declares ``__slots__``; subclasses that declare their own ``__slots__``
+    stay free of a per-instance ``__dict__``.
     """
     
+    __slots__ = ("name", "config", "_state", "_logger", "_state_history", "__weakref__")
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         self.name = name
         self.config = config or {}
         self._state = ComponentState.INITIALIZING
         self._logger = logging.getLogger(f"alphaforge.{name}")
         
-        # State transition tracking
-        self._state_history: list[ComponentState] = [ComponentState.INITIALIZING]
+        # State transition tracking (bounded, oldest transitions drop off)
+        self._state_history: deque[ComponentState] = deque(
+            [ComponentState.INITIALIZING], maxlen=STATE_HISTORY_SIZE
+        )
         
     @property
     def state(self) -> ComponentState:
@@ -49,106 +61,106 @@ class Component(ABC):
     @property
     def is_initialized(self) -> bool:
         """Check if component is initialized."""
-        return self._state in (
-            ComponentState.INITIALIZED,
-            ComponentState.STARTING,
-            ComponentState.RUNNING,
-            ComponentState.STOPPING,
-            ComponentState.STOPPED,
-            ComponentState.RESUMING,
+        # Every state except the three below; enum members are singletons,
+        # so identity checks avoid Enum.__eq__ dispatch
+        state = self._state
+        return not (
+            state is ComponentState.INITIALIZING
+            or state is ComponentState.ERROR
+            or state is ComponentState.DISPOSED
         )
         
     @property
     def is_running(self) -> bool:
         """Check if component is running."""
-        return self._state == ComponentState.RUNNING
+        return self._state is ComponentState.RUNNING
         
     async def initialize(self) -> None:
         """Initialize the component."""
-        if self._state != ComponentState.INITIALIZING:
+        if self._state is not ComponentState.INITIALIZING:
             raise ComponentError(f"Cannot initialize component in state {self._state}")
             
-        self._logger.info(f"Initializing {self.name}...")
+        self._logger.info("Initializing %s...", self.name)
         
         try:
             await self._initialize()
             self._transition_to(ComponentState.INITIALIZED)
-            self._logger.info(f"{self.name} initialized successfully")
+            self._logger.info("%s initialized successfully", self.name)
         except Exception as e:
             self._transition_to(ComponentState.ERROR)
-            self._logger.error(f"Failed to initialize {self.name}: {e}")
+            self._logger.error("Failed to initialize %s: %s", self.name, e)
             raise ComponentError(f"Initialization failed: {e}") from e
             
     async def start(self) -> None:
         """Start the component."""
-        if self._state != ComponentState.INITIALIZED:
+        if self._state is not ComponentState.INITIALIZED:
             raise ComponentError(f"Cannot start component in state {self._state}")
             
-        self._logger.info(f"Starting {self.name}...")
+        self._logger.info("Starting %s...", self.name)
         self._transition_to(ComponentState.STARTING)
         
         try:
             await self._start()
             self._transition_to(ComponentState.RUNNING)
-            self._logger.info(f"{self.name} started successfully")
+            self._logger.info("%s started successfully", self.name)
         except Exception as e:
             self._transition_to(ComponentState.ERROR)
-            self._logger.error(f"Failed to start {self.name}: {e}")
+            self._logger.error("Failed to start %s: %s", self.name, e)
             raise ComponentError(f"Start failed: {e}") from e
             
     async def stop(self) -> None:
         """Stop the component."""
-        if self._state not in (ComponentState.RUNNING, ComponentState.STARTING):
-            self._logger.warning(f"Attempting to stop {self.name} in state {self._state}")
+        if not (self._state is ComponentState.RUNNING or self._state is ComponentState.STARTING):
+            self._logger.warning("Attempting to stop %s in state %s", self.name, self._state)
             return
             
-        self._logger.info(f"Stopping {self.name}...")
+        self._logger.info("Stopping %s...", self.name)
         self._transition_to(ComponentState.STOPPING)
         
         try:
             await self._stop()
             self._transition_to(ComponentState.STOPPED)
-            self._logger.info(f"{self.name} stopped successfully")
+            self._logger.info("%s stopped successfully", self.name)
         except Exception as e:
             self._transition_to(ComponentState.ERROR)
-            self._logger.error(f"Failed to stop {self.name}: {e}")
+            self._logger.error("Failed to stop %s: %s", self.name, e)
             raise ComponentError(f"Stop failed: {e}") from e
             
     async def resume(self) -> None:
         """Resume the component from stopped state."""
-        if self._state != ComponentState.STOPPED:
+        if self._state is not ComponentState.STOPPED:
             raise ComponentError(f"Cannot resume component in state {self._state}")
             
-        self._logger.info(f"Resuming {self.name}...")
+        self._logger.info("Resuming %s...", self.name)
         self._transition_to(ComponentState.RESUMING)
         
         try:
             await self._resume()
             self._transition_to(ComponentState.RUNNING)
-            self._logger.info(f"{self.name} resumed successfully")
+            self._logger.info("%s resumed successfully", self.name)
         except Exception as e:
             self._transition_to(ComponentState.ERROR)
-            self._logger.error(f"Failed to resume {self.name}: {e}")
+            self._logger.error("Failed to resume %s: %s", self.name, e)
             raise ComponentError(f"Resume failed: {e}") from e
             
     async def dispose(self) -> None:
         """Dispose of the component and cleanup resources."""
-        if self._state == ComponentState.DISPOSED:
+        if self._state is ComponentState.DISPOSED:
             return
             
-        self._logger.info(f"Disposing {self.name}...")
+        self._logger.info("Disposing %s...", self.name)
         
         # Stop if running
-        if self._state in (ComponentState.RUNNING, ComponentState.STARTING):
+        if self._state is ComponentState.RUNNING or self._state is ComponentState.STARTING:
             await self.stop()
             
         try:
             await self._dispose()
             self._transition_to(ComponentState.DISPOSED)
-            self._logger.info(f"{self.name} disposed successfully")
+            self._logger.info("%s disposed successfully", self.name)
         except Exception as e:
             self._transition_to(ComponentState.ERROR)
-            self._logger.error(f"Failed to dispose {self.name}: {e}")
+            self._logger.error("Failed to dispose %s: %s", self.name, e)
             raise ComponentError(f"Dispose failed: {e}") from e
     
     def _transition_to(self, new_state: ComponentState) -> None:
@@ -157,7 +169,7 @@ class Component(ABC):
         self._state = new_state
         self._state_history.append(new_state)
         
-        self._logger.debug(f"State transition: {old_state} -> {new_state}")
+        self._logger.debug("State transition: %s -> %s", old_state, new_state)
         
     # Abstract methods to be implemented by subclasses
     @abstractmethod
@@ -6,12 +6,54 @@ Configuration management for AlphaForge trading system.
 import os
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
-from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, Union, Tuple, Callable, Set
+from dataclasses import dataclass, field, asdict
 import logging
 
 from alphaforge.core.exceptions import ValidationError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+
+
+# Directories already created by this process, so repeated config loads
+# skip the stat/mkdir syscalls
+_ENSURED_DIRS: Set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ENSURED_DIRS:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable."""
+    return value.lower() in _BOOL_TRUE
+
+
+# Map environment variables to config fields: (env var, field name, converter)
+_ENV_MAPPING: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ("ALPHAFORGE_TRADER_ID", "trader_id", str),
+    ("ALPHAFORGE_INSTANCE_ID", "instance_id", str),
+    ("ALPHAFORGE_LOG_LEVEL", "log_level", str),
+    ("ALPHAFORGE_MESSAGE_BUS_CAPACITY", "message_bus_capacity", int),
+    ("ALPHAFORGE_ORDER_BOOK_CACHE_SIZE", "order_book_cache_size", int),
+    ("ALPHAFORGE_ENABLE_HIGH_PRECISION", "enable_high_precision", _parse_bool),
+    ("ALPHAFORGE_MAX_POSITION_SIZE", "max_position_size", float),
+    ("ALPHAFORGE_MAX_ORDER_SIZE", "max_order_size", float),
+    ("ALPHAFORGE_DAILY_LOSS_LIMIT", "daily_loss_limit", float),
+    ("ALPHAFORGE_CACHE_DIRECTORY", "cache_directory", str),
+    ("ALPHAFORGE_LOG_DIRECTORY", "log_directory", str),
+)
+
 
 @dataclass
 class AlphaForgeConfig:
@@ -57,8 +99,8 @@ class AlphaForgeConfig:
         self.log_directory = os.path.expanduser(self.log_directory)
         
         # Create directories if they don't exist
-        Path(self.cache_directory).mkdir(parents=True, exist_ok=True)
-        Path(self.log_directory).mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.cache_directory)
+        _ensure_dir(self.log_directory)
     
     def validate(self) -> None:
         """Validate configuration parameters."""
@@ -68,7 +110,7 @@ class AlphaForgeConfig:
         if not self.instance_id:
             raise ValidationError("instance_id cannot be empty")
             
-        if self.log_level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        if self.log_level not in _VALID_LOG_LEVELS:
             raise ValidationError(f"Invalid log_level: {self.log_level}")
             
         if self.message_bus_capacity <= 0:
@@ -92,8 +134,9 @@ class AlphaForgeConfig:
             raise ValidationError(f"Configuration file not found: {config_path}")
             
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            with open(config_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             return cls(**data)
         except json.JSONDecodeError as e:
             raise ValidationError(f"Invalid JSON in configuration file: {e}")
@@ -105,67 +148,31 @@ class AlphaForgeConfig:
         """Load configuration from environment variables."""
         config = {}
         
-        # Map environment variables to config fields
-        env_mapping = {
-            "ALPHAFORGE_TRADER_ID": "trader_id",
-            "ALPHAFORGE_INSTANCE_ID": "instance_id", 
-            "ALPHAFORGE_LOG_LEVEL": "log_level",
-            "ALPHAFORGE_MESSAGE_BUS_CAPACITY": ("message_bus_capacity", int),
-            "ALPHAFORGE_ORDER_BOOK_CACHE_SIZE": ("order_book_cache_size", int),
-            "ALPHAFORGE_ENABLE_HIGH_PRECISION": ("enable_high_precision", bool),
-            "ALPHAFORGE_MAX_POSITION_SIZE": ("max_position_size", float),
-            "ALPHAFORGE_MAX_ORDER_SIZE": ("max_order_size", float),
-            "ALPHAFORGE_DAILY_LOSS_LIMIT": ("daily_loss_limit", float),
-            "ALPHAFORGE_CACHE_DIRECTORY": "cache_directory",
-            "ALPHAFORGE_LOG_DIRECTORY": "log_directory",
-        }
-        
-        for env_var, field_info in env_mapping.items():
+        for env_var, field_name, convert in _ENV_MAPPING:
             value = os.getenv(env_var)
             if value is not None:
-                if isinstance(field_info, tuple):
-                    field_name, field_type = field_info
-                    try:
-                        if field_type == bool:
-                            config[field_name] = value.lower() in ("true", "1", "yes", "on")
-                        else:
-                            config[field_name] = field_type(value)
-                    except ValueError as e:
-                        raise ValidationError(f"Invalid value for {env_var}: {value}")
-                else:
-                    config[field_info] = value
+                try:
+                    config[field_name] = convert(value)
+                except ValueError as e:
+                    raise ValidationError(f"Invalid value for {env_var}: {value}") from e
         
         return cls(**config)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return {
-            "trader_id": self.trader_id,
-            "instance_id": self.instance_id,
-            "log_level": self.log_level,
-            "message_bus_capacity": self.message_bus_capacity,
-            "order_book_cache_size": self.order_book_cache_size,
-            "enable_high_precision": self.enable_high_precision,
-            "enable_simd_optimizations": self.enable_simd_optimizations,
-            "websocket_heartbeat_interval_s": self.websocket_heartbeat_interval_s,
-            "websocket_reconnect_max_attempts": self.websocket_reconnect_max_attempts,
-            "websocket_reconnect_interval_s": self.websocket_reconnect_interval_s,
-            "max_position_size": self.max_position_size,
-            "max_order_size": self.max_order_size,
-            "daily_loss_limit": self.daily_loss_limit,
-            "cache_directory": self.cache_directory,
-            "log_directory": self.log_directory,
-            "data_compression": self.data_compression,
-            "exchanges": self.exchanges,
-        }
+        return asdict(self)
     
     def save_to_file(self, config_path: Union[str, Path]) -> None:
         """Save configuration to JSON file."""
         config_path = Path(config_path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(config_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if orjson is not None:
+            with open(config_path, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(config_path, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
     
     def add_exchange_config(self, name: str, config: Dict[str, Any]) -> None:
         """Add exchange-specific configuration."""
@@ -3,11 +3,13 @@
 High-performance logging system with Rust integration.
 """
 
+import atexit
 import logging
 import sys
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional
-from enum import Enum
+from typing import Callable, Deque, List, Optional, Tuple
 
 try:
     # Try to use Rust logging if available
@@ -17,26 +19,157 @@ except ImportError:
     RUST_LOGGING_AVAILABLE = False
 
 
-class LogColor(Enum):
-    """Log color enumeration for console output."""
-    NORMAL = "NORMAL"
-    GREEN = "GREEN" 
-    BLUE = "BLUE"
-    YELLOW = "YELLOW"
-    RED = "RED"
-    MAGENTA = "MAGENTA"
-    CYAN = "CYAN"
+# Log colors for console output, passed straight through to the backend
+COLOR_NORMAL = sys.intern("NORMAL")
+COLOR_GREEN = sys.intern("GREEN")
+COLOR_BLUE = sys.intern("BLUE")
+COLOR_YELLOW = sys.intern("YELLOW")
+COLOR_RED = sys.intern("RED")
+COLOR_MAGENTA = sys.intern("MAGENTA")
+COLOR_CYAN = sys.intern("CYAN")
+
+
+class LogColor:
+    """Log color namespace for console output (plain strings, not an Enum)."""
+    NORMAL = COLOR_NORMAL
+    GREEN = COLOR_GREEN
+    BLUE = COLOR_BLUE
+    YELLOW = COLOR_YELLOW
+    RED = COLOR_RED
+    MAGENTA = COLOR_MAGENTA
+    CYAN = COLOR_CYAN
+
+
+# Accepted level names and their numeric levels
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Level methods bound on each logger, their levels and default colors
+_LEVEL_METHODS = (
+    ("debug", logging.DEBUG, COLOR_NORMAL),
+    ("info", logging.INFO, COLOR_NORMAL),
+    ("warning", logging.WARNING, COLOR_YELLOW),
+    ("error", logging.ERROR, COLOR_RED),
+    ("critical", logging.CRITICAL, COLOR_RED),
+)
+
+
+# Pending records held by the batching ring buffer; oldest are dropped when full
+LOG_BUFFER_SIZE = 65536
+
+# Maximum records handed to the backend per flush call
+LOG_BATCH_SIZE = 1024
+
+LogRecord = Tuple[int, str, str, str]
+
+
+class _LogBatcher:
+    """
+    Ring buffer of pending log records drained by a daemon thread.
+    
+    Producers append ``(level, name, message, color)`` and return at once.
+    The worker hands up to ``LOG_BATCH_SIZE`` records per call to
+    ``alphaforge_pyo3.log_batch`` when the extension provides it, otherwise
+    to the stdlib loggers.
+    """
+    
+    def __init__(self, capacity: int = LOG_BUFFER_SIZE):
+        self.buffer: Deque[LogRecord] = deque(maxlen=capacity)
+        self.wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._rust_log_batch = (
+            getattr(alphaforge_pyo3, "log_batch", None)
+            if RUST_LOGGING_AVAILABLE else None
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="alphaforge-log-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.flush)
+    
+    def _run(self) -> None:
+        """Wait for records and flush them until the process exits."""
+        wait = self.wake.wait
+        clear = self.wake.clear
+        while True:
+            wait()
+            # Clear before draining so a record appended mid-flush re-arms it
+            clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Emit every pending record in batches."""
+        buffer = self.buffer
+        popleft = buffer.popleft
+        with self._flush_lock:
+            while buffer:
+                batch: List[LogRecord] = []
+                try:
+                    for _ in range(LOG_BATCH_SIZE):
+                        batch.append(popleft())
+                except IndexError:
+                    pass
+                try:
+                    self._emit(batch)
+                except Exception:
+                    # Never let a failing backend kill the flush thread
+                    pass
+    
+    def _emit(self, batch: List[LogRecord]) -> None:
+        """Hand one batch to the backend."""
+        if self._rust_log_batch is not None:
+            self._rust_log_batch(batch)
+            return
+        get_python_logger = logging.getLogger
+        for level_int, name, message, _color in batch:
+            get_python_logger(name).log(level_int, message)
+
+
+_batcher: Optional[_LogBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def _get_batcher() -> _LogBatcher:
+    """Return the shared batcher, starting its flush thread on first use."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = _LogBatcher()
+        return _batcher
+
+
+def flush_logs() -> None:
+    """Synchronously emit any records pending in the batching buffer."""
+    if _batcher is not None:
+        _batcher.flush()
 
 
 class AlphaForgeLogger:
     """
     High-performance logger with optional Rust backend.
+    
+    The ``debug``/``info``/``warning``/``error``/``critical`` methods are
+    bound per instance at construction, taking ``(message, color)``. With
+    ``batched=True`` they only enqueue the record in a shared ring buffer
+    that a background thread flushes; see ``flush_logs``. Change the level
+    with ``set_level`` so the methods are rebound.
     """
     
-    def __init__(self, name: str, level: str = "INFO"):
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+    critical: Callable[..., None]
+    
+    def __init__(self, name: str, level: str = "INFO", batched: bool = False):
         self.name = name
+        self.batched = batched
         self._python_logger = logging.getLogger(name)
-        self._python_logger.setLevel(getattr(logging, level))
         
         # Set up console handler if not already configured
         if not self._python_logger.handlers:
@@ -46,82 +179,100 @@ class AlphaForgeLogger:
             )
             handler.setFormatter(formatter)
             self._python_logger.addHandler(handler)
-    
-    def debug(self, message: str, color: LogColor = LogColor.NORMAL) -> None:
-        """Log DEBUG level message."""
-        if RUST_LOGGING_AVAILABLE:
-            # Use Rust logging for performance
-            try:
-                alphaforge_pyo3.log_debug(self.name, message, color.value)
-                return
-            except AttributeError:
-                pass  # Fallback to Python logging
         
-        self._python_logger.debug(message)
+        self.set_level(level)
     
-    def info(self, message: str, color: LogColor = LogColor.NORMAL) -> None:
-        """Log INFO level message."""
-        if RUST_LOGGING_AVAILABLE:
-            try:
-                alphaforge_pyo3.log_info(self.name, message, color.value)
-                return
-            except AttributeError:
-                pass
+    def set_level(self, level: str) -> None:
+        """
+        Set the log level and rebind the level methods to match.
         
-        self._python_logger.info(message)
-    
-    def warning(self, message: str, color: LogColor = LogColor.YELLOW) -> None:
-        """Log WARNING level message."""
-        if RUST_LOGGING_AVAILABLE:
-            try:
-                alphaforge_pyo3.log_warning(self.name, message, color.value)
-                return
-            except AttributeError:
-                pass
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        """
+        self._level_int = _LEVELS[level]
+        self._python_logger.setLevel(self._level_int)
         
-        self._python_logger.warning(message)
+        # Bind debug/info/warning/error/critical once per level change
+        for method, level_int, default_color in _LEVEL_METHODS:
+            setattr(self, method, self._bind_level(method, level_int, default_color))
     
-    def error(self, message: str, color: LogColor = LogColor.RED) -> None:
-        """Log ERROR level message."""
-        if RUST_LOGGING_AVAILABLE:
-            try:
-                alphaforge_pyo3.log_error(self.name, message, color.value)
-                return
-            except AttributeError:
-                pass
+    def _bind_level(
+        self, method: str, level_int: int, default_color: str
+    ) -> Callable[..., None]:
+        """
+        Resolve the backend for one level method.
         
-        self._python_logger.error(message)
-    
-    def critical(self, message: str, color: LogColor = LogColor.RED) -> None:
-        """Log CRITICAL level message."""
-        if RUST_LOGGING_AVAILABLE:
-            try:
-                alphaforge_pyo3.log_critical(self.name, message, color.value)
-                return
-            except AttributeError:
-                pass
+        The Rust entry point is looked up once here so the per-call path is a
+        single closure call with no global or attribute lookups. On the Rust
+        and batched paths, levels below the logger's level get a no-op, so
+        filtered calls never cross into Rust or the queue. The stdlib path
+        keeps the stdlib logger's own live level check.
+        """
+        rust_log = (
+            getattr(alphaforge_pyo3, f"log_{method}", None)
+            if RUST_LOGGING_AVAILABLE else None
+        )
+        
+        if level_int < self._level_int and (self.batched or rust_log is not None):
+            def log(message: str, color: str = default_color) -> None:
+                return None
+        elif self.batched:
+            batcher = _get_batcher()
+            append = batcher.buffer.append
+            is_set = batcher.wake.is_set
+            wake = batcher.wake.set
+            name = self.name
+            
+            def log(message: str, color: str = default_color) -> None:
+                append((level_int, name, message, color))
+                if not is_set():
+                    wake()
+        elif rust_log is not None:
+            name = self.name
+            
+            def log(message: str, color: str = default_color) -> None:
+                rust_log(name, message, color)
+        else:
+            python_log = getattr(self._python_logger, method)
+            
+            def log(message: str, color: str = default_color) -> None:
+                python_log(message)
         
-        self._python_logger.critical(message)
+        log.__name__ = method
+        log.__doc__ = f"Log {method.upper()} level message."
+        return log
 
 
 # Global logger cache
 _loggers: dict[str, AlphaForgeLogger] = {}
+_loggers_lock = threading.Lock()
 
 
-def get_logger(name: str, level: str = "INFO") -> AlphaForgeLogger:
+def get_logger(
+    name: str, level: Optional[str] = None, batched: bool = False
+) -> AlphaForgeLogger:
     """
     Get or create a logger instance.
     
     Args:
         name: Logger name
-        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL); also applied
+            to an existing logger. New loggers default to INFO.
+        batched: Enqueue records for a background flush thread
         
     Returns:
         AlphaForgeLogger instance
     """
-    if name not in _loggers:
-        _loggers[name] = AlphaForgeLogger(name, level)
-    return _loggers[name]
+    logger = _loggers.get(name)
+    if logger is None:
+        # Re-check under the lock so racing first callers share one instance
+        with _loggers_lock:
+            logger = _loggers.get(name)
+            if logger is None:
+                logger = _loggers[name] = AlphaForgeLogger(name, level or "INFO", batched)
+    elif level is not None and _LEVELS[level] != logger._level_int:
+        logger.set_level(level)
+    return logger
 
 
 def configure_logging(
@@ -139,7 +290,7 @@ def configure_logging(
     """
     # Configure Python logging
     logging.basicConfig(
-        level=getattr(logging, level),
+        level=_LEVELS[level],
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
             logging.StreamHandler(sys.stdout),
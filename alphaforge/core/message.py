@@ -6,16 +6,17 @@ This is the Python fallback when Rust extensions are not available.
 
 import asyncio
 import threading
-from typing import Any, Dict, List, Callable, Optional, Set, TypeVar, Generic
-from dataclasses import dataclass
+import time
+from typing import Any, Deque, Dict, List, Callable, Optional, Set, Tuple, TypeVar, Generic
+from collections import deque
 from enum import Enum
-from collections import defaultdict
 from alphaforge.core.uuid import uuid4_new
 
 
 T = TypeVar('T')
 MessageHandler = Callable[[Any], None]
 AsyncMessageHandler = Callable[[Any], asyncio.Future]
+_new = object.__new__
 
 
 class MessageType(Enum):
@@ -26,36 +27,150 @@ class MessageType(Enum):
     POINT_TO_POINT = "p2p"
 
 
-@dataclass
 class Message:
-    """Message wrapper."""
-    id: str
-    type: MessageType
-    topic: str
-    payload: Any
-    correlation_id: Optional[str] = None
-    reply_to: Optional[str] = None
-    timestamp: float = 0.0
-    
-    def __post_init__(self):
-        if self.timestamp == 0.0:
-            import time
-            self.timestamp = time.time()
+    """
+    Message wrapper.
+    
+    A plain ``__slots__`` class rather than a dataclass: one is built per
+    published message, so it skips the per-instance ``__dict__``.
+    """
+    
+    __slots__ = ("id", "type", "topic", "payload", "correlation_id", "reply_to", "timestamp")
+    
+    def __init__(
+        self,
+        id: str,
+        type: MessageType,
+        topic: str,
+        payload: Any,
+        correlation_id: Optional[str] = None,
+        reply_to: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ):
+        self.id = id
+        self.type = type
+        self.topic = topic
+        self.payload = payload
+        self.correlation_id = correlation_id
+        self.reply_to = reply_to
+        self.timestamp = time.time() if timestamp is None else timestamp
+    
+    def __repr__(self) -> str:
+        return (
+            f"Message(id={self.id!r}, type={self.type!r}, topic={self.topic!r}, "
+            f"payload={self.payload!r}, correlation_id={self.correlation_id!r}, "
+            f"reply_to={self.reply_to!r}, timestamp={self.timestamp!r})"
+        )
+
+
+# Capacity of the bus queue; a power of two so slots are indexed by mask
+MESSAGE_QUEUE_SIZE = 131072
+
+
+class _MessageRing:
+    """
+    Fixed-capacity FIFO ring buffer backing the message bus queue.
+    
+    Slots are preallocated and indexed by ``counter & mask``. Like
+    ``asyncio.Queue`` it is confined to the event loop thread; the events
+    only fire on the empty -> non-empty and full -> non-full transitions,
+    not per message.
+    """
+    
+    __slots__ = ("_slots", "_mask", "_head", "_tail", "_not_empty", "_not_full")
+    
+    def __init__(self, capacity: int = MESSAGE_QUEUE_SIZE):
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a positive power of two")
+        self._slots: List[Optional[Message]] = [None] * capacity
+        self._mask = capacity - 1
+        self._head = 0
+        self._tail = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+    
+    def qsize(self) -> int:
+        return self._tail - self._head
+    
+    def empty(self) -> bool:
+        return self._head == self._tail
+    
+    def put_nowait(self, item: Message) -> bool:
+        """Append an item, returning False if the ring is full."""
+        tail = self._tail
+        if tail - self._head > self._mask:
+            return False
+        self._slots[tail & self._mask] = item
+        self._tail = tail + 1
+        if tail == self._head:
+            self._not_empty.set()
+        return True
+    
+    async def put(self, item: Message) -> None:
+        """Append an item, waiting for space if the ring is full."""
+        while not self.put_nowait(item):
+            self._not_full.clear()
+            await self._not_full.wait()
+    
+    def get_nowait(self) -> Message:
+        """Pop the oldest item; the caller must check ``empty()`` first."""
+        head = self._head
+        index = head & self._mask
+        item = self._slots[index]
+        self._slots[index] = None
+        self._head = head + 1
+        if self._tail - head > self._mask:
+            self._not_full.set()
+        return item
+    
+    async def get(self) -> Message:
+        """Pop the oldest item, waiting until one is available."""
+        while self._head == self._tail:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+
+# Dispatched Message objects kept per bus for reuse
+MESSAGE_FREE_LIST_SIZE = 4096
+
+# Subscriber write locks, sharded by topic hash; a power of two
+SUBSCRIBER_LOCK_SHARDS = 16
+
+# Maximum messages the worker drains per wakeup
+MESSAGE_BATCH_SIZE = 256
 
 
 class MessageBus:
-    """High-performance message bus for event-driven architecture."""
+    """
+    High-performance message bus for event-driven architecture.
+    
+    Args:
+        async_handler_timeout: Seconds to wait for a batch's async handlers
+            before cancelling them. ``None`` (the default) awaits them without
+            a timer; set it when subscribers may hang.
+    """
     
-    def __init__(self):
-        self._subscribers: Dict[str, List[MessageHandler]] = defaultdict(list)
-        self._async_subscribers: Dict[str, List[AsyncMessageHandler]] = defaultdict(list)
+    def __init__(self, async_handler_timeout: Optional[float] = None):
+        self._async_handler_timeout = async_handler_timeout
+        # Copy-on-write: subscribe replaces the tuple under the lock, so
+        # dispatch reads a consistent snapshot without locking or copying
+        self._subscribers: Dict[str, Tuple[MessageHandler, ...]] = {}
+        self._async_subscribers: Dict[str, Tuple[AsyncMessageHandler, ...]] = {}
         self._request_handlers: Dict[str, MessageHandler] = {}
         self._async_request_handlers: Dict[str, AsyncMessageHandler] = {}
         self._pending_requests: Dict[str, asyncio.Future] = {}
         self._lock = threading.RLock()
+        # Subscribe/unsubscribe on different topics take different locks
+        self._subscriber_locks = tuple(
+            threading.Lock() for _ in range(SUBSCRIBER_LOCK_SHARDS)
+        )
+        self._subscriber_lock_mask = SUBSCRIBER_LOCK_SHARDS - 1
         self._running = False
-        self._message_queue: asyncio.Queue = None
+        self._message_queue: Optional[_MessageRing] = None
         self._worker_task: Optional[asyncio.Task] = None
+        self._free_messages: Deque[Message] = deque(maxlen=MESSAGE_FREE_LIST_SIZE)
     
     async def start(self) -> None:
         """Start the message bus."""
@@ -63,7 +178,7 @@ class MessageBus:
             return
         
         self._running = True
-        self._message_queue = asyncio.Queue(maxsize=100000)  # High capacity queue
+        self._message_queue = _MessageRing(MESSAGE_QUEUE_SIZE)
         self._worker_task = asyncio.create_task(self._message_worker())
     
     async def stop(self) -> None:
@@ -87,16 +202,23 @@ class MessageBus:
                     future.cancel()
             self._pending_requests.clear()
     
+    def _subscriber_lock(self, topic: str) -> threading.Lock:
+        """Return the write lock guarding a topic's handler tuples."""
+        return self._subscriber_locks[hash(topic) & self._subscriber_lock_mask]
+    
     def subscribe(self, topic: str, handler: MessageHandler) -> str:
         """
         Subscribe to a topic with synchronous handler.
         
+        The handler receives messages published after this call returns;
+        publishes already in flight keep the handler set they started with.
+        
         Returns:
             Subscription ID for unsubscribing
         """
-        with self._lock:
+        with self._subscriber_lock(topic):
             subscription_id = uuid4_new()
-            self._subscribers[topic].append(handler)
+            self._subscribers[topic] = self._subscribers.get(topic, ()) + (handler,)
             return subscription_id
     
     def subscribe_async(self, topic: str, handler: AsyncMessageHandler) -> str:
@@ -106,9 +228,9 @@ class MessageBus:
         Returns:
             Subscription ID for unsubscribing
         """
-        with self._lock:
+        with self._subscriber_lock(topic):
             subscription_id = uuid4_new()
-            self._async_subscribers[topic].append(handler)
+            self._async_subscribers[topic] = self._async_subscribers.get(topic, ()) + (handler,)
             return subscription_id
     
     def unsubscribe(self, topic: str, subscription_id: str) -> bool:
@@ -118,14 +240,14 @@ class MessageBus:
         Returns:
             True if unsubscribed successfully
         """
-        with self._lock:
+        with self._subscriber_lock(topic):
             # Note: In a full implementation, we'd track subscription IDs
             # For now, remove all handlers for the topic
             if topic in self._subscribers:
-                self._subscribers[topic].clear()
+                self._subscribers[topic] = ()
                 return True
             if topic in self._async_subscribers:
-                self._async_subscribers[topic].clear()
+                self._async_subscribers[topic] = ()
                 return True
             return False
     
@@ -134,30 +256,28 @@ class MessageBus:
         if not self._running or not self._message_queue:
             return
         
-        msg = Message(
-            id=uuid4_new(),
-            type=MessageType.PUBLISH,
-            topic=topic,
-            payload=message
-        )
+        msg = self._alloc_message(MessageType.PUBLISH, topic, message)
         
-        try:
-            await self._message_queue.put(msg)
-        except asyncio.QueueFull:
-            # In production, this would be logged as a warning
-            pass
+        await self._message_queue.put(msg)
     
     def publish_sync(self, topic: str, message: Any) -> None:
-        """Publish a message synchronously (for sync contexts)."""
+        """
+        Publish a message synchronously (for sync contexts).
+        
+        Takes no lock: handlers are read from the topic's current tuple, so a
+        concurrent ``subscribe`` is seen either entirely or not at all for
+        this message, and a slow handler never blocks other publishers.
+        """
         # Direct dispatch to sync handlers only
-        with self._lock:
-            handlers = self._subscribers.get(topic, [])
-            for handler in handlers:
-                try:
-                    handler(message)
-                except Exception:
-                    # Log error in production
-                    pass
+        handlers = self._subscribers.get(topic)
+        if not handlers:
+            return
+        for handler in handlers:
+            try:
+                handler(message)
+            except Exception:
+                # Log error in production
+                pass
     
     async def request(self, topic: str, message: Any, timeout: float = 5.0) -> Any:
         """
@@ -181,13 +301,8 @@ class MessageBus:
             self._pending_requests[correlation_id] = response_future
         
         # Send request
-        msg = Message(
-            id=uuid4_new(),
-            type=MessageType.REQUEST,
-            topic=topic,
-            payload=message,
-            correlation_id=correlation_id,
-            reply_to=reply_to
+        msg = self._alloc_message(
+            MessageType.REQUEST, topic, message, correlation_id, reply_to
         )
         
         try:
@@ -203,19 +318,12 @@ class MessageBus:
         if not request_msg.reply_to or not request_msg.correlation_id:
             return
         
-        msg = Message(
-            id=uuid4_new(),
-            type=MessageType.RESPONSE,
-            topic=request_msg.reply_to,
-            payload=response,
-            correlation_id=request_msg.correlation_id
+        msg = self._alloc_message(
+            MessageType.RESPONSE, request_msg.reply_to, response, request_msg.correlation_id
         )
         
         if self._message_queue:
-            try:
-                await self._message_queue.put(msg)
-            except asyncio.QueueFull:
-                pass
+            await self._message_queue.put(msg)
     
     def register_request_handler(self, topic: str, handler: MessageHandler) -> None:
         """Register a synchronous request handler."""
@@ -229,36 +337,104 @@ class MessageBus:
     
     async def send_direct(self, endpoint: str, message: Any) -> None:
         """Send a point-to-point message."""
-        msg = Message(
-            id=uuid4_new(),
-            type=MessageType.POINT_TO_POINT,
-            topic=endpoint,
-            payload=message
-        )
+        msg = self._alloc_message(MessageType.POINT_TO_POINT, endpoint, message)
         
         if self._message_queue:
-            try:
-                await self._message_queue.put(msg)
-            except asyncio.QueueFull:
-                pass
+            await self._message_queue.put(msg)
+    
+    def _alloc_message(
+        self,
+        type: MessageType,
+        topic: str,
+        payload: Any,
+        correlation_id: Optional[str] = None,
+        reply_to: Optional[str] = None,
+    ) -> Message:
+        """Build a message, reusing a dispatched one from the free list."""
+        free = self._free_messages
+        msg = free.pop() if free else _new(Message)
+        msg.id = uuid4_new()
+        msg.type = type
+        msg.topic = topic
+        msg.payload = payload
+        msg.correlation_id = correlation_id
+        msg.reply_to = reply_to
+        msg.timestamp = time.time()
+        return msg
+    
+    def _recycle_messages(self, batch: List[Message]) -> None:
+        """Return dispatched messages to the free list, dropping payload refs."""
+        for msg in batch:
+            msg.payload = None
+        self._free_messages.extend(batch)
     
     async def _message_worker(self) -> None:
-        """Background worker to process messages."""
+        """Background worker to process messages in batches."""
+        queue = self._message_queue
         while self._running:
             try:
-                # Use timeout to allow checking _running periodically
-                message = await asyncio.wait_for(
-                    self._message_queue.get(), timeout=0.1
-                )
-                await self._process_message(message)
-            except asyncio.TimeoutError:
-                continue
+                # stop() cancels this task, so no polling timeout is needed
+                batch = [await queue.get()]
+                while len(batch) < MESSAGE_BATCH_SIZE and not queue.empty():
+                    batch.append(queue.get_nowait())
+                await self._dispatch_batch(batch)
+                self._recycle_messages(batch)
             except asyncio.CancelledError:
                 break
             except Exception:
                 # Log error in production
                 continue
     
+    async def _dispatch_batch(self, batch: List[Message]) -> None:
+        """
+        Dispatch a batch of messages.
+        
+        Sync handlers run in message order and the async handlers of every
+        published message share one ``gather`` (see ``_await_handlers``). Requests and responses go
+        through ``_process_message`` in order.
+        """
+        publish_types = (MessageType.PUBLISH, MessageType.POINT_TO_POINT)
+        subscribers = self._subscribers
+        async_subscribers = self._async_subscribers
+        
+        tasks = []
+        for message in batch:
+            if message.type not in publish_types:
+                await self._process_message(message)
+                continue
+            
+            topic = message.topic
+            sync_handlers = subscribers.get(topic, ())
+            async_handlers = async_subscribers.get(topic, ())
+            payload = message.payload
+            for handler in sync_handlers:
+                try:
+                    handler(payload)
+                except Exception:
+                    # Log error in production
+                    pass
+            for handler in async_handlers:
+                try:
+                    tasks.append(asyncio.create_task(handler(payload)))
+                except Exception:
+                    # Log error in production
+                    pass
+        
+        if tasks:
+            await self._await_handlers(tasks)
+    
+    async def _await_handlers(self, tasks: List[asyncio.Task]) -> None:
+        """Wait for async handler tasks, under a timeout only if configured."""
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        if self._async_handler_timeout is None:
+            await gathered
+            return
+        try:
+            await asyncio.wait_for(gathered, timeout=self._async_handler_timeout)
+        except asyncio.TimeoutError:
+            # Log warning in production
+            pass
+    
     async def _process_message(self, message: Message) -> None:
         """Process a single message."""
         try:
@@ -276,10 +452,9 @@ class MessageBus:
     
     async def _handle_publish(self, message: Message) -> None:
         """Handle publish message."""
-        # Sync handlers
-        with self._lock:
-            sync_handlers = self._subscribers.get(message.topic, []).copy()
-            async_handlers = self._async_subscribers.get(message.topic, []).copy()
+        # Handler tuples are immutable snapshots, so no lock or copy is needed
+        sync_handlers = self._subscribers.get(message.topic, ())
+        async_handlers = self._async_subscribers.get(message.topic, ())
         
         # Execute sync handlers
         for handler in sync_handlers:
@@ -299,13 +474,8 @@ class MessageBus:
                 # Log error in production
                 pass
         
-        # Wait for async handlers (with timeout to prevent blocking)
         if tasks:
-            try:
-                await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=1.0)
-            except asyncio.TimeoutError:
-                # Log warning in production
-                pass
+            await self._await_handlers(tasks)
     
     async def _handle_request(self, message: Message) -> None:
         """Handle request message."""
@@ -350,12 +520,15 @@ class MessageBus:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get message bus statistics."""
+        # Snapshot the subscriber dicts, which are written under shard locks
+        sync_subscribers = list(self._subscribers.values())
+        async_subscribers = list(self._async_subscribers.values())
         with self._lock:
             return {
                 "running": self._running,
-                "total_topics": len(self._subscribers) + len(self._async_subscribers),
-                "sync_subscribers": sum(len(handlers) for handlers in self._subscribers.values()),
-                "async_subscribers": sum(len(handlers) for handlers in self._async_subscribers.values()),
+                "total_topics": len(sync_subscribers) + len(async_subscribers),
+                "sync_subscribers": sum(len(handlers) for handlers in sync_subscribers),
+                "async_subscribers": sum(len(handlers) for handlers in async_subscribers),
                 "request_handlers": len(self._request_handlers) + len(self._async_request_handlers),
                 "pending_requests": len(self._pending_requests),
                 "queue_size": self._message_queue.qsize() if self._message_queue else 0
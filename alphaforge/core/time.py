@@ -5,21 +5,39 @@ This is the Python fallback when Rust extensions are not available.
 """
 
 import time
-from datetime import datetime, timezone
-from typing import Union
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Union
+
+import numpy as np
+
+
+_new = object.__new__
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 class UnixNanos:
     """Unix timestamp in nanoseconds."""
     
+    __slots__ = ("value",)
+    
     def __init__(self, value: int):
         """Create from nanoseconds since Unix epoch."""
         self.value = value
     
+    @classmethod
+    def _raw(cls, value: int) -> "UnixNanos":
+        """Create without going through ``__init__`` (hot-path arithmetic)."""
+        obj = _new(cls)
+        obj.value = value
+        return obj
+    
     @classmethod
     def now(cls) -> "UnixNanos":
         """Get current time in nanoseconds."""
-        return cls(int(time.time_ns()))
+        obj = _new(cls)
+        obj.value = time.time_ns()
+        return obj
     
     @classmethod
     def from_millis(cls, millis: int) -> "UnixNanos":
@@ -44,8 +62,8 @@ class UnixNanos:
         return cls(int(dt.timestamp() * 1_000_000_000))
     
     def to_datetime(self) -> datetime:
-        """Convert to datetime object."""
-        return datetime.fromtimestamp(self.value / 1_000_000_000, tz=timezone.utc)
+        """Convert to datetime object (truncated to microseconds)."""
+        return _EPOCH + timedelta(0, 0, self.value // 1_000)
     
     def to_millis(self) -> int:
         """Convert to milliseconds."""
@@ -65,64 +83,112 @@ class UnixNanos:
     def __repr__(self) -> str:
         return f"UnixNanos({self.value})"
     
+    # Comparisons accept another UnixNanos or a raw nanosecond int
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, UnixNanos):
-            return False
-        return self.value == other.value
-    
-    def __lt__(self, other: "UnixNanos") -> bool:
-        return self.value < other.value
-    
-    def __le__(self, other: "UnixNanos") -> bool:
-        return self.value <= other.value
-    
-    def __gt__(self, other: "UnixNanos") -> bool:
-        return self.value > other.value
-    
-    def __ge__(self, other: "UnixNanos") -> bool:
-        return self.value >= other.value
+        # Exact class check skips the isinstance MRO walk
+        return self.value == (other.value if other.__class__ is UnixNanos else other)
+    
+    def __lt__(self, other: Union["UnixNanos", int]) -> bool:
+        try:
+            return self.value < other.value
+        except AttributeError:
+            return self.value < other
+    
+    def __le__(self, other: Union["UnixNanos", int]) -> bool:
+        try:
+            return self.value <= other.value
+        except AttributeError:
+            return self.value <= other
+    
+    def __gt__(self, other: Union["UnixNanos", int]) -> bool:
+        try:
+            return self.value > other.value
+        except AttributeError:
+            return self.value > other
+    
+    def __ge__(self, other: Union["UnixNanos", int]) -> bool:
+        try:
+            return self.value >= other.value
+        except AttributeError:
+            return self.value >= other
     
     def __add__(self, other: int) -> "UnixNanos":
         """Add nanoseconds."""
-        return UnixNanos(self.value + other)
+        obj = _new(UnixNanos)
+        obj.value = self.value + other
+        return obj
     
     def __sub__(self, other: Union["UnixNanos", int]) -> Union["UnixNanos", int]:
         """Subtract nanoseconds or another UnixNanos."""
         if isinstance(other, UnixNanos):
             return self.value - other.value
-        return UnixNanos(self.value - other)
+        obj = _new(UnixNanos)
+        obj.value = self.value - other
+        return obj
     
     def __hash__(self) -> int:
         return hash(self.value)
 
 
+# Vectorized conversions for batches of int64 nanosecond timestamps
+def to_nanos_array(stamps: Iterable[UnixNanos]) -> np.ndarray:
+    """Collect UnixNanos values into an int64 nanosecond array."""
+    return np.fromiter((stamp.value for stamp in stamps), dtype=np.int64)
+
+
+def to_millis_array(nanos: np.ndarray) -> np.ndarray:
+    """Convert nanoseconds to milliseconds (floor, like ``to_millis``)."""
+    return np.asarray(nanos, dtype=np.int64) // np.int64(1_000_000)
+
+
+def to_micros_array(nanos: np.ndarray) -> np.ndarray:
+    """Convert nanoseconds to microseconds (floor, like ``to_micros``)."""
+    return np.asarray(nanos, dtype=np.int64) // np.int64(1_000)
+
+
+def to_seconds_array(nanos: np.ndarray) -> np.ndarray:
+    """Convert nanoseconds to float64 seconds."""
+    return np.asarray(nanos, dtype=np.int64) / 1_000_000_000
+
+
+# Prefer the Rust UnixNanos when the compiled extension is available; the
+# class above is the fallback and is unused otherwise
+try:
+    import alphaforge_pyo3.alphaforge_pyo3 as _rust_ext
+    UnixNanos = _rust_ext.time.UnixNanos
+except (ImportError, AttributeError):
+    pass
+
+
 # Atomic time for shared state (simplified Python version)
 class AtomicTime:
-    """Atomic timestamp for thread-safe access."""
+    """
+    Atomic timestamp for thread-safe access.
+    
+    The time is held as a plain int; rebinding one attribute is atomic under
+    the GIL, so reads and writes need no lock.
+    """
+    
+    __slots__ = ("_ns",)
     
     def __init__(self, initial_time: UnixNanos = None):
         """Initialize with optional time."""
-        import threading
-        self._lock = threading.Lock()
-        self._time = initial_time or UnixNanos.now()
+        self._ns = time.time_ns() if initial_time is None else initial_time.value
     
     def get(self) -> UnixNanos:
         """Get current atomic time."""
-        with self._lock:
-            return UnixNanos(self._time.value)
+        return UnixNanos._raw(self._ns)
     
     def set(self, time_ns: UnixNanos) -> None:
         """Set atomic time."""
-        with self._lock:
-            self._time = time_ns
+        self._ns = time_ns.value
     
     def update_to_now(self) -> None:
         """Update to current system time."""
-        with self._lock:
-            self._time = UnixNanos.now()
+        self._ns = time.time_ns()
     
     def __str__(self) -> str:
-        return str(self.get().value)
+        return str(self._ns)
     
     def __repr__(self) -> str:
-        return f"AtomicTime({self.get().value})"
+        return f"AtomicTime({self._ns})"
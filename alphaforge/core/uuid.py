@@ -3,23 +3,93 @@
 UUID generation utilities for AlphaForge trading system.
 """
 
-import uuid
+import os
+import re
+from threading import Lock
+from typing import List
 
 
-def uuid4_new() -> str:
-    """Generate a new UUID4 string."""
-    return str(uuid.uuid4())
+# Random bytes fetched per os.urandom call (4096 UUIDs)
+_POOL_SIZE = 65536
+
+# Stamp the UUID4 version nibble and RFC 4122 variant bits
+_VERSION_TABLE = bytes((b & 0x0F) | 0x40 for b in range(256))
+_VARIANT_TABLE = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+# Canonical lowercase UUID4: version nibble 4, variant bits 10xx
+_UUID4_MATCH = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z"
+).match
+
+_pool = b""
+_pool_offset = _POOL_SIZE
+_pool_lock = Lock()
+
+
+def _refill_pool() -> None:
+    """Replace the pool with fresh random bytes laid out as UUID4s."""
+    global _pool, _pool_offset
+    pool = bytearray(os.urandom(_POOL_SIZE))
+    pool[6::16] = pool[6::16].translate(_VERSION_TABLE)
+    pool[8::16] = pool[8::16].translate(_VARIANT_TABLE)
+    _pool = bytes(pool)
+    _pool_offset = 0
+
+
+def _reset_pool() -> None:
+    """Discard pooled bytes so a forked child never reuses its parent's."""
+    global _pool, _pool_offset, _pool_lock
+    _pool = b""
+    _pool_offset = _POOL_SIZE
+    _pool_lock = Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
 
 
 def uuid4_bytes() -> bytes:
     """Generate a new UUID4 as bytes."""
-    return uuid.uuid4().bytes
+    global _pool_offset
+    with _pool_lock:
+        offset = _pool_offset
+        if offset >= _POOL_SIZE:
+            _refill_pool()
+            offset = 0
+        _pool_offset = offset + 16
+        return _pool[offset:offset + 16]
+
+
+def uuid4_new() -> str:
+    """Generate a new UUID4 string."""
+    h = uuid4_bytes().hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+def uuid4_new_batch(n: int) -> List[str]:
+    """Generate ``n`` UUID4 strings, taking the pool lock once."""
+    global _pool_offset
+    chunks = []
+    remaining = n * 16
+    with _pool_lock:
+        while remaining > 0:
+            if _pool_offset >= _POOL_SIZE:
+                _refill_pool()
+            offset = _pool_offset
+            take = min(remaining, _POOL_SIZE - offset)
+            chunks.append(_pool[offset:offset + take])
+            _pool_offset = offset + take
+            remaining -= take
+    h = b"".join(chunks).hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, n * 32, 32)
+    ]
 
 
 def is_valid_uuid4(uuid_str: str) -> bool:
     """Check if string is a valid UUID4."""
     try:
-        uuid_obj = uuid.UUID(uuid_str, version=4)
-        return str(uuid_obj) == uuid_str
-    except (ValueError, TypeError):
+        return _UUID4_MATCH(uuid_str) is not None
+    except TypeError:
         return False
@@ -40,7 +40,7 @@ from alphaforge.model.orders import (
 from alphaforge.model.events import (
     OrderEvent,
     TradeEvent,
-    DataEvent,
+    MarketDataEvent,
 )
 
 # Import Rust components when available  
@@ -53,8 +53,9 @@ try:
     RUST_MODEL_AVAILABLE = True
 except ImportError:
     RUST_MODEL_AVAILABLE = False
-    # Use Python fallback implementations
-    from alphaforge.model.fallback import Price, Quantity, OrderBook
+    # Use Python fallback implementations (the order book is Rust-only)
+    from alphaforge.model.data import Price, Quantity
+    OrderBook = None
 
 __all__ = [
     # Identifiers
@@ -90,7 +91,7 @@ __all__ = [
     # Events
     "OrderEvent",
     "TradeEvent",
-    "DataEvent",
+    "MarketDataEvent",
     
     # High-performance types (Rust or fallback)
     "Price",
@@ -3,22 +3,130 @@
 Core data types for AlphaForge trading system.
 """
 
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
-from alphaforge.model.identifiers import InstrumentId, TradeId
-from alphaforge.model.enums import AggressorSide, OrderBookAction, BarAggregation
-from alphaforge.core.time import UnixNanos
+import os
+import time
+from typing import Optional, Dict, Any, List, Sequence, ClassVar, NamedTuple
+from dataclasses import dataclass, field, fields, MISSING
+from types import MemberDescriptorType
 
+import numpy as np
 
-# Try importing the Rust extensions first, fallback to Python implementations
+from alphaforge.model.identifiers import InstrumentId, TradeId
+from alphaforge.model.enums import (
+    AggressorSide, OrderBookAction, BarAggregation, AGGRESSOR_SIDES
+)
+from alphaforge.core.compat import _SLOTS
+from alphaforge.core.time import UnixNanos
+from alphaforge.model.wire import Buffer, decode_trades, decode_quotes
+
+_new = object.__new__
+
+# Released order book objects kept for reuse, per pooled class
+BOOK_POOL_SIZE = 65536
+
+
+class _BookObjectPool:
+    """
+    Bounded free list of released instances of one order book class.
+
+    Feed handlers ``acquire()`` objects at the full update rate and
+    ``release()`` them once consumers are done, so steady-state replay
+    allocates nothing. A released object must not be used again.
+    """
+
+    __slots__ = ("_cls", "_free", "_max_size")
+
+    def __init__(self, cls: type, max_size: int = BOOK_POOL_SIZE):
+        self._cls = cls
+        self._free: List[Any] = []
+        self._max_size = max_size
+
+    def get(self) -> Any:
+        """Pop a released instance, or allocate an uninitialised one."""
+        try:
+            return self._free.pop()
+        except IndexError:
+            return _new(self._cls)
+
+    def put(self, obj: Any) -> None:
+        """Return an instance for reuse; dropped once the pool is full."""
+        if len(self._free) < self._max_size:
+            self._free.append(obj)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+
+class _DefaultFactory:
+    """Placeholder default for fields built by a default_factory."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<factory>"
+
+
+_DEFAULT_FACTORY = _DefaultFactory()
+
+
+def _fast_frozen_init(cls: type) -> type:
+    """
+    Replace a frozen, slotted dataclass's ``__init__`` with one that writes
+    each slot through its pre-bound descriptor setter.
+
+    The generated frozen ``__init__`` goes through ``object.__setattr__``
+    per field; calling ``member_descriptor.__set__`` bound once per class
+    skips the attribute lookup and the frozen check. Classes without slots
+    (Python < 3.10) keep the dataclass ``__init__``.
+    """
+    if not _SLOTS:
+        return cls
+    namespace: Dict[str, Any] = {"_FACTORY": _DEFAULT_FACTORY}
+    params: List[str] = []
+    kw_params: List[str] = []
+    body: List[str] = []
+    for f in fields(cls):
+        name = f.name
+        descriptor = getattr(cls, name, None)
+        if not f.init or not isinstance(descriptor, MemberDescriptorType):
+            return cls
+        namespace[f"_set_{name}"] = descriptor.__set__
+        if f.default is not MISSING:
+            namespace[f"_default_{name}"] = f.default
+            param = f"{name}=_default_{name}"
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            param = f"{name}=_FACTORY"
+            body.append(f"    if {name} is _FACTORY: {name} = _factory_{name}()")
+        else:
+            param = name
+        (kw_params if getattr(f, "kw_only", False) else params).append(param)
+        body.append(f"    _set_{name}(self, {name})")
+    if hasattr(cls, "__post_init__"):
+        body.append("    self.__post_init__()")
+    if kw_params:
+        params += ["*"] + kw_params
+    source = f"def __init__(self, {', '.join(params)}):\n" + "\n".join(body)
+    exec(source, namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    init.__doc__ = cls.__init__.__doc__
+    cls.__init__ = init
+    return cls
+
+
+# Try importing the Rust extensions first, fallback to Python implementations.
+# Set ALPHAFORGE_REQUIRE_RUST=1 in production builds to fail fast instead of
+# silently using the slow fallback.
 try:
     from alphaforge_pyo3 import Price, Quantity  # type: ignore
 except ImportError:
+    if os.environ.get("ALPHAFORGE_REQUIRE_RUST") == "1":
+        raise
     # Python fallback implementations - will be defined at end of file
-    pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Quote:
     """Quote data with bid/ask prices and sizes."""
     instrument_id: InstrumentId
@@ -30,7 +138,7 @@ class Quote:
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Trade:
     """Trade tick data."""
     instrument_id: InstrumentId
@@ -42,7 +150,7 @@ class Trade:
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderBookData:
     """Order book update data."""
     instrument_id: InstrumentId
@@ -54,16 +162,43 @@ class OrderBookData:
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
 
-@dataclass(frozen=True)
+@dataclass(**_SLOTS)
 class BookOrder:
-    """Order book level entry."""
+    """Order book level entry (mutable so it can be pooled)."""
     side: int  # 1=bid, 2=ask
     price: "Price"
     size: "Quantity"
     order_id: int = 0
 
+    _pool: ClassVar[_BookObjectPool]
+
+    @classmethod
+    def acquire(
+        cls, side: int, price: "Price", size: "Quantity", order_id: int = 0
+    ) -> "BookOrder":
+        """Get a pooled book order initialised with these fields."""
+        order = cls._pool.get()
+        order.reset(side, price, size, order_id)
+        return order
+
+    def reset(
+        self, side: int, price: "Price", size: "Quantity", order_id: int = 0
+    ) -> None:
+        """Reinitialise every field, mirroring ``__init__``."""
+        self.side = side
+        self.price = price
+        self.size = size
+        self.order_id = order_id
+
+    def release(self) -> None:
+        """Return this order to the pool; it must not be used afterwards."""
+        self._pool.put(self)
 
-@dataclass(frozen=True)
+
+BookOrder._pool = _BookObjectPool(BookOrder)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class OrderBookSnapshot:
     """Full order book snapshot."""
     instrument_id: InstrumentId
@@ -73,7 +208,8 @@ class OrderBookSnapshot:
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
 
-@dataclass(frozen=True)
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class Bar:
     """OHLCV bar data."""
     open: "Price"
@@ -84,8 +220,121 @@ class Bar:
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
-
-@dataclass(frozen=True)
+    @classmethod
+    def to_arrays(cls, bars: Sequence["Bar"]) -> Dict[str, np.ndarray]:
+        """Extract raw int64 columns from a list of bars."""
+        opens, highs, lows, closes, volumes, ts, ti = [], [], [], [], [], [], []
+        for b in bars:
+            opens.append(b.open.value)
+            highs.append(b.high.value)
+            lows.append(b.low.value)
+            closes.append(b.close.value)
+            volumes.append(b.volume.value)
+            ts.append(b.ts_event.value)
+            ti.append(b.ts_init.value)
+        return {
+            "open_raw": np.array(opens, dtype=np.int64),
+            "high_raw": np.array(highs, dtype=np.int64),
+            "low_raw": np.array(lows, dtype=np.int64),
+            "close_raw": np.array(closes, dtype=np.int64),
+            "volume_raw": np.array(volumes, dtype=np.int64),
+            "ts_event": np.array(ts, dtype=np.int64),
+            "ts_init": np.array(ti, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Dict[str, np.ndarray],
+        price_precision: int = 5,
+        size_precision: int = 0,
+    ) -> List["Bar"]:
+        """Build bars back from columns produced by ``to_arrays``."""
+        raw = UnixNanos._raw
+        return [
+            cls(
+                Price(open_, price_precision),
+                Price(high, price_precision),
+                Price(low, price_precision),
+                Price(close, price_precision),
+                Quantity(volume, size_precision),
+                raw(ts),
+                raw(ti),
+            )
+            for open_, high, low, close, volume, ts, ti in zip(
+                arrays["open_raw"].tolist(),
+                arrays["high_raw"].tolist(),
+                arrays["low_raw"].tolist(),
+                arrays["close_raw"].tolist(),
+                arrays["volume_raw"].tolist(),
+                arrays["ts_event"].tolist(),
+                arrays["ts_init"].tolist(),
+            )
+        ]
+
+    @staticmethod
+    def aggregate_ticks(
+        prices: np.ndarray,
+        sizes: np.ndarray,
+        ts: np.ndarray,
+        boundaries: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Aggregate raw tick columns into OHLCV columns, one row per window.
+
+        ``ts`` must be sorted ascending. Window ``i`` holds the ticks with
+        ``boundaries[i] <= ts < boundaries[i + 1]`` and is stamped with its
+        closing boundary; windows without ticks produce no row.
+        """
+        if len(boundaries) < 2:
+            # Fewer than two boundaries bound no window
+            return {
+                "open_raw": prices[:0],
+                "high_raw": prices[:0],
+                "low_raw": prices[:0],
+                "close_raw": prices[:0],
+                "volume_raw": sizes[:0],
+                "ts_event": np.asarray(boundaries, dtype=np.int64)[:0],
+            }
+        edges = np.searchsorted(ts, boundaries, side="left")
+        starts = edges[:-1]
+        filled = edges[1:] > starts
+        starts = starts[filled]
+        ends = edges[1:][filled]
+        # Each reduceat segment runs to the next start, so cut off the ticks
+        # past the last boundary; empty windows in between hold no ticks
+        prices = prices[:edges[-1]]
+        sizes = sizes[:edges[-1]]
+        return {
+            "open_raw": prices[starts],
+            "high_raw": np.maximum.reduceat(prices, starts),
+            "low_raw": np.minimum.reduceat(prices, starts),
+            "close_raw": prices[ends - 1],
+            "volume_raw": np.add.reduceat(sizes, starts),
+            "ts_event": boundaries[1:][filled].astype(np.int64, copy=False),
+        }
+
+    @classmethod
+    def from_ticks_batch(
+        cls,
+        ticks: Sequence["TradeTick"],
+        boundaries: np.ndarray,
+        price_precision: int = 5,
+        size_precision: int = 0,
+    ) -> List["Bar"]:
+        """Build bars from time-ordered trade ticks over the given windows."""
+        columns = TradeTick.to_arrays(ticks)
+        bars = cls.aggregate_ticks(
+            columns["price_raw"],
+            columns["size_raw"],
+            columns["ts_event"],
+            np.asarray(boundaries, dtype=np.int64),
+        )
+        bars["ts_init"] = bars["ts_event"]
+        return cls.from_arrays(bars, price_precision, size_precision)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Instrument:
     """Base instrument definition."""
     id: InstrumentId
@@ -113,7 +362,7 @@ class Instrument:
     info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Currency:
     """Currency definition."""
     code: str
@@ -123,7 +372,7 @@ class Currency:
     currency_type: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Account:
     """Trading account information."""
     account_id: str
@@ -134,7 +383,7 @@ class Account:
     info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccountBalance:
     """Account balance for a specific currency."""
     total: "Quantity"
@@ -142,7 +391,7 @@ class AccountBalance:
     free: "Quantity"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MarginBalance:
     """Margin account balance information."""
     initial: "Quantity"
@@ -150,7 +399,7 @@ class MarginBalance:
     instrument_id: Optional[InstrumentId] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Tick:
     """Generic price tick."""
     instrument_id: InstrumentId
@@ -158,7 +407,10 @@ class Tick:
     size: "Quantity"
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-@dataclass(frozen=True)
+
+
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class TradeTick:
     """Trade execution tick."""
     instrument_id: InstrumentId
@@ -169,8 +421,133 @@ class TradeTick:
     trade_id: TradeId
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
-
-@dataclass(frozen=True)
+    @classmethod
+    def from_raw(
+        cls,
+        instrument_id: InstrumentId,
+        price_raw: int,
+        price_precision: int,
+        size_raw: int,
+        size_precision: int,
+        aggressor_side: int,
+        trade_id: TradeId,
+        ts_event: int,
+        ts_init: int,
+    ) -> "TradeTick":
+        """
+        Create from raw integers on the feed decode path.
+
+        Pass one ``ts_init`` (e.g. ``time.time_ns()``) for a whole decoded
+        batch rather than reading the clock per tick through the default.
+        """
+        raw = UnixNanos._raw
+        return cls(
+            instrument_id,
+            Price(price_raw, price_precision),
+            Quantity(size_raw, size_precision),
+            raw(ts_event),
+            AGGRESSOR_SIDES[aggressor_side],
+            trade_id,
+            raw(ts_init),
+        )
+
+    @staticmethod
+    def view_wire(buf: Buffer) -> np.ndarray:
+        """View a buffer of ``TRADE_WIRE_DTYPE`` records without copying."""
+        return decode_trades(buf)
+
+    @classmethod
+    def from_wire(
+        cls,
+        buf: Buffer,
+        instrument_id: InstrumentId,
+        trade_ids: Sequence[TradeId],
+        price_precision: int = 5,
+        size_precision: int = 0,
+        ts_init: Optional[int] = None,
+    ) -> List["TradeTick"]:
+        """Materialise trade ticks from a wire buffer, sharing one ``ts_init``."""
+        records = decode_trades(buf)
+        init = UnixNanos._raw(time.time_ns() if ts_init is None else ts_init)
+        raw = UnixNanos._raw
+        sides = AGGRESSOR_SIDES
+        return [
+            cls(
+                instrument_id,
+                Price(px, price_precision),
+                Quantity(sz, size_precision),
+                raw(ts),
+                sides[side],
+                trade_id,
+                init,
+            )
+            for ts, px, sz, side, trade_id in zip(
+                records["ts_event"].tolist(),
+                records["price_raw"].tolist(),
+                records["size_raw"].tolist(),
+                records["aggressor"].tolist(),
+                trade_ids,
+            )
+        ]
+
+    @classmethod
+    def to_arrays(cls, ticks: Sequence["TradeTick"]) -> Dict[str, np.ndarray]:
+        """
+        Extract raw int64 columns from a list of trade ticks.
+
+        Prices and sizes stay in their fixed-point representation; scale once
+        with ``arrays["price_raw"] / 10 ** precision`` when floats are needed.
+        """
+        px, sz, side, ts, ti = [], [], [], [], []
+        for t in ticks:
+            px.append(t.price.value)
+            sz.append(t.size.value)
+            side.append(t.aggressor_side)
+            ts.append(t.ts_event.value)
+            ti.append(t.ts_init.value)
+        return {
+            "price_raw": np.array(px, dtype=np.int64),
+            "size_raw": np.array(sz, dtype=np.int64),
+            "aggressor_side": np.array(side, dtype=np.int64),
+            "ts_event": np.array(ts, dtype=np.int64),
+            "ts_init": np.array(ti, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Dict[str, np.ndarray],
+        instrument_id: InstrumentId,
+        trade_ids: Sequence[str],
+        price_precision: int = 5,
+        size_precision: int = 0,
+    ) -> List["TradeTick"]:
+        """Build trade ticks back from columns produced by ``to_arrays``."""
+        raw = UnixNanos._raw
+        sides = AGGRESSOR_SIDES
+        return [
+            cls(
+                instrument_id,
+                Price(px, price_precision),
+                Quantity(sz, size_precision),
+                raw(ts),
+                sides[side],
+                TradeId(trade_id),
+                raw(ti),
+            )
+            for px, sz, side, ts, ti, trade_id in zip(
+                arrays["price_raw"].tolist(),
+                arrays["size_raw"].tolist(),
+                arrays["aggressor_side"].tolist(),
+                arrays["ts_event"].tolist(),
+                arrays["ts_init"].tolist(),
+                trade_ids,
+            )
+        ]
+
+
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class QuoteTick:
     """Best bid/ask quote tick."""
     instrument_id: InstrumentId
@@ -181,18 +558,134 @@ class QuoteTick:
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
-
-@dataclass(frozen=True)
-class OrderBookLevel:
-    """Order book price level."""
+    @classmethod
+    def from_raw(
+        cls,
+        instrument_id: InstrumentId,
+        bid_price_raw: int,
+        ask_price_raw: int,
+        price_precision: int,
+        bid_size_raw: int,
+        ask_size_raw: int,
+        size_precision: int,
+        ts_event: int,
+        ts_init: int,
+    ) -> "QuoteTick":
+        """
+        Create from raw integers on the feed decode path.
+
+        Pass one ``ts_init`` for a whole decoded batch rather than reading
+        the clock per quote through the default.
+        """
+        raw = UnixNanos._raw
+        return cls(
+            instrument_id,
+            Price(bid_price_raw, price_precision),
+            Price(ask_price_raw, price_precision),
+            Quantity(bid_size_raw, size_precision),
+            Quantity(ask_size_raw, size_precision),
+            raw(ts_event),
+            raw(ts_init),
+        )
+
+    @staticmethod
+    def view_wire(buf: Buffer) -> np.ndarray:
+        """View a buffer of ``QUOTE_WIRE_DTYPE`` records without copying."""
+        return decode_quotes(buf)
+
+    @classmethod
+    def from_wire(
+        cls,
+        buf: Buffer,
+        instrument_id: InstrumentId,
+        price_precision: int = 5,
+        size_precision: int = 0,
+        ts_init: Optional[int] = None,
+    ) -> List["QuoteTick"]:
+        """Materialise quote ticks from a wire buffer, sharing one ``ts_init``."""
+        records = decode_quotes(buf)
+        init = UnixNanos._raw(time.time_ns() if ts_init is None else ts_init)
+        raw = UnixNanos._raw
+        return [
+            cls(
+                instrument_id,
+                Price(bp, price_precision),
+                Price(ap, price_precision),
+                Quantity(bs, size_precision),
+                Quantity(as_, size_precision),
+                raw(ts),
+                init,
+            )
+            for ts, bp, ap, bs, as_ in zip(
+                records["ts_event"].tolist(),
+                records["bid_price_raw"].tolist(),
+                records["ask_price_raw"].tolist(),
+                records["bid_size_raw"].tolist(),
+                records["ask_size_raw"].tolist(),
+            )
+        ]
+
+    @classmethod
+    def to_arrays(cls, ticks: Sequence["QuoteTick"]) -> Dict[str, np.ndarray]:
+        """Extract raw int64 columns from a list of quote ticks."""
+        bp, ap, bs, as_, ts, ti = [], [], [], [], [], []
+        for q in ticks:
+            bp.append(q.bid_price.value)
+            ap.append(q.ask_price.value)
+            bs.append(q.bid_size.value)
+            as_.append(q.ask_size.value)
+            ts.append(q.ts_event.value)
+            ti.append(q.ts_init.value)
+        return {
+            "bid_price_raw": np.array(bp, dtype=np.int64),
+            "ask_price_raw": np.array(ap, dtype=np.int64),
+            "bid_size_raw": np.array(bs, dtype=np.int64),
+            "ask_size_raw": np.array(as_, dtype=np.int64),
+            "ts_event": np.array(ts, dtype=np.int64),
+            "ts_init": np.array(ti, dtype=np.int64),
+        }
+
+    @classmethod
+    def from_arrays(
+        cls,
+        arrays: Dict[str, np.ndarray],
+        instrument_id: InstrumentId,
+        price_precision: int = 5,
+        size_precision: int = 0,
+    ) -> List["QuoteTick"]:
+        """Build quote ticks back from columns produced by ``to_arrays``."""
+        raw = UnixNanos._raw
+        return [
+            cls(
+                instrument_id,
+                Price(bp, price_precision),
+                Price(ap, price_precision),
+                Quantity(bs, size_precision),
+                Quantity(as_, size_precision),
+                raw(ts),
+                raw(ti),
+            )
+            for bp, ap, bs, as_, ts, ti in zip(
+                arrays["bid_price_raw"].tolist(),
+                arrays["ask_price_raw"].tolist(),
+                arrays["bid_size_raw"].tolist(),
+                arrays["ask_size_raw"].tolist(),
+                arrays["ts_event"].tolist(),
+                arrays["ts_init"].tolist(),
+            )
+        ]
+
+
+class OrderBookLevel(NamedTuple):
+    """Order book price level (a tuple, so construction stays in C)."""
     price: "Price"
     size: "Quantity"
     count: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(**_SLOTS)
 class OrderBookDelta:
-    """Order book incremental update."""
+    """Order book incremental update (mutable so it can be pooled)."""
     instrument_id: InstrumentId
     action: OrderBookAction
     side: int
@@ -200,8 +693,54 @@ class OrderBookDelta:
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
 
-
-@dataclass(frozen=True)
+    _pool: ClassVar[_BookObjectPool]
+
+    @classmethod
+    def acquire(
+        cls,
+        instrument_id: InstrumentId,
+        action: OrderBookAction,
+        side: int,
+        level: OrderBookLevel,
+        ts_event: UnixNanos,
+        ts_init: Optional[UnixNanos] = None,
+    ) -> "OrderBookDelta":
+        """Get a pooled delta initialised with these fields."""
+        delta = cls._pool.get()
+        delta.instrument_id = instrument_id
+        delta.action = action
+        delta.side = side
+        delta.level = level
+        delta.ts_event = ts_event
+        delta.ts_init = UnixNanos.now() if ts_init is None else ts_init
+        return delta
+
+    def reset(
+        self,
+        instrument_id: InstrumentId,
+        action: OrderBookAction,
+        side: int,
+        level: OrderBookLevel,
+        ts_event: UnixNanos,
+        ts_init: Optional[UnixNanos] = None,
+    ) -> None:
+        """Reinitialise every field, mirroring ``__init__``."""
+        self.instrument_id = instrument_id
+        self.action = action
+        self.side = side
+        self.level = level
+        self.ts_event = ts_event
+        self.ts_init = UnixNanos.now() if ts_init is None else ts_init
+
+    def release(self) -> None:
+        """Return this delta to the pool; it must not be used afterwards."""
+        self._pool.put(self)
+
+
+OrderBookDelta._pool = _BookObjectPool(OrderBookDelta)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class Venue:
     """Trading venue information."""
     name: str
@@ -217,8 +756,39 @@ class Venue:
 
 
 # Python fallback implementations if Rust extensions not available
+
+# Powers of ten for every supported precision, so the per-tick conversions
+# index a tuple instead of evaluating ``10 ** precision`` each call.
+_POW10 = tuple(10 ** i for i in range(10))
+
+# Bound str.format per precision with the width baked in, so as_str does not
+# parse a runtime format spec; "{}" ignores the unused decimal part.
+_FIXED_FORMATS = ("{}".format,) + tuple(
+    f"{{}}.{{:0{p}d}}".format for p in range(1, 10)
+)
+
+
+def _parse_fixed(value_str: str, precision: int) -> int:
+    """Parse "123.45" into raw units at ``precision``, truncating extra digits."""
+    scale = _POW10[precision]
+    if '.' not in value_str:
+        return int(value_str) * scale
+    integer_part, decimal_part = value_str.split('.')
+    decimal_part = decimal_part.ljust(precision, '0')[:precision]
+    # Apply the sign to the whole value: "-0.5" has a zero integer part
+    raw_value = abs(int(integer_part)) * scale + int(decimal_part)
+    return -raw_value if integer_part.lstrip().startswith('-') else raw_value
+
+
+def _format_fixed(value: int, precision: int) -> str:
+    """Format raw units at ``precision``; the sign prefixes the whole number."""
+    integer_part, decimal_part = divmod(abs(value), _POW10[precision])
+    text = _FIXED_FORMATS[precision](integer_part, decimal_part)
+    return '-' + text if value < 0 else text
+
+
 if 'Price' not in globals():
-    @dataclass(frozen=True, order=True)
+    @dataclass(frozen=True, order=True, **_SLOTS)
     class Price:
         """Price with fixed precision arithmetic (Python fallback)."""
         value: int  # Internal representation in smallest units
@@ -232,16 +802,8 @@ if 'Price' not in globals():
         def from_str(cls, value_str: str, precision: int = 5) -> "Price":
             """Create price from string representation."""
             try:
-                # Handle decimal point
-                if '.' in value_str:
-                    integer_part, decimal_part = value_str.split('.')
-                    decimal_part = decimal_part.ljust(precision, '0')[:precision]
-                    raw_value = int(integer_part) * (10 ** precision) + int(decimal_part)
-                else:
-                    raw_value = int(value_str) * (10 ** precision)
-                
-                return cls(raw_value, precision)
-            except (ValueError, TypeError) as e:
+                return cls(_parse_fixed(value_str, precision), precision)
+            except (ValueError, TypeError, IndexError) as e:
                 raise ValueError(f"Invalid price format: {value_str}") from e
         
         @classmethod 
@@ -254,23 +816,20 @@ if 'Price' not in globals():
             """Create price from float."""
             if not isinstance(value, (int, float)):
                 raise TypeError("Value must be numeric")
-            raw_value = int(round(value * (10 ** precision)))
+            try:
+                scale = _POW10[precision]
+            except IndexError:
+                raise ValueError("Precision must be between 0 and 9") from None
+            raw_value = int(round(value * scale))
             return cls(raw_value, precision)
         
         def as_double(self) -> float:
             """Convert to float representation."""
-            return self.value / (10 ** self.precision)
+            return self.value / _POW10[self.precision]
         
         def as_str(self) -> str:
             """Convert to string representation."""
-            divisor = 10 ** self.precision
-            integer_part = self.value // divisor
-            decimal_part = abs(self.value) % divisor
-            
-            if self.precision == 0:
-                return str(integer_part)
-            else:
-                return f"{integer_part}.{decimal_part:0{self.precision}d}"
+            return _format_fixed(self.value, self.precision)
         
         def __str__(self) -> str:
             return self.as_str()
@@ -298,7 +857,7 @@ if 'Price' not in globals():
 
 
 if 'Quantity' not in globals():
-    @dataclass(frozen=True, order=True)
+    @dataclass(frozen=True, order=True, **_SLOTS)
     class Quantity:
         """Quantity with fixed precision arithmetic (Python fallback)."""
         value: int  # Internal representation in smallest units
@@ -312,15 +871,8 @@ if 'Quantity' not in globals():
         def from_str(cls, value_str: str, precision: int = 0) -> "Quantity":
             """Create quantity from string representation."""
             try:
-                if '.' in value_str:
-                    integer_part, decimal_part = value_str.split('.')
-                    decimal_part = decimal_part.ljust(precision, '0')[:precision]
-                    raw_value = int(integer_part) * (10 ** precision) + int(decimal_part)
-                else:
-                    raw_value = int(value_str) * (10 ** precision)
-                
-                return cls(raw_value, precision)
-            except (ValueError, TypeError) as e:
+                return cls(_parse_fixed(value_str, precision), precision)
+            except (ValueError, TypeError, IndexError) as e:
                 raise ValueError(f"Invalid quantity format: {value_str}") from e
         
         @classmethod
@@ -331,23 +883,20 @@ if 'Quantity' not in globals():
         @classmethod 
         def from_float(cls, value: float, precision: int = 0) -> "Quantity":
             """Create quantity from float."""
-            raw_value = int(round(value * (10 ** precision)))
+            try:
+                scale = _POW10[precision]
+            except IndexError:
+                raise ValueError("Precision must be between 0 and 9") from None
+            raw_value = int(round(value * scale))
             return cls(raw_value, precision)
         
         def as_double(self) -> float:
             """Convert to float representation.""" 
-            return self.value / (10 ** self.precision)
+            return self.value / _POW10[self.precision]
         
         def as_str(self) -> str:
             """Convert to string representation."""
-            divisor = 10 ** self.precision
-            integer_part = self.value // divisor
-            decimal_part = abs(self.value) % divisor
-            
-            if self.precision == 0:
-                return str(integer_part)
-            else:
-                return f"{integer_part}.{decimal_part:0{self.precision}d}"
+            return _format_fixed(self.value, self.precision)
         
         def __str__(self) -> str:
             return self.as_str()
@@ -81,6 +81,14 @@ class OrderBookAction(IntEnum):
     CLEAR = 4
 
 
+# Plain int aliases for per-update comparisons in book/feed decode loops;
+# comparing against an IntEnum member goes through the enum machinery.
+BOOK_ACTION_ADD = 1
+BOOK_ACTION_UPDATE = 2
+BOOK_ACTION_DELETE = 3
+BOOK_ACTION_CLEAR = 4
+
+
 class MarketStatus(IntEnum):
     """Market status enumeration."""
     CLOSED = 0
@@ -178,6 +186,15 @@ class AggressorSide(IntEnum):
     SELLER = 2
 
 
+# Plain int aliases for per-trade comparisons in tick decode loops
+AGGRESSOR_NO_AGGRESSOR = 0
+AGGRESSOR_BUYER = 1
+AGGRESSOR_SELLER = 2
+
+# Members indexed by value; ``AGGRESSOR_SIDES[raw]`` avoids the EnumMeta call
+AGGRESSOR_SIDES = tuple(AggressorSide)
+
+
 class BookType(IntEnum):
     """Order book type enumeration."""
     L1_TBBO = 1  # Top of Book Best Bid/Offer
@@ -296,3 +313,52 @@ LIQUIDITY_SIDE_MAP = {
     LiquiditySide.MAKER: "MAKER",
     LiquiditySide.TAKER: "TAKER"
 }
+
+# Names indexed by value, for hot paths that format raw ints without hashing
+ORDER_SIDE_NAMES = ("NO_ORDER_SIDE", "BUY", "SELL")
+
+ORDER_TYPE_NAMES = (
+    "NO_ORDER_TYPE",
+    "MARKET",
+    "LIMIT",
+    "STOP",
+    "STOP_LIMIT",
+    "MARKET_TO_LIMIT",
+    "MARKET_IF_TOUCHED",
+    "LIMIT_IF_TOUCHED",
+    "TRAILING_STOP_MARKET",
+    "TRAILING_STOP_LIMIT",
+)
+
+ORDER_STATUS_NAMES = (
+    "INITIALIZED",
+    "INVALID",
+    "DENIED",
+    "EMULATED",
+    "RELEASED",
+    "PENDING_UPDATE",
+    "PENDING_CANCEL",
+    "ACCEPTED",
+    "REJECTED",
+    "CANCELED",
+    "EXPIRED",
+    "TRIGGERED",
+    "PENDING_NEW",
+    "PARTIALLY_FILLED",
+    "FILLED",
+)
+
+TIME_IN_FORCE_NAMES = (
+    "NO_TIME_IN_FORCE",
+    "DAY",
+    "GTC",
+    "IOC",
+    "FOK",
+    "GTD",
+    "AT_THE_OPEN",
+    "AT_THE_CLOSE",
+)
+
+POSITION_SIDE_NAMES = ("NO_POSITION_SIDE", "FLAT", "LONG", "SHORT")
+
+LIQUIDITY_SIDE_NAMES = ("NO_LIQUIDITY_SIDE", "MAKER", "TAKER")
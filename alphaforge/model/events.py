@@ -3,9 +3,13 @@
 Event types for AlphaForge trading system.
 """
 
-from typing import Optional, Dict, Any, List
+from array import array
+from collections import defaultdict
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterable, List, ClassVar, DefaultDict
 from dataclasses import dataclass, field
-from abc import ABC, abstractmethod
+
+import numpy as np
+
 from alphaforge.model.identifiers import (
     ClientOrderId, VenueOrderId, InstrumentId, StrategyId, 
     TraderId, AccountId, PositionId, TradeId
@@ -14,35 +18,53 @@ from alphaforge.model.enums import (
     OrderSide, OrderType, OrderStatus, TimeInForce,
     PositionSide, LiquiditySide, AggressorSide
 )
-from alphaforge.model.data import Price, Quantity
+from alphaforge.model.data import (
+    Price, Quantity, TradeTick, QuoteTick, Bar, _BookObjectPool, _fast_frozen_init
+)
+from alphaforge.core.compat import _SLOTS
 from alphaforge.core.time import UnixNanos
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
-class Event(ABC):
-    """Base class for all events."""
+class Event:
+    """
+    Base class for all events.
     
-    @property
-    @abstractmethod
-    def event_type(self) -> str:
-        """The event type identifier."""
-        pass
+    Subclasses provide ``ts_event``/``ts_init`` as dataclass fields, read
+    directly from their slots; the annotations below are for type checkers.
+    ``ts_init`` has no default on the bases that are subclassed further
+    (order, position, account and market data events): their subclasses add
+    required fields after it, which dataclasses only allow after required
+    fields.
+    """
     
-    @property
-    @abstractmethod
-    def ts_event(self) -> UnixNanos:
-        """Event timestamp."""
-        pass
+    __slots__ = ()
     
-    @property
-    @abstractmethod
-    def ts_init(self) -> UnixNanos:
-        """Event initialization timestamp."""
-        pass
+    event_type: str
+    ts_event: UnixNanos
+    ts_init: UnixNanos
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolve the type name once per class rather than on every access
+        cls.event_type = cls.__name__
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderEvent(Event):
-    """Base class for order-related events."""
+    """
+    Base class for order-related events.
+    
+    Lifecycle subclasses carry the ``OrderStatus`` they move the order to
+    as a class-level ``status``, so consumers can branch on
+    ``event.status`` without an ``isinstance`` chain. It is ``None`` where
+    the event type does not fix the resulting status: fills (partial or
+    full depends on quantity) and modify/cancel rejects.
+    """
+    
+    status: ClassVar[Optional[OrderStatus]] = None
     
     client_order_id: ClientOrderId
     venue_order_id: Optional[VenueOrderId]
@@ -50,81 +72,82 @@ class OrderEvent(Event):
     instrument_id: InstrumentId
     strategy_id: StrategyId
     ts_event: UnixNanos
-    ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    
-    @property
-    def event_type(self) -> str:
-        return self.__class__.__name__
+    ts_init: UnixNanos
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderSubmitted(OrderEvent):
     """Event when order is submitted to venue."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.PENDING_NEW
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderAccepted(OrderEvent):
     """Event when order is accepted by venue."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.ACCEPTED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderRejected(OrderEvent):
     """Event when order is rejected by venue."""
     
+    status: ClassVar[OrderStatus] = OrderStatus.REJECTED
     reason: str
-    
-    @property
-    def event_type(self) -> str:
-        return "OrderRejected"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderCanceled(OrderEvent):
     """Event when order is canceled."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.CANCELED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderExpired(OrderEvent):
     """Event when order expires."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.EXPIRED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderTriggered(OrderEvent):
     """Event when contingent order is triggered."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.TRIGGERED
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderPendingUpdate(OrderEvent):
     """Event when order update is pending."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.PENDING_UPDATE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderPendingCancel(OrderEvent):
     """Event when order cancel is pending."""
-    pass
+    
+    status: ClassVar[OrderStatus] = OrderStatus.PENDING_CANCEL
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderModifyRejected(OrderEvent):
     """Event when order modification is rejected."""
     
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class OrderCancelRejected(OrderEvent):
     """Event when order cancellation is rejected."""
     
     reason: str
 
 
-@dataclass(frozen=True)
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class OrderFilled(OrderEvent):
     """Event when order is filled (partially or fully)."""
     
@@ -147,7 +170,7 @@ class OrderFilled(OrderEvent):
     info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PositionEvent(Event):
     """Base class for position events."""
     
@@ -156,14 +179,10 @@ class PositionEvent(Event):
     instrument_id: InstrumentId
     strategy_id: StrategyId
     ts_event: UnixNanos
-    ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    
-    @property
-    def event_type(self) -> str:
-        return self.__class__.__name__
+    ts_init: UnixNanos
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PositionOpened(PositionEvent):
     """Event when position is opened."""
     
@@ -181,7 +200,7 @@ class PositionOpened(PositionEvent):
     duration_ns: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PositionChanged(PositionEvent):
     """Event when position quantity changes."""
     
@@ -199,7 +218,7 @@ class PositionChanged(PositionEvent):
     duration_ns: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PositionClosed(PositionEvent):
     """Event when position is closed."""
     
@@ -218,21 +237,17 @@ class PositionClosed(PositionEvent):
     duration_ns: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AccountEvent(Event):
     """Base class for account events."""
     
     account_id: AccountId
     currency: str
     ts_event: UnixNanos
-    ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    
-    @property
-    def event_type(self) -> str:
-        return self.__class__.__name__
+    ts_init: UnixNanos
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AccountState(AccountEvent):
     """Account state update event."""
     
@@ -246,20 +261,17 @@ class AccountState(AccountEvent):
     info: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MarketDataEvent(Event):
     """Base class for market data events."""
     
     instrument_id: InstrumentId
     ts_event: UnixNanos
-    ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    
-    @property
-    def event_type(self) -> str:
-        return self.__class__.__name__
+    ts_init: UnixNanos
 
 
-@dataclass(frozen=True)
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class OrderBookEvent(MarketDataEvent):
     """Order book update event."""
     
@@ -270,9 +282,107 @@ class OrderBookEvent(MarketDataEvent):
     count: int = 1
     sequence: int = 0
     flags: int = 0
-
-
-@dataclass(frozen=True)
+    
+    _pool: ClassVar[_BookObjectPool]
+    
+    @classmethod
+    def from_raw(
+        cls,
+        instrument_id: InstrumentId,
+        action: int,
+        side: int,
+        price_raw: int,
+        price_precision: int,
+        size_raw: int,
+        size_precision: int,
+        ts_event: int,
+        ts_init: int,
+        count: int = 1,
+        sequence: int = 0,
+        flags: int = 0,
+    ) -> "OrderBookEvent":
+        """
+        Create from raw integers on the feed decode path.
+        
+        Pass one ``ts_init`` for a whole decoded batch rather than reading
+        the clock per update through the default.
+        """
+        raw = UnixNanos._raw
+        return cls(
+            instrument_id=instrument_id,
+            ts_event=raw(ts_event),
+            ts_init=raw(ts_init),
+            action=action,
+            side=side,
+            price=Price(price_raw, price_precision),
+            size=Quantity(size_raw, size_precision),
+            count=count,
+            sequence=sequence,
+            flags=flags,
+        )
+    
+    @classmethod
+    def acquire(
+        cls,
+        instrument_id: InstrumentId,
+        ts_event: UnixNanos,
+        action: int,
+        side: int,
+        price: Price,
+        size: Quantity,
+        count: int = 1,
+        sequence: int = 0,
+        flags: int = 0,
+        ts_init: Optional[UnixNanos] = None,
+    ) -> "OrderBookEvent":
+        """Get a pooled order book event initialised with these fields."""
+        event = cls._pool.get()
+        event.reset(
+            instrument_id, ts_event, action, side, price, size,
+            count, sequence, flags, ts_init,
+        )
+        return event
+    
+    def reset(
+        self,
+        instrument_id: InstrumentId,
+        ts_event: UnixNanos,
+        action: int,
+        side: int,
+        price: Price,
+        size: Quantity,
+        count: int = 1,
+        sequence: int = 0,
+        flags: int = 0,
+        ts_init: Optional[UnixNanos] = None,
+    ) -> None:
+        """
+        Reinitialise every field, mirroring ``__init__``.
+        
+        Events stay frozen for consumers; only the pool owner rewrites a
+        released instance, bypassing the frozen ``__setattr__``.
+        """
+        _set = object.__setattr__
+        _set(self, "instrument_id", instrument_id)
+        _set(self, "ts_event", ts_event)
+        _set(self, "ts_init", UnixNanos.now() if ts_init is None else ts_init)
+        _set(self, "action", action)
+        _set(self, "side", side)
+        _set(self, "price", price)
+        _set(self, "size", size)
+        _set(self, "count", count)
+        _set(self, "sequence", sequence)
+        _set(self, "flags", flags)
+    
+    def release(self) -> None:
+        """Return this event to the pool; it must not be used afterwards."""
+        self._pool.put(self)
+
+
+OrderBookEvent._pool = _BookObjectPool(OrderBookEvent)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class QuoteEvent(MarketDataEvent):
     """Quote tick event."""
     
@@ -282,7 +392,7 @@ class QuoteEvent(MarketDataEvent):
     ask_size: Quantity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TradeEvent(MarketDataEvent):
     """Trade tick event."""
     
@@ -292,7 +402,7 @@ class TradeEvent(MarketDataEvent):
     trade_id: TradeId
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class BarEvent(MarketDataEvent):
     """Bar/candlestick event."""
     
@@ -305,7 +415,7 @@ class BarEvent(MarketDataEvent):
     is_revision: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class InstrumentStatusEvent(MarketDataEvent):
     """Instrument status change event."""
     
@@ -314,7 +424,7 @@ class InstrumentStatusEvent(MarketDataEvent):
     trading_session: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class VenueStatusEvent(Event):
     """Venue status change event."""
     
@@ -322,13 +432,9 @@ class VenueStatusEvent(Event):
     status: int
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    
-    @property
-    def event_type(self) -> str:
-        return "VenueStatusEvent"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class InstrumentCloseEvent(Event):
     """Instrument close price event."""
     
@@ -337,10 +443,56 @@ class InstrumentCloseEvent(Event):
     close_type: int  # DAILY=1, WEEKLY=2, MONTHLY=3
     ts_event: UnixNanos
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
+
+
+class _FillColumns:
+    """
+    Struct-of-arrays copy of the numeric OrderFilled fields.
     
-    @property
-    def event_type(self) -> str:
-        return "InstrumentCloseEvent"
+    Each column is a typed ``array('q')``: 8 bytes per value, amortised
+    O(1) appends, and a single memcpy to hand out as a NumPy array.
+    """
+    
+    __slots__ = (
+        "event_index", "ts_event", "last_px_raw", "last_qty_raw",
+        "commission_raw", "order_side", "liquidity_side", "client_order_id",
+    )
+    
+    _INT_COLUMNS = (
+        "event_index", "ts_event", "last_px_raw", "last_qty_raw",
+        "commission_raw", "order_side", "liquidity_side",
+    )
+    
+    def __init__(self):
+        for name in self._INT_COLUMNS:
+            setattr(self, name, array('q'))
+        self.client_order_id: List[ClientOrderId] = []
+    
+    def append(self, event: "OrderFilled", index: int) -> None:
+        """Copy one fill's fields onto the end of every column."""
+        self.event_index.append(index)
+        self.ts_event.append(event.ts_event.value)
+        self.last_px_raw.append(event.last_px.value)
+        self.last_qty_raw.append(event.last_qty.value)
+        self.commission_raw.append(event.commission.value)
+        self.order_side.append(event.order_side)
+        self.liquidity_side.append(event.liquidity_side)
+        self.client_order_id.append(event.client_order_id)
+    
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Copy the columns out as contiguous NumPy arrays."""
+        # Copied rather than viewed: an exported buffer would block appends
+        columns = {
+            name: np.frombuffer(getattr(self, name), dtype=np.int64).copy()
+            for name in self._INT_COLUMNS
+        }
+        client_order_id = np.empty(len(self.client_order_id), dtype=object)
+        client_order_id[:] = self.client_order_id
+        columns["client_order_id"] = client_order_id
+        return columns
+    
+    def __len__(self) -> int:
+        return len(self.event_index)
 
 
 @dataclass
@@ -349,7 +501,11 @@ class EventStore:
     
     def __init__(self):
         self._events: List[Event] = []
-        self._event_index: Dict[str, List[int]] = {}
+        self._event_index: DefaultDict[str, List[int]] = defaultdict(list)
+        self._by_order_id: DefaultDict[ClientOrderId, List[int]] = defaultdict(list)
+        self._by_position_id: DefaultDict[PositionId, List[int]] = defaultdict(list)
+        self._by_instrument_id: DefaultDict[InstrumentId, List[int]] = defaultdict(list)
+        self._fills = _FillColumns()
     
     def add_event(self, event: Event) -> None:
         """Add an event to the store."""
@@ -357,51 +513,97 @@ class EventStore:
         self._events.append(event)
         
         # Index by event type
-        event_type = event.event_type
-        if event_type not in self._event_index:
-            self._event_index[event_type] = []
-        self._event_index[event_type].append(index)
-    
-    def get_events(self, event_type: Optional[str] = None) -> List[Event]:
-        """Get events by type, or all events if type is None."""
+        self._event_index[event.event_type].append(index)
+        
+        # Secondary indices so per-order/position/instrument queries are O(k)
+        if isinstance(event, OrderEvent):
+            self._by_order_id[event.client_order_id].append(index)
+            if isinstance(event, OrderFilled):
+                self._fills.append(event, index)
+        elif isinstance(event, PositionEvent):
+            self._by_position_id[event.position_id].append(index)
+        instrument_id = getattr(event, 'instrument_id', None)
+        if instrument_id is not None:
+            self._by_instrument_id[instrument_id].append(index)
+    
+    def get_events(
+        self, event_type: Optional[str] = None, copy: bool = False
+    ) -> Iterable[Event]:
+        """
+        Get events by type, or all events if type is None.
+        
+        Returns a lazy iterator over the stored events by default, so a
+        single pass over a large store allocates nothing; pass ``copy=True``
+        for an independent list.
+        """
+        events = self._events
         if event_type is None:
-            return self._events.copy()
+            return events.copy() if copy else iter(events)
         
-        indices = self._event_index.get(event_type, [])
-        return [self._events[i] for i in indices]
+        indices = self._event_index.get(event_type, ())
+        if copy:
+            return [events[i] for i in indices]
+        return (events[i] for i in indices)
     
     def get_events_for_order(self, client_order_id: ClientOrderId) -> List[OrderEvent]:
         """Get all events for a specific order."""
-        order_events = []
-        for event in self._events:
-            if (isinstance(event, OrderEvent) and 
-                event.client_order_id == client_order_id):
-                order_events.append(event)
-        return order_events
+        events = self._events
+        return [events[i] for i in self._by_order_id.get(client_order_id, ())]
     
     def get_events_for_position(self, position_id: PositionId) -> List[PositionEvent]:
         """Get all events for a specific position."""
-        position_events = []
-        for event in self._events:
-            if (isinstance(event, PositionEvent) and 
-                event.position_id == position_id):
-                position_events.append(event)
-        return position_events
+        events = self._events
+        return [events[i] for i in self._by_position_id.get(position_id, ())]
     
     def get_events_for_instrument(self, instrument_id: InstrumentId) -> List[Event]:
         """Get all events for a specific instrument."""
-        instrument_events = []
-        for event in self._events:
-            if hasattr(event, 'instrument_id') and event.instrument_id == instrument_id:
-                instrument_events.append(event)
-        return instrument_events
+        events = self._events
+        return [events[i] for i in self._by_instrument_id.get(instrument_id, ())]
+    
+    def extract_columns(self, event_type: str) -> Dict[str, np.ndarray]:
+        """
+        Get the stored market data events of a type as raw int64 columns.
+        
+        Trade, quote and bar events share their field names with the tick
+        types, so the tick extractors are reused directly.
+        """
+        extractor = _COLUMN_EXTRACTORS.get(event_type)
+        if extractor is None:
+            raise ValueError(f"Cannot extract columns for event type: {event_type}")
+        return extractor(self.get_events(event_type))
+    
+    def fill_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Get every stored fill as columns of raw int64 values.
+        
+        ``event_index`` points back into the store for the full event when a
+        field outside the columns is needed.
+        """
+        return self._fills.to_arrays()
+    
+    def fills_frame(self) -> "pd.DataFrame":
+        """Get every stored fill as a pandas DataFrame over ``fill_columns()``."""
+        import pandas as pd
+        
+        return pd.DataFrame(self.fill_columns(), copy=False)
     
     def clear(self) -> None:
         """Clear all events."""
         self._events.clear()
         self._event_index.clear()
+        self._by_order_id.clear()
+        self._by_position_id.clear()
+        self._by_instrument_id.clear()
+        self._fills = _FillColumns()
     
     @property
     def count(self) -> int:
         """Get total number of events."""
         return len(self._events)
+
+
+_COLUMN_EXTRACTORS = {
+    "TradeEvent": TradeTick.to_arrays,
+    "QuoteEvent": QuoteTick.to_arrays,
+    "BarEvent": Bar.to_arrays,
+}
@@ -3,33 +3,66 @@
 Identifier types for AlphaForge trading system.
 """
 
-from typing import Optional
+import sys
+from typing import Dict, Optional, Tuple
+from alphaforge.core import uuid4_new as _uuid4_new
 from alphaforge.core.exceptions import ValidationError
 
 
+# Canonical instances of the identifiers drawn from small, long-lived sets
+# (instruments, accounts, strategies, traders). Equal values then share one
+# object, so dict lookups and ``==`` resolve on identity. Per-order/trade
+# identifiers are not interned: their set grows without bound and most are
+# seen only a few times.
+_INSTRUMENT_IDS: Dict[str, "InstrumentId"] = {}
+_ACCOUNT_IDS: Dict[Tuple[str, str], "AccountId"] = {}
+_STRATEGY_IDS: Dict[str, "StrategyId"] = {}
+_TRADER_IDS: Dict[str, "TraderId"] = {}
+
+
 class InstrumentId:
     """Instrument identifier with symbol and venue."""
     
-    def __init__(self, identifier: str):
+    __slots__ = ("_symbol", "_venue", "_value", "_hash")
+    
+    def __new__(cls, identifier: str):
         """
         Create instrument ID from symbol.venue format.
         
         Args:
             identifier: String in format "SYMBOL.VENUE"
         """
-        if not identifier or '.' not in identifier:
+        try:
+            return _INSTRUMENT_IDS[identifier]
+        except (KeyError, TypeError):
+            pass
+        
+        if not identifier:
             raise ValidationError(f"Invalid instrument identifier format: {identifier}")
-            
-        parts = identifier.split('.')
-        if len(parts) != 2:
+        symbol, sep, venue = identifier.partition('.')
+        if not sep or '.' in venue:
             raise ValidationError(f"Invalid instrument identifier format: {identifier}")
-            
-        self._symbol = parts[0].upper()
-        self._venue = parts[1].upper()
-        self._value = f"{self._symbol}.{self._venue}"
+        
+        self = super().__new__(cls)
+        self._symbol = sys.intern(symbol.upper())
+        self._venue = sys.intern(venue.upper())
+        # Exchange-supplied identifiers are usually upper-case already
+        if identifier.isupper():
+            self._value = sys.intern(identifier)
+        else:
+            self._value = sys.intern(f"{self._symbol}.{self._venue}")
+        self._hash = hash(self._value)
         
         if not self._symbol or not self._venue:
             raise ValidationError(f"Empty symbol or venue in identifier: {identifier}")
+        
+        # "eurusd.sim" and "EURUSD.SIM" resolve to the same instance
+        self = _INSTRUMENT_IDS.setdefault(self._value, self)
+        _INSTRUMENT_IDS[identifier] = self
+        return self
+    
+    def __reduce__(self):
+        return (type(self), (self._value,))
     
     @property
     def symbol(self) -> str:
@@ -58,18 +91,22 @@ class InstrumentId:
         return f"InstrumentId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, InstrumentId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class AccountId:
     """Account identifier with issuer and number."""
     
-    def __init__(self, issuer: str, number: str):
+    __slots__ = ("_issuer", "_number", "_value", "_hash")
+    
+    def __new__(cls, issuer: str, number: str):
         """
         Create account ID.
         
@@ -77,12 +114,25 @@ class AccountId:
             issuer: Account issuer (exchange/broker)
             number: Account number
         """
+        try:
+            return _ACCOUNT_IDS[(issuer, number)]
+        except (KeyError, TypeError):
+            pass
         if not issuer or not number:
             raise ValidationError("Issuer and number cannot be empty")
-            
-        self._issuer = issuer.upper()
+        
+        self = super().__new__(cls)
+        self._issuer = sys.intern(issuer.upper())
         self._number = number
         self._value = f"{self._issuer}-{self._number}"
+        self._hash = hash(self._value)
+        
+        self = _ACCOUNT_IDS.setdefault((self._issuer, number), self)
+        _ACCOUNT_IDS[(issuer, number)] = self
+        return self
+    
+    def __reduce__(self):
+        return (type(self), (self._issuer, self._number))
     
     @property
     def issuer(self) -> str:
@@ -106,17 +156,21 @@ class AccountId:
         return f"AccountId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, AccountId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class ClientOrderId:
     """Client order identifier."""
     
+    __slots__ = ("_value", "_hash")
+    
     def __init__(self, value: str):
         """
         Create client order ID.
@@ -130,6 +184,8 @@ class ClientOrderId:
             raise ValidationError("Client order ID too long (max 64 characters)")
             
         self._value = value
+            
+        self._hash = hash(self._value)
     
     @property
     def value(self) -> str:
@@ -139,8 +195,7 @@ class ClientOrderId:
     @classmethod
     def generate(cls) -> "ClientOrderId":
         """Generate a new UUID-based client order ID."""
-        from alphaforge.core import uuid4_new
-        return cls(uuid4_new())
+        return cls(_uuid4_new())
     
     def __str__(self) -> str:
         return self._value
@@ -149,22 +204,27 @@ class ClientOrderId:
         return f"ClientOrderId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ClientOrderId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class VenueOrderId:
     """Venue order identifier."""
     
+    __slots__ = ("_value", "_hash")
+    
     def __init__(self, value: str):
         """Create venue order ID."""
         if not value:
             raise ValidationError("Venue order ID cannot be empty")
         self._value = value
+        self._hash = hash(self._value)
     
     @property
     def value(self) -> str:
@@ -178,22 +238,27 @@ class VenueOrderId:
         return f"VenueOrderId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, VenueOrderId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class TradeId:
     """Trade identifier."""
     
+    __slots__ = ("_value", "_hash")
+    
     def __init__(self, value: str):
         """Create trade ID."""
         if not value:
             raise ValidationError("Trade ID cannot be empty")
         self._value = value
+        self._hash = hash(self._value)
     
     @property
     def value(self) -> str:
@@ -207,22 +272,27 @@ class TradeId:
         return f"TradeId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TradeId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class PositionId:
     """Position identifier."""
     
+    __slots__ = ("_value", "_hash")
+    
     def __init__(self, value: str):
         """Create position ID."""
         if not value:
             raise ValidationError("Position ID cannot be empty")
         self._value = value
+        self._hash = hash(self._value)
     
     @property
     def value(self) -> str:
@@ -236,24 +306,38 @@ class PositionId:
         return f"PositionId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, PositionId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class StrategyId:
     """Strategy identifier."""
     
-    def __init__(self, value: str):
+    __slots__ = ("_value", "_hash")
+    
+    def __new__(cls, value: str):
         """Create strategy ID."""
+        try:
+            return _STRATEGY_IDS[value]
+        except (KeyError, TypeError):
+            pass
         if not value:
             raise ValidationError("Strategy ID cannot be empty")
         if len(value) > 64:
             raise ValidationError("Strategy ID too long (max 64 characters)")
-        self._value = value
+        self = super().__new__(cls)
+        self._value = sys.intern(value)
+        self._hash = hash(self._value)
+        return _STRATEGY_IDS.setdefault(value, self)
+    
+    def __reduce__(self):
+        return (type(self), (self._value,))
     
     @property
     def value(self) -> str:
@@ -267,24 +351,38 @@ class StrategyId:
         return f"StrategyId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, StrategyId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
 
 
 class TraderId:
     """Trader identifier."""
     
-    def __init__(self, value: str):
-        """Create trader ID.""" 
+    __slots__ = ("_value", "_hash")
+    
+    def __new__(cls, value: str):
+        """Create trader ID."""
+        try:
+            return _TRADER_IDS[value]
+        except (KeyError, TypeError):
+            pass
         if not value:
             raise ValidationError("Trader ID cannot be empty")
         if len(value) > 64:
             raise ValidationError("Trader ID too long (max 64 characters)")
-        self._value = value
+        self = super().__new__(cls)
+        self._value = sys.intern(value)
+        self._hash = hash(self._value)
+        return _TRADER_IDS.setdefault(value, self)
+    
+    def __reduce__(self):
+        return (type(self), (self._value,))
     
     @property
     def value(self) -> str:
@@ -298,9 +396,11 @@ class TraderId:
         return f"TraderId('{self._value}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, TraderId):
             return False
         return self._value == other._value
     
     def __hash__(self) -> int:
-        return hash(self._value)
+        return self._hash
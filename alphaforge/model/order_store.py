@@ -0,0 +1,258 @@
+# AlphaForge Order Store
+"""
+Struct-of-arrays order state for backtest replay.
+
+``OrderStore`` keeps the hot numeric order fields in parallel NumPy columns
+indexed by row, so status scans and bulk queries over millions of orders
+run as single vectorised passes instead of walking ``Order`` objects spread
+across the heap. ``Order`` instances are built on demand with ``to_order``.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from alphaforge.model.identifiers import ClientOrderId, InstrumentId, StrategyId
+from alphaforge.model.enums import OrderSide, OrderType, OrderStatus
+from alphaforge.model.data import Price, Quantity
+from alphaforge.model.orders import (
+    Order,
+    _OPEN_STATUSES,
+    _CLOSED_STATUSES,
+    _WORKING_STATUSES,
+)
+from alphaforge.core.time import UnixNanos
+
+
+def _status_table(statuses) -> np.ndarray:
+    """Boolean lookup table indexed by ``OrderStatus`` value."""
+    table = np.zeros(max(OrderStatus) + 1, dtype=bool)
+    table[[int(status) for status in statuses]] = True
+    return table
+
+
+_IS_OPEN = _status_table(_OPEN_STATUSES)
+_IS_CLOSED = _status_table(_CLOSED_STATUSES)
+_IS_WORKING = _status_table(_WORKING_STATUSES)
+
+_FILLED = int(OrderStatus.FILLED)
+_PARTIALLY_FILLED = int(OrderStatus.PARTIALLY_FILLED)
+
+_COLUMNS = (
+    ("order_side", np.uint8),
+    ("order_type", np.uint8),
+    ("status", np.uint8),
+    ("has_price", np.bool_),
+    ("price_precision", np.uint8),
+    ("size_precision", np.uint8),
+    ("quantity", np.int64),
+    ("filled_qty", np.int64),
+    ("price", np.int64),
+    ("avg_px", np.int64),
+    ("ts_init", np.int64),
+    ("ts_last", np.int64),
+)
+
+
+class OrderStore:
+    """
+    Orders held as parallel NumPy columns, one row per order.
+
+    Quantities and prices are stored as their raw fixed-point integers
+    alongside their precisions; fills are given in the same raw units.
+    ``price`` is meaningful only where ``has_price`` is set and ``avg_px``
+    only once ``filled_qty`` is non-zero. Columns are over-allocated and
+    grown by doubling; the public accessors return views of the first
+    ``len(self)`` rows.
+    """
+
+    __slots__ = (
+        "_size", "_capacity", "_columns", "_index",
+        "client_order_id", "strategy_id", "instrument_id",
+    )
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._capacity = max(int(capacity), 1)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.zeros(self._capacity, dtype=dtype) for name, dtype in _COLUMNS
+        }
+        self._index: Dict[ClientOrderId, int] = {}
+        self.client_order_id: List[ClientOrderId] = []
+        self.strategy_id: List[StrategyId] = []
+        self.instrument_id: List[InstrumentId] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, client_order_id: ClientOrderId) -> bool:
+        return client_order_id in self._index
+
+    def _grow(self) -> None:
+        capacity = self._capacity * 2
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+        self._capacity = capacity
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one numeric column over the stored rows."""
+        return self._columns[name][:self._size]
+
+    def index(self, client_order_id: ClientOrderId) -> int:
+        """Row of the order with this client order ID."""
+        return self._index[client_order_id]
+
+    def create(
+        self,
+        client_order_id: ClientOrderId,
+        strategy_id: StrategyId,
+        instrument_id: InstrumentId,
+        order_side: OrderSide,
+        order_type: OrderType,
+        quantity: Quantity,
+        price: Optional[Price] = None,
+        status: OrderStatus = OrderStatus.INITIALIZED,
+        ts_init: int = 0,
+        price_precision: int = 0,
+    ) -> int:
+        """
+        Append a new order and return its row.
+
+        ``price_precision`` sets the fill price precision for orders
+        without a ``price``; otherwise the price's own precision is used.
+        """
+        if client_order_id in self._index:
+            raise ValueError(f"Duplicate client order ID: {client_order_id}")
+        if self._size == self._capacity:
+            self._grow()
+        row = self._size
+        columns = self._columns
+        columns["order_side"][row] = order_side
+        columns["order_type"][row] = order_type
+        columns["status"][row] = status
+        columns["size_precision"][row] = quantity.precision
+        columns["quantity"][row] = quantity.value
+        columns["filled_qty"][row] = 0
+        if price is not None:
+            columns["has_price"][row] = True
+            columns["price_precision"][row] = price.precision
+            columns["price"][row] = price.value
+        else:
+            columns["has_price"][row] = False
+            columns["price_precision"][row] = price_precision
+            columns["price"][row] = 0
+        columns["avg_px"][row] = 0
+        columns["ts_init"][row] = ts_init
+        columns["ts_last"][row] = ts_init
+        self._index[client_order_id] = row
+        self.client_order_id.append(client_order_id)
+        self.strategy_id.append(strategy_id)
+        self.instrument_id.append(instrument_id)
+        self._size = row + 1
+        return row
+
+    def add_order(self, order: Order) -> int:
+        """Copy an existing order's state into a new row and return it."""
+        row = self.create(
+            order.client_order_id,
+            order.strategy_id,
+            order.instrument_id,
+            order.order_side,
+            order.order_type,
+            order.quantity,
+            order.price,
+            order.status,
+            order.ts_init.value,
+            order.avg_px.precision if order.avg_px is not None else 0,
+        )
+        columns = self._columns
+        columns["filled_qty"][row] = order.filled_qty.value
+        if order.avg_px is not None:
+            columns["avg_px"][row] = order.avg_px.value
+        columns["ts_last"][row] = order.ts_last.value
+        return row
+
+    def apply_fill(self, row: int, fill_qty: int, fill_px: int, ts_event: int) -> None:
+        """
+        Apply a fill of ``fill_qty`` raw units at raw price ``fill_px``.
+
+        Mirrors ``Order.apply_fill``: the average price is the
+        quantity-weighted mean truncated toward zero, and the status moves
+        to PARTIALLY_FILLED or FILLED.
+        """
+        if fill_qty <= 0:
+            raise ValueError("Fill quantity must be positive")
+        if not 0 <= row < self._size:
+            raise IndexError(f"Order row {row} out of range")
+        columns = self._columns
+        prev_filled = int(columns["filled_qty"][row])
+        filled = prev_filled + fill_qty
+        quantity = int(columns["quantity"][row])
+        if filled > quantity:
+            raise ValueError("Fill quantity exceeds order quantity")
+
+        if prev_filled == 0:
+            columns["avg_px"][row] = fill_px
+        else:
+            notional = int(columns["avg_px"][row]) * prev_filled + fill_px * fill_qty
+            if notional >= 0:
+                columns["avg_px"][row] = notional // filled
+            else:
+                columns["avg_px"][row] = -(-notional // filled)
+        columns["filled_qty"][row] = filled
+        columns["status"][row] = _FILLED if filled == quantity else _PARTIALLY_FILLED
+        columns["ts_last"][row] = ts_event
+
+    def set_status(self, row: int, status: OrderStatus) -> None:
+        """Set one order's status."""
+        self._columns["status"][row] = status
+
+    def leaves_qty(self) -> np.ndarray:
+        """Raw remaining quantity per row."""
+        return self.column("quantity") - self.column("filled_qty")
+
+    def open_indices(self) -> np.ndarray:
+        """Rows whose status is open."""
+        return np.flatnonzero(_IS_OPEN[self.column("status")])
+
+    def closed_indices(self) -> np.ndarray:
+        """Rows whose status is closed."""
+        return np.flatnonzero(_IS_CLOSED[self.column("status")])
+
+    def working_indices(self) -> np.ndarray:
+        """Rows whose status is working."""
+        return np.flatnonzero(_IS_WORKING[self.column("status")])
+
+    def count_open(self) -> int:
+        """Number of open orders."""
+        return int(np.count_nonzero(_IS_OPEN[self.column("status")]))
+
+    def to_order(self, row: int) -> Order:
+        """Build an ``Order`` carrying one row's current state."""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Order row {row} out of range")
+        columns = self._columns
+        size_precision = int(columns["size_precision"][row])
+        price_precision = int(columns["price_precision"][row])
+        quantity = int(columns["quantity"][row])
+        filled = int(columns["filled_qty"][row])
+        price = None
+        if columns["has_price"][row]:
+            price = Price(int(columns["price"][row]), price_precision)
+        return Order(
+            client_order_id=self.client_order_id[row],
+            strategy_id=self.strategy_id[row],
+            instrument_id=self.instrument_id[row],
+            order_side=OrderSide(int(columns["order_side"][row])),
+            order_type=OrderType(int(columns["order_type"][row])),
+            quantity=Quantity(quantity, size_precision),
+            price=price,
+            status=OrderStatus(int(columns["status"][row])),
+            filled_qty=Quantity(filled, size_precision),
+            leaves_qty=Quantity(quantity - filled, size_precision),
+            avg_px=Price(int(columns["avg_px"][row]), price_precision) if filled else None,
+            ts_init=UnixNanos(int(columns["ts_init"][row])),
+            ts_last=UnixNanos(int(columns["ts_last"][row])),
+        )
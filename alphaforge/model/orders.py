@@ -3,8 +3,8 @@
 Order types and order management for AlphaForge trading system.
 """
 
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Type, Callable
+from dataclasses import dataclass, field, fields, MISSING
 from alphaforge.model.identifiers import (
     ClientOrderId, VenueOrderId, InstrumentId, StrategyId, 
     TraderId, AccountId, PositionId
@@ -13,12 +13,69 @@ from alphaforge.model.enums import (
     OrderSide, OrderType, OrderStatus, TimeInForce, 
     TriggerType, ContingencyType, LiquiditySide
 )
-from alphaforge.model.data import Price, Quantity
+from alphaforge.model.data import (
+    Price, Quantity, _BookObjectPool, _DEFAULT_FACTORY, _fast_frozen_init
+)
+from alphaforge.core import uuid4_new as _uuid4_new
+from alphaforge.core.compat import _SLOTS
 from alphaforge.core.time import UnixNanos
 
+# Membership sets for the order predicates; enum member lookups are slow
+# enough that building a tuple of them per call dominated each check
+_PASSIVE_TYPES = frozenset({
+    OrderType.LIMIT, OrderType.STOP_LIMIT, OrderType.LIMIT_IF_TOUCHED,
+})
+_AGGRESSIVE_TYPES = frozenset({
+    OrderType.MARKET, OrderType.STOP,
+    OrderType.MARKET_TO_LIMIT, OrderType.MARKET_IF_TOUCHED,
+})
+_OPEN_STATUSES = frozenset({
+    OrderStatus.ACCEPTED, OrderStatus.PENDING_NEW,
+    OrderStatus.PENDING_UPDATE, OrderStatus.PENDING_CANCEL,
+    OrderStatus.PARTIALLY_FILLED, OrderStatus.TRIGGERED,
+})
+_CLOSED_STATUSES = frozenset({
+    OrderStatus.FILLED, OrderStatus.CANCELED,
+    OrderStatus.REJECTED, OrderStatus.EXPIRED,
+})
+_INFLIGHT_STATUSES = frozenset({
+    OrderStatus.PENDING_NEW, OrderStatus.PENDING_UPDATE,
+    OrderStatus.PENDING_CANCEL,
+})
+_WORKING_STATUSES = frozenset({
+    OrderStatus.ACCEPTED, OrderStatus.TRIGGERED,
+    OrderStatus.PARTIALLY_FILLED,
+})
 
-@dataclass
-class Order:
+# Enum members used in method bodies, bound once: each ``Enum.MEMBER`` load
+# goes through the enum class's attribute lookup
+_BUY = OrderSide.BUY
+_SELL = OrderSide.SELL
+_MARKET = OrderType.MARKET
+_LIMIT = OrderType.LIMIT
+_STOP = OrderType.STOP
+_STOP_LIMIT = OrderType.STOP_LIMIT
+_IOC = TimeInForce.IOC
+_NO_TRIGGER = TriggerType.NO_TRIGGER
+_LAST = TriggerType.LAST
+_NO_CONTINGENCY = ContingencyType.NO_CONTINGENCY
+_FILLED = OrderStatus.FILLED
+_PARTIALLY_FILLED = OrderStatus.PARTIALLY_FILLED
+_CANCELED = OrderStatus.CANCELED
+_EXPIRED = OrderStatus.EXPIRED
+
+
+class _OrderListMember:
+    """
+    Holds an order's owning ``OrderList`` in a slot outside the dataclass
+    fields, so ``asdict``/``repr``/``==`` never follow order -> list -> orders.
+    """
+    
+    __slots__ = ("_order_list",)
+
+
+@dataclass(**_SLOTS)
+class Order(_OrderListMember):
     """Base order class."""
     
     # Required fields
@@ -48,13 +105,13 @@ class Order:
     parent_order_id: Optional[ClientOrderId] = None
     contingency_type: ContingencyType = ContingencyType.NO_CONTINGENCY
     order_list_id: Optional[str] = None
-    linked_order_ids: List[ClientOrderId] = field(default_factory=list)
+    linked_order_ids: Optional[List[ClientOrderId]] = None  # allocated on first link
     
     # Execution tracking
     venue_order_id: Optional[VenueOrderId] = None
     position_id: Optional[PositionId] = None
     exec_algorithm_id: Optional[str] = None
-    exec_algorithm_params: Dict[str, Any] = field(default_factory=dict)
+    exec_algorithm_params: Optional[Dict[str, Any]] = None
     exec_spawn_id: Optional[ClientOrderId] = None
     
     # Status and fills
@@ -71,49 +128,58 @@ class Order:
     # Timestamps
     init_id: str = ""
     ts_init: UnixNanos = field(default_factory=UnixNanos.now)
-    ts_last: UnixNanos = field(default_factory=UnixNanos.now)
+    ts_last: Optional[UnixNanos] = None  # defaults to ts_init
     
-    # Tags and metadata
-    tags: List[str] = field(default_factory=list)
-    info: Dict[str, Any] = field(default_factory=dict)
+    # Tags and metadata; most orders never set any, so these stay None until
+    # first written through add_tag()/set_info()
+    tags: Optional[List[str]] = None
+    info: Optional[Dict[str, Any]] = None
     
     def __post_init__(self):
         """Initialize calculated fields after object creation."""
+        # Owning OrderList, notified of status changes made through set_status()
+        self._order_list: Optional["OrderList"] = None
+        quantity = self.quantity
+        filled_qty = self.filled_qty
+        if filled_qty.precision != quantity.precision:
+            if filled_qty.value:
+                raise ValueError("Cannot subtract quantities with different precision")
+            # The default zero fill takes the order quantity's precision
+            self.filled_qty = filled_qty = Quantity(0, quantity.precision)
         if self.leaves_qty is None:
-            self.leaves_qty = self.quantity - self.filled_qty
+            self.leaves_qty = Quantity(quantity.value - filled_qty.value, quantity.precision)
+        if self.ts_last is None:
+            self.ts_last = self.ts_init
         
         # Generate init_id if not provided
         if not self.init_id:
-            from alphaforge.core import uuid4_new
-            self.init_id = uuid4_new()
+            self.init_id = _uuid4_new()
     
     @property
     def is_buy(self) -> bool:
         """Check if this is a buy order."""
-        return self.order_side == OrderSide.BUY
+        return self.order_side == _BUY
     
     @property
     def is_sell(self) -> bool:
         """Check if this is a sell order."""
-        return self.order_side == OrderSide.SELL
+        return self.order_side == _SELL
     
     @property
     def is_passive(self) -> bool:
         """Check if this is a passive order type."""
-        return self.order_type in (OrderType.LIMIT, OrderType.STOP_LIMIT, 
-                                  OrderType.LIMIT_IF_TOUCHED)
+        return self.order_type in _PASSIVE_TYPES
     
     @property
     def is_aggressive(self) -> bool:
         """Check if this is an aggressive order type."""
-        return self.order_type in (OrderType.MARKET, OrderType.STOP,
-                                  OrderType.MARKET_TO_LIMIT, OrderType.MARKET_IF_TOUCHED)
+        return self.order_type in _AGGRESSIVE_TYPES
     
     @property
     def is_contingent(self) -> bool:
         """Check if this order has contingent triggers."""
-        return (self.trigger_type != TriggerType.NO_TRIGGER or
-                self.contingency_type != ContingencyType.NO_CONTINGENCY)
+        return (self.trigger_type != _NO_TRIGGER or
+                self.contingency_type != _NO_CONTINGENCY)
     
     @property
     def is_parent_order(self) -> bool:
@@ -128,88 +194,126 @@ class Order:
     @property
     def is_open(self) -> bool:
         """Check if order is in an open state."""
-        return self.status in (OrderStatus.ACCEPTED, OrderStatus.PENDING_NEW,
-                              OrderStatus.PENDING_UPDATE, OrderStatus.PENDING_CANCEL,
-                              OrderStatus.PARTIALLY_FILLED, OrderStatus.TRIGGERED)
+        return self.status in _OPEN_STATUSES
     
     @property
     def is_closed(self) -> bool:
         """Check if order is in a closed state."""
-        return self.status in (OrderStatus.FILLED, OrderStatus.CANCELED,
-                              OrderStatus.REJECTED, OrderStatus.EXPIRED)
+        return self.status in _CLOSED_STATUSES
     
     @property
     def is_inflight(self) -> bool:
         """Check if order is currently in flight (pending operations)."""
-        return self.status in (OrderStatus.PENDING_NEW, OrderStatus.PENDING_UPDATE,
-                              OrderStatus.PENDING_CANCEL)
+        return self.status in _INFLIGHT_STATUSES
     
     @property
     def is_working(self) -> bool:
         """Check if order is working in the market."""
-        return self.status in (OrderStatus.ACCEPTED, OrderStatus.TRIGGERED,
-                              OrderStatus.PARTIALLY_FILLED)
+        return self.status in _WORKING_STATUSES
     
     @property
     def would_reduce_only(self) -> bool:
         """Check if order would only reduce position."""
         return self.reduce_only
     
-    def apply_fill(self, fill_qty: Quantity, fill_price: Price) -> None:
-        """Apply a fill to this order."""
-        if fill_qty.value <= 0:
+    def apply_fill(
+        self, fill_qty: Quantity, fill_price: Price, ts: Optional[UnixNanos] = None
+    ) -> None:
+        """Apply a fill to this order, stamped ``ts`` (default: now)."""
+        fill = fill_qty.value
+        if fill <= 0:
             raise ValueError("Fill quantity must be positive")
         
-        if self.filled_qty + fill_qty > self.quantity:
+        # Work on the raw integers and wrap each result once
+        precision = self.filled_qty.precision
+        if fill_qty.precision != precision:
+            raise ValueError("Cannot add quantities with different precision")
+        prev_filled = self.filled_qty.value
+        filled = prev_filled + fill
+        if filled > self.quantity.value:
             raise ValueError("Fill quantity exceeds order quantity")
+        leaves = self.quantity.value - filled
         
-        self.filled_qty += fill_qty
-        self.leaves_qty = self.quantity - self.filled_qty
+        self.filled_qty = Quantity(filled, precision)
+        self.leaves_qty = Quantity(leaves, self.quantity.precision)
         
         # Update average price
-        if self.avg_px is None:
+        avg_px = self.avg_px
+        if avg_px is None:
             self.avg_px = fill_price
         else:
-            # Weighted average
-            total_filled = self.filled_qty.value
-            prev_filled = total_filled - fill_qty.value
-            if total_filled > 0:
-                weighted_avg = ((self.avg_px.value * prev_filled) + 
-                               (fill_price.value * fill_qty.value)) / total_filled
-                self.avg_px = Price.from_int(int(weighted_avg), self.avg_px.precision)
+            # Weighted average, truncated toward zero
+            notional = avg_px.value * prev_filled + fill_price.value * fill
+            if notional >= 0:
+                weighted_avg = notional // filled
+            else:
+                weighted_avg = -(-notional // filled)
+            self.avg_px = Price(weighted_avg, avg_px.precision)
         
         # Update status
-        if self.leaves_qty.value == 0:
-            self.status = OrderStatus.FILLED
-        elif self.filled_qty.value > 0:
-            self.status = OrderStatus.PARTIALLY_FILLED
-        
-        self.ts_last = UnixNanos.now()
-    
-    def cancel(self) -> None:
-        """Cancel this order."""
+        self.set_status(_FILLED if leaves == 0 else _PARTIALLY_FILLED)
+        self.ts_last = UnixNanos.now() if ts is None else ts
+    
+    def set_status(self, status: OrderStatus) -> None:
+        """Transition to ``status``, keeping any owning OrderList's counters in step."""
+        previous = self.status
+        self.status = status
+        if self._order_list is not None:
+            self._order_list._on_status_change(previous, status)
+    
+    def cancel(self, ts: Optional[UnixNanos] = None) -> None:
+        """Cancel this order, stamped ``ts`` (default: now)."""
         if self.is_closed:
             raise ValueError(f"Cannot cancel order in {self.status} state")
         
-        self.status = OrderStatus.CANCELED
-        self.ts_last = UnixNanos.now()
+        self.set_status(_CANCELED)
+        self.ts_last = UnixNanos.now() if ts is None else ts
     
-    def expire(self) -> None:
-        """Expire this order."""
+    def expire(self, ts: Optional[UnixNanos] = None) -> None:
+        """Expire this order, stamped ``ts`` (default: now)."""
         if self.is_closed:
             raise ValueError(f"Cannot expire order in {self.status} state")
         
-        self.status = OrderStatus.EXPIRED  
-        self.ts_last = UnixNanos.now()
-    
-    def update_quantity(self, new_quantity: Quantity) -> None:
-        """Update order quantity."""
-        if new_quantity <= self.filled_qty:
+        self.set_status(_EXPIRED)
+        self.ts_last = UnixNanos.now() if ts is None else ts
+    
+    def update_quantity(
+        self, new_quantity: Quantity, ts: Optional[UnixNanos] = None
+    ) -> None:
+        """Update order quantity, stamped ``ts`` (default: now)."""
+        filled_qty = self.filled_qty
+        if new_quantity.value <= filled_qty.value:
             raise ValueError("New quantity cannot be less than filled quantity")
+        if new_quantity.precision != filled_qty.precision:
+            raise ValueError("Cannot subtract quantities with different precision")
         
         self.quantity = new_quantity
-        self.leaves_qty = self.quantity - self.filled_qty
-        self.ts_last = UnixNanos.now()
+        self.leaves_qty = Quantity(new_quantity.value - filled_qty.value, new_quantity.precision)
+        self.ts_last = UnixNanos.now() if ts is None else ts
+    
+    def link_order(self, client_order_id: ClientOrderId) -> None:
+        """Record a linked (child/contingent) order."""
+        if self.linked_order_ids is None:
+            self.linked_order_ids = []
+        self.linked_order_ids.append(client_order_id)
+    
+    def set_exec_algorithm_param(self, key: str, value: Any) -> None:
+        """Set an execution algorithm parameter."""
+        if self.exec_algorithm_params is None:
+            self.exec_algorithm_params = {}
+        self.exec_algorithm_params[key] = value
+    
+    def add_tag(self, tag: str) -> None:
+        """Attach a tag to this order."""
+        if self.tags is None:
+            self.tags = []
+        self.tags.append(tag)
+    
+    def set_info(self, key: str, value: Any) -> None:
+        """Set a metadata entry on this order."""
+        if self.info is None:
+            self.info = {}
+        self.info[key] = value
     
     def __str__(self) -> str:
         return (f"Order({self.client_order_id}, {self.instrument_id}, "
@@ -220,41 +324,43 @@ class Order:
         return self.__str__()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MarketOrder(Order):
     """Market order - executes immediately at best available price."""
     
     def __post_init__(self):
-        self.order_type = OrderType.MARKET
-        self.time_in_force = TimeInForce.IOC  # Market orders are typically IOC
-        super().__post_init__()
+        self.order_type = _MARKET
+        self.time_in_force = _IOC  # Market orders are typically IOC
+        # Slotted dataclasses are rebuilt as new classes, so call the base
+        # explicitly rather than through zero-argument super()
+        Order.__post_init__(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LimitOrder(Order):
     """Limit order - executes at specified price or better."""
     
     def __post_init__(self):
         if self.price is None:
             raise ValueError("Limit order must have a price")
-        self.order_type = OrderType.LIMIT
-        super().__post_init__()
+        self.order_type = _LIMIT
+        Order.__post_init__(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StopOrder(Order):
     """Stop order - becomes market order when trigger price hit."""
     
     def __post_init__(self):
         if self.trigger_price is None:
             raise ValueError("Stop order must have a trigger price")
-        self.order_type = OrderType.STOP
-        if self.trigger_type == TriggerType.NO_TRIGGER:
-            self.trigger_type = TriggerType.LAST
-        super().__post_init__()
+        self.order_type = _STOP
+        if self.trigger_type == _NO_TRIGGER:
+            self.trigger_type = _LAST
+        Order.__post_init__(self)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StopLimitOrder(Order):
     """Stop-limit order - becomes limit order when trigger price hit."""
     
@@ -263,13 +369,82 @@ class StopLimitOrder(Order):
             raise ValueError("Stop-limit order must have a trigger price")
         if self.price is None:
             raise ValueError("Stop-limit order must have a limit price")
-        self.order_type = OrderType.STOP_LIMIT
-        if self.trigger_type == TriggerType.NO_TRIGGER:
-            self.trigger_type = TriggerType.LAST
-        super().__post_init__()
+        self.order_type = _STOP_LIMIT
+        if self.trigger_type == _NO_TRIGGER:
+            self.trigger_type = _LAST
+        Order.__post_init__(self)
+
 
+# Released orders kept for reuse, per order class
+ORDER_POOL_SIZE = 4096
 
-@dataclass(frozen=True)
+
+def _reset_function(cls: Type[Order]) -> Callable[..., None]:
+    """
+    Build a function that reinitialises a ``cls`` instance in place with
+    the same signature as the dataclass ``__init__``.
+    """
+    namespace: Dict[str, Any] = {"_FACTORY": _DEFAULT_FACTORY}
+    params: List[str] = []
+    body: List[str] = []
+    for f in fields(cls):
+        name = f.name
+        if f.default is not MISSING:
+            namespace[f"_default_{name}"] = f.default
+            params.append(f"{name}=_default_{name}")
+            body.append(f"    self.{name} = {name}")
+        elif f.default_factory is not MISSING:
+            namespace[f"_factory_{name}"] = f.default_factory
+            params.append(f"{name}=_FACTORY")
+            body.append(f"    if {name} is _FACTORY: {name} = _factory_{name}()")
+            body.append(f"    self.{name} = {name}")
+        else:
+            params.append(name)
+            body.append(f"    self.{name} = {name}")
+    body.append("    self.__post_init__()")
+    source = f"def reset(self, {', '.join(params)}):\n" + "\n".join(body)
+    exec(source, namespace)
+    return namespace["reset"]
+
+
+class OrderPool:
+    """
+    Free lists of released orders, one per order class.
+
+    ``acquire()`` reinitialises a released order in place of constructing a
+    new one; ``__post_init__`` still runs so subclass validation applies.
+    Pass ``init_id`` to skip its UUID generation. A released order must not
+    be used again.
+    """
+
+    def __init__(self, max_size: int = ORDER_POOL_SIZE):
+        self._max_size = max_size
+        self._pools: Dict[type, _BookObjectPool] = {}
+        self._resets: Dict[type, Callable[..., None]] = {}
+
+    def acquire(self, order_cls: Type[Order] = Order, **kwargs: Any) -> Order:
+        """Get a pooled ``order_cls`` initialised as ``order_cls(**kwargs)`` would be."""
+        try:
+            reset = self._resets[order_cls]
+        except KeyError:
+            reset = self._resets[order_cls] = _reset_function(order_cls)
+            self._pools[order_cls] = _BookObjectPool(order_cls, self._max_size)
+        order = self._pools[order_cls].get()
+        reset(order, **kwargs)
+        return order
+
+    def release(self, order: Order) -> None:
+        """Return an order for reuse; dropped once the pool is full."""
+        pool = self._pools.get(type(order))
+        if pool is not None:
+            pool.put(order)
+
+    def __len__(self) -> int:
+        return sum(len(pool) for pool in self._pools.values())
+
+
+@_fast_frozen_init
+@dataclass(frozen=True, **_SLOTS)
 class OrderFill:
     """Order fill/execution event."""
     
@@ -312,31 +487,66 @@ class OrderList:
     orders: List[Order]
     contingency_type: ContingencyType
     
-    # State tracking
+    # State tracking. The counters are derived from the orders' statuses:
+    # they are recomputed on construction and then kept current by
+    # add_order/remove_order and Order.set_status().
     first: Optional[ClientOrderId] = None
     orders_filled: int = 0
     orders_working: int = 0
     
+    # Orders keyed by client order ID, alongside the ordered list
+    _by_id: Dict[ClientOrderId, Order] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self.orders_working = 0
+        self.orders_filled = 0
+        for order in reversed(self.orders):
+            self._by_id[order.client_order_id] = order
+            self._link(order)
+    
+    def _link(self, order: Order) -> None:
+        order._order_list = self
+        status = order.status
+        self.orders_working += status in _WORKING_STATUSES
+        self.orders_filled += status is _FILLED
+    
+    def _on_status_change(self, previous: OrderStatus, status: OrderStatus) -> None:
+        self.orders_working += (
+            (status in _WORKING_STATUSES) - (previous in _WORKING_STATUSES)
+        )
+        self.orders_filled += (status is _FILLED) - (previous is _FILLED)
+    
     def add_order(self, order: Order) -> None:
         """Add an order to this list."""
         order.order_list_id = self.id
         self.orders.append(order)
+        self._by_id.setdefault(order.client_order_id, order)
+        self._link(order)
         
         if self.first is None:
             self.first = order.client_order_id
-        
-        if order.is_working:
-            self.orders_working += 1
+    
+    def get_order(self, client_order_id: ClientOrderId) -> Optional[Order]:
+        """Get an order in this list by client order ID."""
+        return self._by_id.get(client_order_id)
     
     def remove_order(self, client_order_id: ClientOrderId) -> Optional[Order]:
         """Remove an order from this list."""
-        for i, order in enumerate(self.orders):
-            if order.client_order_id == client_order_id:
-                removed = self.orders.pop(i)
-                if removed.is_working:
-                    self.orders_working -= 1
-                return removed
-        return None
+        removed = self._by_id.pop(client_order_id, None)
+        if removed is None:
+            return None
+        # Match by identity: Order.__eq__ compares every field
+        orders = self.orders
+        for i, order in enumerate(orders):
+            if order is removed:
+                del orders[i]
+                break
+        removed._order_list = None
+        self.orders_working -= removed.is_working
+        self.orders_filled -= removed.status is _FILLED
+        return removed
     
     @property
     def is_working(self) -> bool:
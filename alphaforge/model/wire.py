@@ -0,0 +1,61 @@
+# AlphaForge Wire Formats
+"""
+Fixed-width binary layouts for market data feeds.
+
+Buffers are decoded with ``np.frombuffer`` into structured arrays that view
+the original bytes, so consumers can work on whole columns and only build
+tick objects when they need them.
+"""
+
+from typing import Dict, Union
+
+import numpy as np
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# 32-byte little-endian trade record; the padding keeps records 8-byte aligned
+TRADE_WIRE_DTYPE = np.dtype([
+    ("ts_event", "<i8"),
+    ("price_raw", "<i8"),
+    ("size_raw", "<i8"),
+    ("aggressor", "u1"),
+    ("_pad", "V7"),
+])
+
+# 48-byte little-endian quote record
+QUOTE_WIRE_DTYPE = np.dtype([
+    ("ts_event", "<i8"),
+    ("bid_price_raw", "<i8"),
+    ("ask_price_raw", "<i8"),
+    ("bid_size_raw", "<i8"),
+    ("ask_size_raw", "<i8"),
+    ("_pad", "V8"),
+])
+
+
+def decode_trades(buf: Buffer) -> np.ndarray:
+    """View a buffer of trade records as a structured array (no copy)."""
+    return np.frombuffer(buf, dtype=TRADE_WIRE_DTYPE)
+
+
+def decode_quotes(buf: Buffer) -> np.ndarray:
+    """View a buffer of quote records as a structured array (no copy)."""
+    return np.frombuffer(buf, dtype=QUOTE_WIRE_DTYPE)
+
+
+def encode_trades(columns: Dict[str, np.ndarray]) -> bytes:
+    """Pack ``ts_event``/``price_raw``/``size_raw``/``aggressor`` columns."""
+    records = np.zeros(len(columns["ts_event"]), dtype=TRADE_WIRE_DTYPE)
+    for name in ("ts_event", "price_raw", "size_raw", "aggressor"):
+        records[name] = columns[name]
+    return records.tobytes()
+
+
+def encode_quotes(columns: Dict[str, np.ndarray]) -> bytes:
+    """Pack ``ts_event`` and the raw bid/ask price and size columns."""
+    records = np.zeros(len(columns["ts_event"]), dtype=QUOTE_WIRE_DTYPE)
+    for name in ("ts_event", "bid_price_raw", "ask_price_raw",
+                 "bid_size_raw", "ask_size_raw"):
+        records[name] = columns[name]
+    return records.tobytes()
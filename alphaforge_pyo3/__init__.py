@@ -14,14 +14,22 @@ try:
     CacheStatistics = _rust_ext.cache.CacheStatistics
     unix_nanos_now = _rust_ext.core.unix_nanos_now_py
     uuid4_new = _rust_ext.core.uuid4_new_py
+    uuid4_new_batch = _rust_ext.core.uuid4_new_batch_py
+    Price = _rust_ext.model.Price
+    Quantity = _rust_ext.model.Quantity
+    OrderBook = _rust_ext.model.OrderBook
     
     # Re-export main components for convenience
     __all__ = [
         'unix_nanos_now',
         'uuid4_new', 
+        'uuid4_new_batch',
         'Cache',
         'CacheConfig',
         'CacheStatistics',
+        'Price',
+        'Quantity',
+        'OrderBook',
     ]
     
 except ImportError as e:
@@ -34,28 +42,34 @@ except ImportError as e:
 
     T = TypeVar('T')
 
-    def unix_nanos_now() -> int:
+    # Fallback: time.time_ns is already the right clock, bound directly
+    unix_nanos_now = time.time_ns
+
+    def uuid4_new() -> str:
         """
-        Get current Unix timestamp in nanoseconds.
+        Generate a new UUID4 string.
         
         This is a fallback Python implementation.
         """
-        return int(time.time_ns())
+        import uuid
+        return str(uuid.uuid4())
 
-    def uuid4_new() -> str:
+    def uuid4_new_batch(n: int) -> List[str]:
         """
-        Generate a new UUID4 string.
+        Generate ``n`` UUID4 strings.
         
         This is a fallback Python implementation.
         """
         import uuid
-        return str(uuid.uuid4())
+        return [str(uuid.uuid4()) for _ in range(n)]
 
     class CacheStatistics:
         """
         Cache performance statistics.
         """
         
+        __slots__ = ("hits", "misses", "inserts", "evictions", "memory_usage")
+        
         def __init__(self):
             self.hits = 0
             self.misses = 0
@@ -140,12 +154,18 @@ except ImportError as e:
             return self._stats if self.config.enable_statistics else None
         
         def reset_statistics(self) -> None:
-            """Reset cache statistics."""
-            self._stats = CacheStatistics()
+            """Reset cache statistics in place."""
+            stats = self._stats
+            stats.hits = 0
+            stats.misses = 0
+            stats.inserts = 0
+            stats.evictions = 0
+            stats.memory_usage = 0
 
     __all__ = [
         'unix_nanos_now',
         'uuid4_new', 
+        'uuid4_new_batch',
         'Cache',
         'CacheConfig',
         'CacheStatistics',
@@ -3,11 +3,14 @@
 Core PyO3 bindings for AlphaForge Rust components.
 """
 
-from alphaforge_pyo3 import unix_nanos_now, uuid4_new, Cache, CacheConfig, CacheStatistics
+from alphaforge_pyo3 import (
+    unix_nanos_now, uuid4_new, uuid4_new_batch, Cache, CacheConfig, CacheStatistics
+)
 
 __all__ = [
     "unix_nanos_now",
     "uuid4_new", 
+    "uuid4_new_batch",
     "Cache",
     "CacheConfig",
     "CacheStatistics",
@@ -0,0 +1,12 @@
+# AlphaForge PyO3 Model Module
+"""
+Model PyO3 bindings for AlphaForge Rust components.
+"""
+
+from alphaforge_pyo3 import Price, Quantity, OrderBook
+
+__all__ = [
+    "Price",
+    "Quantity",
+    "OrderBook",
+]
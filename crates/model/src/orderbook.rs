@@ -9,6 +9,12 @@ use alphaforge_core::time::UnixNanos;
 use crate::identifiers::InstrumentId;
 use crate::enums::{OrderSide, BookAction};
 
+/// Powers of ten for every supported precision, indexed instead of computed
+const POW10_I64: [i64; 10] = [
+    1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000,
+];
+const POW10_F64: [f64; 10] = [1e0, 1e1, 1e2, 1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9];
+
 /// High-precision price type with fixed-point arithmetic
 #[derive(Debug, Clone, Copy, PartialEq, Eq, PartialOrd, Ord, Hash, Serialize, Deserialize)]
 #[repr(transparent)]
@@ -27,7 +33,7 @@ impl Price {
             return Err(PriceError::NonPositive(raw));
         }
         
-        let adjusted = raw * 10_i64.pow((Self::PRECISION - precision) as u32);
+        let adjusted = raw * POW10_I64[(Self::PRECISION - precision) as usize];
         Ok(Self(adjusted))
     }
     
@@ -36,8 +42,11 @@ impl Price {
         if !value.is_finite() || value <= 0.0 {
             return Err(PriceError::InvalidValue(value));
         }
+        if precision > Self::PRECISION {
+            return Err(PriceError::PrecisionTooHigh(precision));
+        }
         
-        let multiplier = 10_f64.powi(precision as i32);
+        let multiplier = POW10_F64[precision as usize];
         let raw = (value * multiplier).round() as i64;
         Self::new(raw, precision)
     }
@@ -91,7 +100,7 @@ impl Quantity {
             return Err(QuantityError::PrecisionTooHigh(precision));
         }
         
-        let adjusted = raw * 10_u64.pow((Self::PRECISION - precision) as u32);
+        let adjusted = raw * POW10_I64[(Self::PRECISION - precision) as usize] as u64;
         Ok(Self(adjusted))
     }
     
@@ -100,8 +109,11 @@ impl Quantity {
         if !value.is_finite() || value < 0.0 {
             return Err(QuantityError::InvalidValue(value));
         }
+        if precision > Self::PRECISION {
+            return Err(QuantityError::PrecisionTooHigh(precision));
+        }
         
-        let multiplier = 10_f64.powi(precision as i32);
+        let multiplier = POW10_F64[precision as usize];
         let raw = (value * multiplier).round() as u64;
         Self::new(raw, precision)
     }
@@ -6,32 +6,29 @@ use pyo3::prelude::*;
 use pyo3::types::PyModule;
 use tracing_subscriber::{EnvFilter, fmt};
 use alphaforge_core::generic_cache;
+use std::sync::Arc;
 
 mod data_engine;
 mod strategy_engine;
 mod execution_engine;
 
 /// Python-compatible wrapper for PyObject that implements Clone
-#[derive(Debug)]
-struct PyObjectWrapper(PyObject);
-
-impl Clone for PyObjectWrapper {
-    fn clone(&self) -> Self {
-        Python::with_gil(|py| {
-            PyObjectWrapper(self.0.clone_ref(py))
-        })
-    }
-}
+///
+/// The object is shared behind an `Arc` so cloning it inside the cache
+/// (which happens under the cache lock) never needs the GIL; callers take
+/// a new Python reference with `clone_ref` once they hold the GIL again.
+#[derive(Debug, Clone)]
+struct PyObjectWrapper(Arc<PyObject>);
 
 impl From<PyObject> for PyObjectWrapper {
     fn from(obj: PyObject) -> Self {
-        PyObjectWrapper(obj)
+        PyObjectWrapper(Arc::new(obj))
     }
 }
 
 impl Into<PyObject> for PyObjectWrapper {
     fn into(self) -> PyObject {
-        self.0
+        Python::with_gil(|py| self.0.clone_ref(py))
     }
 }
 
@@ -90,6 +87,7 @@ fn register_core_module(py: Python, parent: &Bound<'_, PyModule>) -> PyResult<()
     // Add core functions
     core_module.add_function(wrap_pyfunction!(unix_nanos_now_py, &core_module)?)?;
     core_module.add_function(wrap_pyfunction!(uuid4_new_py, &core_module)?)?;
+    core_module.add_function(wrap_pyfunction!(uuid4_new_batch_py, &core_module)?)?;
     
     parent.add_submodule(&core_module)?;
     
@@ -126,6 +124,7 @@ fn register_time_module(py: Python, parent: &Bound<'_, PyModule>) -> PyResult<()
     let time_module = PyModule::new_bound(py, "time")?;
     
     time_module.add_class::<PyAtomicTime>()?;
+    time_module.add_class::<PyUnixNanos>()?;
     // Note: PyLiveClock temporarily removed due to clock module absence
     
     parent.add_submodule(&time_module)?;
@@ -199,76 +198,199 @@ fn uuid4_new_py() -> String {
     alphaforge_core::uuid::UUID4::new().to_string()
 }
 
+/// Generate `n` UUID4 strings in one call, so bulk order creation crosses
+/// the FFI boundary once instead of per order.
+#[pyfunction]
+fn uuid4_new_batch_py(py: Python, n: usize) -> Vec<String> {
+    py.allow_threads(|| {
+        (0..n)
+            .map(|_| alphaforge_core::uuid::UUID4::new().to_string())
+            .collect()
+    })
+}
+
+// Fixed-point helpers shared by the Price and Quantity wrappers. These mirror
+// the pure-Python fallbacks in alphaforge/model/data.py so either backend
+// yields identical values.
+const MAX_FIXED_PRECISION: u8 = 9;
+
+fn check_precision(precision: u8) -> PyResult<()> {
+    if precision > MAX_FIXED_PRECISION {
+        return Err(pyo3::exceptions::PyValueError::new_err("Precision must be between 0 and 9"));
+    }
+    Ok(())
+}
+
+const POW10: [i64; MAX_FIXED_PRECISION as usize + 1] = [
+    1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000,
+];
+
+/// Callers validate `precision` with `check_precision` first
+fn pow10(precision: u8) -> i64 {
+    POW10[precision as usize]
+}
+
+/// Parse "123.45" into raw units at the given precision (extra digits are truncated)
+fn parse_fixed(value_str: &str, precision: u8) -> Option<i64> {
+    let scale = pow10(precision);
+    match value_str.split_once('.') {
+        Some((integer_part, decimal_part)) => {
+            if decimal_part.contains('.') {
+                return None;
+            }
+            let mut digits: String = decimal_part.chars().take(precision as usize).collect();
+            while digits.len() < precision as usize {
+                digits.push('0');
+            }
+            // Apply the sign to the whole value: "-0.5" has a zero integer part
+            let integer_part = integer_part.trim();
+            let integer: i64 = integer_part.parse().ok()?;
+            let decimal: i64 = digits.parse().ok()?;
+            let raw = integer.checked_abs()?.checked_mul(scale)?.checked_add(decimal)?;
+            Some(if integer_part.starts_with('-') { -raw } else { raw })
+        }
+        None => value_str.trim().parse::<i64>().ok()?.checked_mul(scale),
+    }
+}
+
+fn format_fixed(value: i64, precision: u8) -> String {
+    if precision == 0 {
+        return value.to_string();
+    }
+    // Split the magnitude and prefix the sign, so -150 at precision 2 is "-1.50"
+    let divisor = pow10(precision) as u64;
+    let magnitude = value.unsigned_abs();
+    let sign = if value < 0 { "-" } else { "" };
+    format!(
+        "{}{}.{:0width$}",
+        sign,
+        magnitude / divisor,
+        magnitude % divisor,
+        width = precision as usize
+    )
+}
+
+fn from_float(value: f64, precision: u8) -> i64 {
+    // Python's round() is round-half-even
+    (value * pow10(precision) as f64).round_ties_even() as i64
+}
+
+/// Python-style floor division
+fn floor_div(a: i64, b: i64) -> PyResult<i64> {
+    if b == 0 {
+        return Err(pyo3::exceptions::PyZeroDivisionError::new_err("Cannot divide by zero"));
+    }
+    let (q, r) = (a / b, a % b);
+    Ok(if r != 0 && ((r < 0) != (b < 0)) { q - 1 } else { q })
+}
+
+fn overflow(op: &str) -> PyErr {
+    pyo3::exceptions::PyOverflowError::new_err(format!("{} overflow", op))
+}
+
 // Python wrapper for Price
-#[pyclass(name = "Price")]
-#[derive(Clone, Debug)]
+#[pyclass(name = "Price", frozen)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
 pub struct PyPrice {
-    inner: alphaforge_model::orderbook::Price,
+    value: i64,
+    precision: u8,
+}
+
+impl From<alphaforge_model::orderbook::Price> for PyPrice {
+    fn from(price: alphaforge_model::orderbook::Price) -> Self {
+        Self { value: price.raw(), precision: alphaforge_model::orderbook::Price::PRECISION }
+    }
 }
 
 #[pymethods]
 impl PyPrice {
     #[new]
-    fn new(value: f64, precision: u8) -> PyResult<Self> {
-        let price = alphaforge_model::orderbook::Price::from_f64(value, precision)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner: price })
+    #[pyo3(signature = (value, precision=5))]
+    fn new(value: i64, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        Ok(Self { value, precision })
     }
     
-    #[getter]
-    fn value(&self) -> f64 {
-        self.inner.as_f64()
+    #[staticmethod]
+    #[pyo3(signature = (value_str, precision=5))]
+    fn from_str(value_str: &str, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        let value = parse_fixed(value_str, precision).ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err(format!("Invalid price format: {}", value_str))
+        })?;
+        Ok(Self { value, precision })
+    }
+    
+    #[staticmethod]
+    #[pyo3(signature = (value, precision=5))]
+    fn from_int(value: i64, precision: u8) -> PyResult<Self> {
+        Self::new(value, precision)
+    }
+    
+    #[staticmethod]
+    #[pyo3(signature = (value, precision=5))]
+    fn from_float(value: f64, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        Ok(Self { value: from_float(value, precision), precision })
     }
     
     #[getter]
-    fn raw(&self) -> i64 {
-        self.inner.raw()
+    fn value(&self) -> i64 {
+        self.value
     }
     
-    fn __str__(&self) -> String {
-        format!("{:.9}", self.inner.as_f64())
+    #[getter]
+    fn precision(&self) -> u8 {
+        self.precision
     }
     
-    fn __repr__(&self) -> String {
-        format!("Price({})", self.inner.as_f64())
+    fn as_double(&self) -> f64 {
+        self.value as f64 / pow10(self.precision) as f64
     }
     
-    fn __add__(&self, other: &Self) -> PyResult<Self> {
-        let result = self.inner.checked_add(other.inner)
-            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("Price addition overflow"))?;
-        Ok(Self { inner: result })
+    fn as_str(&self) -> String {
+        format_fixed(self.value, self.precision)
     }
     
-    fn __sub__(&self, other: &Self) -> PyResult<Self> {
-        let result = self.inner.checked_sub(other.inner)
-            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("Price subtraction underflow"))?;
-        Ok(Self { inner: result })
+    fn __str__(&self) -> String {
+        self.as_str()
     }
     
-    fn __mul__(&self, factor: f64) -> PyResult<Self> {
-        let result = self.inner.checked_mul_f64(factor)
-            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("Price multiplication overflow"))?;
-        Ok(Self { inner: result })
+    fn __repr__(&self) -> String {
+        format!("Price('{}')", self.as_str())
     }
     
-    fn __eq__(&self, other: &Self) -> bool {
-        self.inner == other.inner
+    fn __add__(&self, other: &Self) -> PyResult<Self> {
+        if self.precision != other.precision {
+            return Err(pyo3::exceptions::PyValueError::new_err("Cannot add prices with different precision"));
+        }
+        let value = self.value.checked_add(other.value).ok_or_else(|| overflow("Price addition"))?;
+        Ok(Self { value, precision: self.precision })
     }
     
-    fn __lt__(&self, other: &Self) -> bool {
-        self.inner < other.inner
+    fn __sub__(&self, other: &Self) -> PyResult<Self> {
+        if self.precision != other.precision {
+            return Err(pyo3::exceptions::PyValueError::new_err("Cannot subtract prices with different precision"));
+        }
+        let value = self.value.checked_sub(other.value).ok_or_else(|| overflow("Price subtraction"))?;
+        Ok(Self { value, precision: self.precision })
     }
     
-    fn __le__(&self, other: &Self) -> bool {
-        self.inner <= other.inner
+    fn __mul__(&self, other: &PyQuantity) -> PyResult<Self> {
+        let value = self.value.checked_mul(other.value).ok_or_else(|| overflow("Price multiplication"))?;
+        Ok(Self { value, precision: self.precision })
     }
     
-    fn __gt__(&self, other: &Self) -> bool {
-        self.inner > other.inner
+    fn __truediv__(&self, other: &PyQuantity) -> PyResult<Self> {
+        Ok(Self { value: floor_div(self.value, other.value)?, precision: self.precision })
     }
     
-    fn __ge__(&self, other: &Self) -> bool {
-        self.inner >= other.inner
+    fn __richcmp__(&self, other: &Bound<'_, PyAny>, op: pyo3::basic::CompareOp, py: Python) -> PyObject {
+        // Ordered by (value, precision), like the fallback's order=True dataclass
+        match other.downcast::<PyPrice>() {
+            Ok(other) => op.matches(self.cmp(other.get())).into_py(py),
+            Err(_) => py.NotImplemented(),
+        }
     }
     
     fn __hash__(&self) -> u64 {
@@ -276,43 +398,116 @@ impl PyPrice {
         use std::hash::{Hash, Hasher};
         
         let mut hasher = DefaultHasher::new();
-        self.inner.hash(&mut hasher);
+        self.hash(&mut hasher);
         hasher.finish()
     }
 }
 
 // Python wrapper for Quantity
-#[pyclass(name = "Quantity")]
-#[derive(Clone, Debug)]
+#[pyclass(name = "Quantity", frozen)]
+#[derive(Clone, Copy, Debug, PartialEq, Eq, PartialOrd, Ord, Hash)]
 pub struct PyQuantity {
-    inner: alphaforge_model::orderbook::Quantity,
+    value: i64,
+    precision: u8,
 }
 
 #[pymethods]
 impl PyQuantity {
     #[new]
-    fn new(value: f64, precision: u8) -> PyResult<Self> {
-        let quantity = alphaforge_model::orderbook::Quantity::from_f64(value, precision)
-            .map_err(|e| pyo3::exceptions::PyValueError::new_err(e.to_string()))?;
-        Ok(Self { inner: quantity })
+    #[pyo3(signature = (value, precision=0))]
+    fn new(value: i64, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        Ok(Self { value, precision })
+    }
+    
+    #[staticmethod]
+    #[pyo3(signature = (value_str, precision=0))]
+    fn from_str(value_str: &str, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        let value = parse_fixed(value_str, precision).ok_or_else(|| {
+            pyo3::exceptions::PyValueError::new_err(format!("Invalid quantity format: {}", value_str))
+        })?;
+        Ok(Self { value, precision })
+    }
+    
+    #[staticmethod]
+    #[pyo3(signature = (value, precision=0))]
+    fn from_int(value: i64, precision: u8) -> PyResult<Self> {
+        Self::new(value, precision)
+    }
+    
+    #[staticmethod]
+    #[pyo3(signature = (value, precision=0))]
+    fn from_float(value: f64, precision: u8) -> PyResult<Self> {
+        check_precision(precision)?;
+        Ok(Self { value: from_float(value, precision), precision })
     }
     
     #[getter]
-    fn value(&self) -> f64 {
-        self.inner.as_f64()
+    fn value(&self) -> i64 {
+        self.value
     }
     
     #[getter]
-    fn raw(&self) -> u64 {
-        self.inner.raw()
+    fn precision(&self) -> u8 {
+        self.precision
+    }
+    
+    fn as_double(&self) -> f64 {
+        self.value as f64 / pow10(self.precision) as f64
+    }
+    
+    fn as_str(&self) -> String {
+        format_fixed(self.value, self.precision)
     }
     
     fn __str__(&self) -> String {
-        format!("{:.8}", self.inner.as_f64())
+        self.as_str()
     }
     
     fn __repr__(&self) -> String {
-        format!("Quantity({})", self.inner.as_f64())
+        format!("Quantity('{}')", self.as_str())
+    }
+    
+    fn __add__(&self, other: &Self) -> PyResult<Self> {
+        if self.precision != other.precision {
+            return Err(pyo3::exceptions::PyValueError::new_err("Cannot add quantities with different precision"));
+        }
+        let value = self.value.checked_add(other.value).ok_or_else(|| overflow("Quantity addition"))?;
+        Ok(Self { value, precision: self.precision })
+    }
+    
+    fn __sub__(&self, other: &Self) -> PyResult<Self> {
+        if self.precision != other.precision {
+            return Err(pyo3::exceptions::PyValueError::new_err("Cannot subtract quantities with different precision"));
+        }
+        let value = self.value.checked_sub(other.value).ok_or_else(|| overflow("Quantity subtraction"))?;
+        Ok(Self { value, precision: self.precision })
+    }
+    
+    fn __mul__(&self, other: &Self) -> PyResult<Self> {
+        let value = self.value.checked_mul(other.value).ok_or_else(|| overflow("Quantity multiplication"))?;
+        Ok(Self { value, precision: self.precision.max(other.precision) })
+    }
+    
+    fn __truediv__(&self, other: &Self) -> PyResult<Self> {
+        Ok(Self { value: floor_div(self.value, other.value)?, precision: self.precision.max(other.precision) })
+    }
+    
+    fn __richcmp__(&self, other: &Bound<'_, PyAny>, op: pyo3::basic::CompareOp, py: Python) -> PyObject {
+        match other.downcast::<PyQuantity>() {
+            Ok(other) => op.matches(self.cmp(other.get())).into_py(py),
+            Err(_) => py.NotImplemented(),
+        }
+    }
+    
+    fn __hash__(&self) -> u64 {
+        use std::collections::hash_map::DefaultHasher;
+        use std::hash::{Hash, Hasher};
+        
+        let mut hasher = DefaultHasher::new();
+        self.hash(&mut hasher);
+        hasher.finish()
     }
 }
 
@@ -374,12 +569,12 @@ impl PyOrderBook {
     
     fn best_bid_price(&self) -> Option<PyPrice> {
         let book = self.inner.lock().unwrap();
-        book.best_bid_price().map(|price| PyPrice { inner: price })
+        book.best_bid_price().map(PyPrice::from)
     }
     
     fn best_ask_price(&self) -> Option<PyPrice> {
         let book = self.inner.lock().unwrap();
-        book.best_ask_price().map(|price| PyPrice { inner: price })
+        book.best_ask_price().map(PyPrice::from)
     }
     
     fn spread(&self) -> Option<f64> {
@@ -427,6 +622,139 @@ impl PyAtomicTime {
     }
 }
 
+// Python wrapper for UnixNanos
+#[pyclass(name = "UnixNanos", frozen)]
+#[derive(Clone, Copy, Debug)]
+pub struct PyUnixNanos(alphaforge_core::time::UnixNanos);
+
+/// Modulus CPython uses for int hashes, so hash(UnixNanos(n)) == hash(n)
+const PY_HASH_MODULUS: u64 = (1 << 61) - 1;
+
+impl PyUnixNanos {
+    /// Accept another UnixNanos or a raw nanosecond int
+    fn operand(other: &Bound<'_, PyAny>) -> Option<u64> {
+        if let Ok(other) = other.downcast::<PyUnixNanos>() {
+            return Some(other.get().0);
+        }
+        other.extract::<u64>().ok()
+    }
+    
+    fn scaled(value: u64, factor: u64) -> PyResult<Self> {
+        value
+            .checked_mul(factor)
+            .map(Self)
+            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("UnixNanos overflow"))
+    }
+}
+
+#[pymethods]
+impl PyUnixNanos {
+    #[new]
+    fn new(value: u64) -> Self {
+        Self(value)
+    }
+    
+    /// Same as the constructor; mirrors the Python fallback's fast path
+    #[staticmethod]
+    fn _raw(value: u64) -> Self {
+        Self(value)
+    }
+    
+    #[getter]
+    fn value(&self) -> u64 {
+        self.0
+    }
+    
+    #[staticmethod]
+    fn now() -> Self {
+        Self(alphaforge_core::time::unix_nanos_now())
+    }
+    
+    #[staticmethod]
+    fn from_millis(millis: u64) -> PyResult<Self> {
+        Self::scaled(millis, 1_000_000)
+    }
+    
+    #[staticmethod]
+    fn from_micros(micros: u64) -> PyResult<Self> {
+        Self::scaled(micros, 1_000)
+    }
+    
+    #[staticmethod]
+    fn from_seconds(seconds: f64) -> Self {
+        Self((seconds * 1_000_000_000.0) as u64)
+    }
+    
+    #[staticmethod]
+    fn from_datetime(dt: &Bound<'_, PyAny>) -> PyResult<Self> {
+        // Naive datetimes are taken as UTC, like the Python fallback
+        let dt = match dt.extract::<chrono::DateTime<chrono::FixedOffset>>() {
+            Ok(aware) => aware.with_timezone(&chrono::Utc),
+            Err(_) => dt.extract::<chrono::NaiveDateTime>()?.and_utc(),
+        };
+        Ok(Self(alphaforge_core::time::datetime_to_unix_nanos(dt)))
+    }
+    
+    fn to_datetime(&self) -> PyResult<chrono::DateTime<chrono::Utc>> {
+        alphaforge_core::time::unix_nanos_to_datetime(self.0)
+            .map_err(pyo3::exceptions::PyValueError::new_err)
+    }
+    
+    fn to_millis(&self) -> u64 {
+        self.0 / 1_000_000
+    }
+    
+    fn to_micros(&self) -> u64 {
+        self.0 / 1_000
+    }
+    
+    fn to_seconds(&self) -> f64 {
+        self.0 as f64 / 1_000_000_000.0
+    }
+    
+    fn __str__(&self) -> String {
+        self.0.to_string()
+    }
+    
+    fn __repr__(&self) -> String {
+        format!("UnixNanos({})", self.0)
+    }
+    
+    fn __richcmp__(&self, other: &Bound<'_, PyAny>, op: pyo3::basic::CompareOp, py: Python) -> PyObject {
+        match Self::operand(other) {
+            Some(other) => op.matches(self.0.cmp(&other)).into_py(py),
+            None => match op {
+                pyo3::basic::CompareOp::Eq => false.into_py(py),
+                pyo3::basic::CompareOp::Ne => true.into_py(py),
+                _ => py.NotImplemented(),
+            },
+        }
+    }
+    
+    fn __hash__(&self) -> isize {
+        (self.0 % PY_HASH_MODULUS) as isize
+    }
+    
+    fn __add__(&self, other: u64) -> PyResult<Self> {
+        self.0
+            .checked_add(other)
+            .map(Self)
+            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("UnixNanos addition overflow"))
+    }
+    
+    fn __sub__(&self, other: &Bound<'_, PyAny>, py: Python) -> PyResult<PyObject> {
+        // UnixNanos - UnixNanos is a signed nanosecond delta
+        if let Ok(other) = other.downcast::<PyUnixNanos>() {
+            return Ok((self.0 as i128 - other.get().0 as i128).into_py(py));
+        }
+        let other: u64 = other.extract()?;
+        self.0
+            .checked_sub(other)
+            .map(|value| Self(value).into_py(py))
+            .ok_or_else(|| pyo3::exceptions::PyOverflowError::new_err("UnixNanos subtraction underflow"))
+    }
+}
+
 // Python wrapper for LiveClock - Temporarily commented out due to clock module absence
 // #[pyclass(name = "LiveClock")]
 // pub struct PyLiveClock {
@@ -622,16 +950,20 @@ impl PyCache {
     }
 
     /// Get value from cache
+    ///
+    /// The lookup runs with the GIL released so concurrent callers only
+    /// contend on the cache lock.
     fn get(&self, py: Python, key: &str) -> PyResult<Option<PyObject>> {
-        match self.cache.get(key) {
+        match py.allow_threads(|| self.cache.get(key)) {
             Some(wrapper) => Ok(Some(wrapper.0.clone_ref(py))),
             None => Ok(None),
         }
     }
 
     /// Put value into cache
-    fn put(&self, key: &str, value: PyObject) -> bool {
-        self.cache.put(key.to_string(), PyObjectWrapper::from(value))
+    fn put(&self, py: Python, key: &str, value: PyObject) -> bool {
+        let wrapper = PyObjectWrapper::from(value);
+        py.allow_threads(|| self.cache.put(key.to_string(), wrapper))
     }
 
     /// Check if key exists in cache
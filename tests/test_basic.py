@@ -4,7 +4,8 @@ Basic tests to verify AlphaForge components work correctly.
 """
 
 import pytest
-from alphaforge.core import uuid4_new, UnixNanos, AtomicTime
+from alphaforge.core import uuid4_new, uuid4_new_batch, UnixNanos, AtomicTime
+from alphaforge.core.uuid import is_valid_uuid4
 from alphaforge.core.exceptions import ValidationError
 from alphaforge.model.identifiers import InstrumentId, ClientOrderId, AccountId
 from alphaforge.model.enums import OrderSide, OrderType, OrderStatus
@@ -24,6 +25,16 @@ class TestCoreUtils:
         assert uuid1 != uuid2
         assert len(uuid1) == 36  # UUID4 string length
     
+    def test_uuid_batch_generation(self):
+        """Test batched UUID generation."""
+        # Larger than one pool refill, so the batch spans several
+        batch = uuid4_new_batch(5000)
+        
+        assert len(batch) == 5000
+        assert len(set(batch)) == 5000
+        assert all(is_valid_uuid4(u) for u in batch)
+        assert uuid4_new_batch(0) == []
+    
     def test_unix_nanos(self):
         """Test UnixNanos time handling."""
         now1 = UnixNanos.now()
@@ -165,6 +176,25 @@ class TestDataTypes:
         qty_sum = qty1 + Quantity.from_int(5000, precision=0)
         assert qty_sum.as_double() == 6000.0
     
+    def test_negative_values(self):
+        """Test the sign applies to the whole value when parsing and formatting."""
+        # Formatting
+        assert Price(-150, 2).as_str() == "-1.50"
+        assert Price(-5, 1).as_str() == "-0.5"
+        assert Price(-100, 0).as_str() == "-100"
+        assert Quantity(-7, 3).as_str() == "-0.007"
+
+        # Parsing, including a zero integer part
+        assert Price.from_str("-0.5", precision=1).value == -5
+        assert Price.from_str("-1.25", precision=2).value == -125
+        assert Price.from_str("-3", precision=2).value == -300
+        assert Quantity.from_str("-0.05", precision=2).value == -5
+
+        # Round trip
+        for raw in (-123456, -1, 0, 1, 123456):
+            price = Price(raw, 3)
+            assert Price.from_str(price.as_str(), precision=3) == price
+
     def test_price_quantity_validation(self):
         """Test Price and Quantity validation."""
         # Invalid precision
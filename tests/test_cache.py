@@ -0,0 +1,126 @@
+# Test AlphaForge Cache
+"""
+Tests for the Python cache, including write-ahead log persistence.
+"""
+
+import os
+
+import pytest
+from alphaforge.core.cache import Cache, CacheConfig
+
+
+@pytest.fixture
+def persistence_path(tmp_path):
+    return str(tmp_path / "cache.json")
+
+
+def persistent_cache(path: str) -> Cache:
+    return Cache(CacheConfig(enable_persistence=True, persistence_path=path))
+
+
+class TestCache:
+    """Test in-memory cache behaviour."""
+
+    def test_put_get_remove(self):
+        """Test basic operations and statistics."""
+        cache = Cache(CacheConfig(max_size=100))
+        assert cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert "a" in cache.keys()
+        assert cache.remove("a")
+        assert not cache.remove("a")
+
+        stats = cache.statistics()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        cache.reset_statistics()
+        assert cache.statistics().hits == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = Cache(CacheConfig(max_size=2))
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+
+class TestCachePersistence:
+    """Test snapshot and write-ahead log persistence."""
+
+    def test_wal_replay(self, persistence_path):
+        """Test mutations since the last snapshot survive a reopen."""
+        cache = persistent_cache(persistence_path)
+        cache.put("a", 1)
+        cache.put("b", {"nested": [1, 2]})
+        cache.put("a", 3)
+        cache.put("c", "gone")
+        cache.remove("c")
+        cache.close()
+
+        reopened = persistent_cache(persistence_path)
+        assert reopened.get("a") == 3
+        assert reopened.get("b") == {"nested": [1, 2]}
+        assert reopened.get("c") is None
+        reopened.close()
+
+    def test_wal_replays_clear(self, persistence_path):
+        """Test a logged clear drops entries written before it."""
+        cache = persistent_cache(persistence_path)
+        cache.put("a", 1)
+        cache.clear()
+        cache.put("b", 2)
+        cache.close()
+
+        reopened = persistent_cache(persistence_path)
+        assert reopened.get("a") is None
+        assert reopened.get("b") == 2
+        reopened.close()
+
+    def test_unserializable_put_is_not_replayed_as_old_value(self, persistence_path):
+        """Test an unpersistable overwrite never resurrects the previous value."""
+        cache = persistent_cache(persistence_path)
+        cache.put("k", 1)
+        cache.put("k", object())
+        cache.close()
+
+        reopened = persistent_cache(persistence_path)
+        assert reopened.get("k") is None
+        reopened.close()
+
+    def test_save_to_disk_compacts_log(self, persistence_path):
+        """Test a snapshot truncates the log and keeps the state."""
+        cache = persistent_cache(persistence_path)
+        for i in range(10):
+            cache.put(f"key_{i}", i)
+        assert os.path.getsize(f"{persistence_path}.wal") > 0
+
+        assert cache.save_to_disk()
+        assert os.path.getsize(f"{persistence_path}.wal") == 0
+        cache.put("after", True)
+        cache.close()
+
+        reopened = persistent_cache(persistence_path)
+        assert reopened.get("key_9") == 9
+        assert reopened.get("after") is True
+        reopened.close()
+
+    def test_torn_log_tail_is_ignored(self, persistence_path):
+        """Test a partially written final record does not block startup."""
+        cache = persistent_cache(persistence_path)
+        cache.put("a", 1)
+        cache.put("b", "x" * 100)
+        cache.close()
+
+        wal_path = f"{persistence_path}.wal"
+        with open(wal_path, "r+b") as f:
+            f.truncate(os.path.getsize(wal_path) - 10)
+
+        reopened = persistent_cache(persistence_path)
+        assert reopened.get("a") == 1
+        assert reopened.get("b") is None
+        reopened.close()
@@ -0,0 +1,156 @@
+# Test AlphaForge Market Data
+"""
+Tests for market data columns, wire formats and tick aggregation.
+"""
+
+import numpy as np
+from alphaforge.core.time import UnixNanos
+from alphaforge.model.identifiers import InstrumentId, TradeId
+from alphaforge.model.enums import AggressorSide
+from alphaforge.model.data import Bar, Price, Quantity, QuoteTick, TradeTick
+from alphaforge.model.wire import (
+    QUOTE_WIRE_DTYPE,
+    TRADE_WIRE_DTYPE,
+    decode_quotes,
+    decode_trades,
+    encode_quotes,
+    encode_trades,
+)
+
+
+BTC = InstrumentId("BTCUSD.BINANCE")
+
+
+def trade(price_raw: int, size_raw: int, ts: int) -> TradeTick:
+    return TradeTick(
+        BTC, Price(price_raw, 2), Quantity(size_raw, 0), UnixNanos(ts),
+        AggressorSide.BUYER, TradeId(f"T-{ts}"), UnixNanos(ts),
+    )
+
+
+class TestWireFormat:
+    """Test fixed-width wire encoding and decoding."""
+
+    def test_record_sizes(self):
+        """Test records keep their documented widths."""
+        assert TRADE_WIRE_DTYPE.itemsize == 32
+        assert QUOTE_WIRE_DTYPE.itemsize == 48
+
+    def test_trade_round_trip(self):
+        """Test encoded trades decode to the same columns and ticks."""
+        columns = {
+            "ts_event": np.array([1, 2, 3], dtype=np.int64),
+            "price_raw": np.array([10_000, 10_050, -25], dtype=np.int64),
+            "size_raw": np.array([5, 6, 7], dtype=np.int64),
+            "aggressor": np.array([1, 2, 1], dtype=np.uint8),
+        }
+        buf = encode_trades(columns)
+        assert len(buf) == 3 * TRADE_WIRE_DTYPE.itemsize
+
+        records = decode_trades(buf)
+        for name, values in columns.items():
+            np.testing.assert_array_equal(records[name], values)
+
+        ticks = TradeTick.from_wire(
+            buf, BTC, [TradeId("T-1"), TradeId("T-2"), TradeId("T-3")],
+            price_precision=2, ts_init=99,
+        )
+        assert ticks[1].price == Price(10_050, 2)
+        assert ticks[1].aggressor_side == AggressorSide.SELLER
+        assert ticks[2].price.as_str() == "-0.25"
+        assert all(t.ts_init == UnixNanos(99) for t in ticks)
+
+    def test_quote_round_trip(self):
+        """Test encoded quotes decode to the same ticks."""
+        columns = {
+            "ts_event": np.array([10, 20], dtype=np.int64),
+            "bid_price_raw": np.array([9_990, 9_995], dtype=np.int64),
+            "ask_price_raw": np.array([10_010, 10_005], dtype=np.int64),
+            "bid_size_raw": np.array([1, 2], dtype=np.int64),
+            "ask_size_raw": np.array([3, 4], dtype=np.int64),
+        }
+        buf = encode_quotes(columns)
+        records = decode_quotes(buf)
+        np.testing.assert_array_equal(records["ask_price_raw"], columns["ask_price_raw"])
+
+        ticks = QuoteTick.from_wire(buf, BTC, price_precision=2, ts_init=0)
+        assert ticks[0].bid_price == Price(9_990, 2)
+        assert ticks[1].ask_size == Quantity.from_int(4)
+        assert ticks[1].ts_event == UnixNanos(20)
+
+    def test_decode_is_a_view(self):
+        """Test decoding shares memory with the buffer."""
+        buf = bytearray(encode_trades({
+            "ts_event": np.array([1], dtype=np.int64),
+            "price_raw": np.array([2], dtype=np.int64),
+            "size_raw": np.array([3], dtype=np.int64),
+            "aggressor": np.array([1], dtype=np.uint8),
+        }))
+        records = decode_trades(buf)
+        records["size_raw"][0] = 42
+        assert decode_trades(buf)["size_raw"][0] == 42
+
+
+class TestColumns:
+    """Test list <-> column conversions."""
+
+    def test_trade_columns_round_trip(self):
+        """Test to_arrays/from_arrays preserve trade ticks."""
+        ticks = [trade(10_000 + i, i + 1, i) for i in range(5)]
+        arrays = TradeTick.to_arrays(ticks)
+        assert arrays["price_raw"].dtype == np.int64
+        restored = TradeTick.from_arrays(
+            arrays, BTC, [f"T-{i}" for i in range(5)], price_precision=2
+        )
+        assert restored == ticks
+
+    def test_bar_columns_round_trip(self):
+        """Test to_arrays/from_arrays preserve bars."""
+        bars = [
+            Bar(Price(100, 2), Price(110, 2), Price(90, 2), Price(105, 2),
+                Quantity.from_int(7), UnixNanos(60), UnixNanos(61)),
+        ]
+        assert Bar.from_arrays(Bar.to_arrays(bars), price_precision=2) == bars
+
+
+class TestTickAggregation:
+    """Test OHLCV aggregation from tick columns."""
+
+    def test_aggregate_ticks(self):
+        """Test windows, empty windows and ticks outside the boundaries."""
+        ts = np.array([0, 5, 9, 25, 27, 40], dtype=np.int64)
+        prices = np.array([100, 105, 98, 110, 107, 999], dtype=np.int64)
+        sizes = np.array([1, 2, 3, 4, 5, 6], dtype=np.int64)
+        boundaries = np.array([0, 10, 20, 30], dtype=np.int64)
+
+        bars = Bar.aggregate_ticks(prices, sizes, ts, boundaries)
+
+        # [10, 20) has no ticks; the tick at 40 is past the last boundary
+        assert bars["ts_event"].tolist() == [10, 30]
+        assert bars["open_raw"].tolist() == [100, 110]
+        assert bars["high_raw"].tolist() == [105, 110]
+        assert bars["low_raw"].tolist() == [98, 107]
+        assert bars["close_raw"].tolist() == [98, 107]
+        assert bars["volume_raw"].tolist() == [6, 9]
+
+    def test_from_ticks_batch(self):
+        """Test bars built straight from trade ticks."""
+        ticks = [trade(100, 1, 1), trade(120, 2, 2), trade(90, 3, 12)]
+        bars = Bar.from_ticks_batch(ticks, [0, 10, 20], price_precision=2)
+        assert len(bars) == 2
+        assert bars[0].high == Price(120, 2)
+        assert bars[0].volume == Quantity.from_int(3)
+        assert bars[1].open == bars[1].close == Price(90, 2)
+        assert bars[1].ts_event == UnixNanos(20)
+
+    def test_aggregate_empty(self):
+        """Test no ticks or no windows produce no bars."""
+        empty = np.array([], dtype=np.int64)
+        bars = Bar.aggregate_ticks(empty, empty, empty, np.array([0, 10], dtype=np.int64))
+        assert len(bars["ts_event"]) == 0
+
+        ts = np.array([1, 2], dtype=np.int64)
+        for boundaries in ([], [0]):
+            bars = Bar.aggregate_ticks(ts, ts, ts, np.array(boundaries, dtype=np.int64))
+            assert all(len(column) == 0 for column in bars.values())
+        assert Bar.from_ticks_batch([trade(100, 1, 1)], [], price_precision=2) == []
@@ -0,0 +1,184 @@
+# Test AlphaForge Events
+"""
+Tests for event types and EventStore indexing.
+"""
+
+import pytest
+from alphaforge.core.time import UnixNanos
+from alphaforge.model.identifiers import (
+    AccountId, ClientOrderId, InstrumentId, PositionId, StrategyId, TradeId
+)
+from alphaforge.model.enums import (
+    AggressorSide, LiquiditySide, OrderSide, OrderStatus, OrderType, PositionSide
+)
+from alphaforge.model.data import Price, Quantity
+from alphaforge.model.events import (
+    EventStore,
+    OrderAccepted,
+    OrderCancelRejected,
+    OrderFilled,
+    OrderRejected,
+    PositionOpened,
+    TradeEvent,
+)
+
+
+ACCOUNT = AccountId("SIM", "001")
+STRATEGY = StrategyId("S-001")
+BTC = InstrumentId("BTCUSD.BINANCE")
+ETH = InstrumentId("ETHUSD.BINANCE")
+
+
+def order_ids(client_order_id: str, instrument_id: InstrumentId = BTC) -> dict:
+    return dict(
+        client_order_id=ClientOrderId(client_order_id),
+        venue_order_id=None,
+        account_id=ACCOUNT,
+        instrument_id=instrument_id,
+        strategy_id=STRATEGY,
+    )
+
+
+def accepted(client_order_id: str, ts: int) -> OrderAccepted:
+    return OrderAccepted(**order_ids(client_order_id), ts_event=UnixNanos(ts), ts_init=UnixNanos(ts))
+
+
+def filled(client_order_id: str, qty: int, px_raw: int, ts: int) -> OrderFilled:
+    return OrderFilled(
+        **order_ids(client_order_id),
+        ts_event=UnixNanos(ts),
+        ts_init=UnixNanos(ts),
+        trade_id=TradeId(f"T-{ts}"),
+        order_side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        last_qty=Quantity.from_int(qty),
+        last_px=Price(px_raw, 2),
+        leaves_qty=Quantity.from_int(0),
+        cum_qty=Quantity.from_int(qty),
+        avg_px=Price(px_raw, 2),
+        commission=Quantity.from_int(1),
+        commission_currency="USD",
+        liquidity_side=LiquiditySide.TAKER,
+    )
+
+
+def position_opened(position_id: str, ts: int) -> PositionOpened:
+    return PositionOpened(
+        position_id=PositionId(position_id),
+        account_id=ACCOUNT,
+        instrument_id=ETH,
+        strategy_id=STRATEGY,
+        ts_event=UnixNanos(ts),
+        ts_init=UnixNanos(ts),
+        side=PositionSide.LONG,
+        quantity=Quantity.from_int(1),
+        peak_qty=Quantity.from_int(1),
+        last_qty=Quantity.from_int(1),
+        last_px=Price(100, 2),
+        currency="USD",
+        avg_px_open=Price(100, 2),
+        realized_return=Quantity.from_int(0),
+        realized_pnl=Quantity.from_int(0),
+        unrealized_pnl=Quantity.from_int(0),
+        ts_opened=UnixNanos(ts),
+    )
+
+
+class TestOrderEvents:
+    """Test order event types."""
+
+    def test_event_type(self):
+        """Test event_type is the class name."""
+        assert accepted("O-1", 1).event_type == "OrderAccepted"
+        assert filled("O-1", 1, 100, 2).event_type == "OrderFilled"
+
+    def test_status_discriminator(self):
+        """Test every order event exposes a status, None where not fixed."""
+        assert accepted("O-1", 1).status == OrderStatus.ACCEPTED
+        assert filled("O-1", 1, 100, 2).status is None
+        rejected = OrderRejected(
+            **order_ids("O-1"), ts_event=UnixNanos(1), ts_init=UnixNanos(1), reason="bad"
+        )
+        assert rejected.status == OrderStatus.REJECTED
+        assert OrderCancelRejected.status is None
+
+    def test_frozen(self):
+        """Test events cannot be mutated."""
+        event = accepted("O-1", 1)
+        with pytest.raises(AttributeError):
+            event.ts_event = UnixNanos(2)
+
+
+class TestEventStore:
+    """Test EventStore queries and indices."""
+
+    def populated_store(self) -> EventStore:
+        store = EventStore()
+        store.add_event(accepted("O-1", 1))
+        store.add_event(filled("O-1", 4, 10_000, 2))
+        store.add_event(accepted("O-2", 3))
+        store.add_event(position_opened("P-1", 4))
+        store.add_event(filled("O-2", 6, 10_100, 5))
+        return store
+
+    def test_get_events(self):
+        """Test lazy and copied queries by type."""
+        store = self.populated_store()
+        assert len(list(store.get_events())) == 5
+        fills = store.get_events("OrderFilled", copy=True)
+        assert isinstance(fills, list)
+        assert [e.trade_id for e in fills] == [TradeId("T-2"), TradeId("T-5")]
+        assert list(store.get_events("OrderFilled")) == fills
+        assert list(store.get_events("OrderExpired")) == []
+
+    def test_secondary_indices(self):
+        """Test per-order, per-position and per-instrument lookups."""
+        store = self.populated_store()
+        order_events = store.get_events_for_order(ClientOrderId("O-1"))
+        assert [e.event_type for e in order_events] == ["OrderAccepted", "OrderFilled"]
+        assert len(store.get_events_for_position(PositionId("P-1"))) == 1
+        assert len(store.get_events_for_instrument(BTC)) == 4
+        assert len(store.get_events_for_instrument(ETH)) == 1
+        assert store.get_events_for_order(ClientOrderId("O-9")) == []
+
+    def test_fill_columns(self):
+        """Test fills are mirrored as raw int64 columns."""
+        store = self.populated_store()
+        columns = store.fill_columns()
+        assert columns["event_index"].tolist() == [1, 4]
+        assert columns["ts_event"].tolist() == [2, 5]
+        assert columns["last_px_raw"].tolist() == [10_000, 10_100]
+        assert columns["last_qty_raw"].tolist() == [4, 6]
+        assert columns["order_side"].tolist() == [OrderSide.BUY, OrderSide.BUY]
+        assert columns["client_order_id"].tolist() == [ClientOrderId("O-1"), ClientOrderId("O-2")]
+
+        # Columns are copies: later fills do not change earlier results
+        store.add_event(filled("O-3", 1, 9_900, 6))
+        assert len(columns["event_index"]) == 2
+        assert store.fill_columns()["event_index"].tolist() == [1, 4, 5]
+
+    def test_extract_columns(self):
+        """Test market data events extract to tick columns."""
+        store = EventStore()
+        store.add_event(TradeEvent(
+            instrument_id=BTC,
+            ts_event=UnixNanos(7),
+            ts_init=UnixNanos(8),
+            price=Price(10_000, 2),
+            size=Quantity.from_int(3),
+            aggressor_side=AggressorSide.BUYER,
+            trade_id=TradeId("T-7"),
+        ))
+        columns = store.extract_columns("TradeEvent")
+        assert columns["price_raw"].tolist() == [10_000]
+        assert columns["size_raw"].tolist() == [3]
+        with pytest.raises(ValueError):
+            store.extract_columns("OrderFilled")
+
+    def test_clear(self):
+        """Test clear empties the events and every index."""
+        store = self.populated_store()
+        store.clear()
+        assert list(store.get_events()) == []
+        assert store.get_events_for_order(ClientOrderId("O-1")) == []
+        assert len(store.fill_columns()["event_index"]) == 0
@@ -0,0 +1,65 @@
+# Test AlphaForge Logging
+"""
+Tests for logger level handling.
+"""
+
+import logging
+
+from alphaforge.core.logging import AlphaForgeLogger, get_logger
+
+
+class RecordingHandler(logging.Handler):
+    """Collect the messages the stdlib logger emits."""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def recorded_logger(name: str, level: str) -> tuple:
+    logger = AlphaForgeLogger(name, level)
+    handler = RecordingHandler()
+    logger._python_logger.addHandler(handler)
+    logger._python_logger.propagate = False
+    return logger, handler
+
+
+class TestLoggerLevels:
+    """Test level filtering and level changes."""
+
+    def test_filtered_levels(self):
+        """Test messages below the level are dropped."""
+        logger, handler = recorded_logger("test.levels.filtered", "WARNING")
+        logger.info("dropped")
+        logger.warning("kept")
+        logger.error("also kept")
+        assert handler.messages == ["kept", "also kept"]
+
+    def test_set_level(self):
+        """Test set_level re-enables and disables levels."""
+        logger, handler = recorded_logger("test.levels.set_level", "INFO")
+        logger.debug("before")
+        logger.set_level("DEBUG")
+        logger.debug("after")
+        logger.set_level("ERROR")
+        logger.warning("filtered again")
+        assert handler.messages == ["after"]
+
+    def test_stdlib_level_change(self):
+        """Test the stdlib path follows the stdlib logger's live level."""
+        logger, handler = recorded_logger("test.levels.stdlib", "INFO")
+        logger._python_logger.setLevel(logging.DEBUG)
+        logger.debug("enabled")
+        assert handler.messages == ["enabled"]
+
+    def test_get_logger_applies_level(self):
+        """Test an explicit level reaches an already cached logger."""
+        logger = get_logger("test.levels.cached")
+        assert get_logger("test.levels.cached", "DEBUG") is logger
+        assert logger._python_logger.level == logging.DEBUG
+        # Omitting the level leaves it unchanged
+        get_logger("test.levels.cached")
+        assert logger._python_logger.level == logging.DEBUG
@@ -0,0 +1,105 @@
+# Test AlphaForge Message Bus
+"""
+Tests for the Python message bus and its ring buffer queue.
+"""
+
+import asyncio
+
+import pytest
+from alphaforge.core.message import Message, MessageBus, MessageType, _MessageRing
+
+
+def message(n: int) -> Message:
+    return Message(str(n), MessageType.PUBLISH, "topic", n)
+
+
+class TestMessageRing:
+    """Test the fixed-capacity ring buffer."""
+
+    def test_capacity_must_be_power_of_two(self):
+        """Test invalid capacities are rejected."""
+        for capacity in (0, -4, 3, 12):
+            with pytest.raises(ValueError):
+                _MessageRing(capacity)
+
+    def test_fifo_and_full(self):
+        """Test FIFO order, the full condition and index wrap-around."""
+        async def run():
+            ring = _MessageRing(4)
+            assert ring.empty()
+            for i in range(4):
+                assert ring.put_nowait(message(i))
+            assert not ring.put_nowait(message(4))
+            assert ring.qsize() == 4
+
+            assert [ring.get_nowait().payload for _ in range(2)] == [0, 1]
+            assert ring.put_nowait(message(4))
+            assert ring.put_nowait(message(5))
+            assert [ring.get_nowait().payload for _ in range(4)] == [2, 3, 4, 5]
+            assert ring.empty()
+
+        asyncio.run(run())
+
+    def test_get_waits_for_put(self):
+        """Test get blocks until an item arrives."""
+        async def run():
+            ring = _MessageRing(2)
+            getter = asyncio.ensure_future(ring.get())
+            await asyncio.sleep(0)
+            assert not getter.done()
+            ring.put_nowait(message(7))
+            return (await asyncio.wait_for(getter, 1.0)).payload
+
+        assert asyncio.run(run()) == 7
+
+    def test_put_waits_for_space(self):
+        """Test put blocks while the ring is full."""
+        async def run():
+            ring = _MessageRing(1)
+            await ring.put(message(0))
+            putter = asyncio.ensure_future(ring.put(message(1)))
+            await asyncio.sleep(0)
+            assert not putter.done()
+            assert ring.get_nowait().payload == 0
+            await asyncio.wait_for(putter, 1.0)
+            return ring.get_nowait().payload
+
+        assert asyncio.run(run()) == 1
+
+
+class TestMessageBus:
+    """Test publish/subscribe delivery."""
+
+    def test_publish_delivers_in_order(self):
+        """Test sync and async subscribers receive every message in order."""
+        received, received_async = [], []
+
+        async def on_message_async(payload):
+            received_async.append(payload)
+
+        async def run():
+            bus = MessageBus()
+            bus.subscribe("prices", received.append)
+            bus.subscribe_async("prices", on_message_async)
+            await bus.start()
+            for i in range(1000):
+                await bus.publish("prices", i)
+            await bus.publish("other", -1)
+            for _ in range(100):
+                if len(received) == 1000 and len(received_async) == 1000:
+                    break
+                await asyncio.sleep(0.01)
+            await bus.stop()
+
+        asyncio.run(run())
+        assert received == list(range(1000))
+        assert received_async == list(range(1000))
+
+    def test_publish_sync(self):
+        """Test synchronous publish calls handlers directly."""
+        received = []
+        bus = MessageBus()
+        bus.subscribe("orders", received.append)
+        bus.publish_sync("orders", "a")
+        bus.publish_sync("unknown", "b")
+        assert received == ["a"]
@@ -0,0 +1,246 @@
+# Test AlphaForge Orders
+"""
+Tests for order state, order pooling, order lists and the columnar order store.
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+from alphaforge.core.time import UnixNanos
+from alphaforge.model.identifiers import ClientOrderId, InstrumentId, StrategyId
+from alphaforge.model.enums import ContingencyType, OrderSide, OrderStatus, OrderType
+from alphaforge.model.data import Price, Quantity
+from alphaforge.model.orders import LimitOrder, MarketOrder, OrderList, OrderPool
+from alphaforge.model.order_store import OrderStore
+
+
+STRATEGY = StrategyId("S-001")
+INSTRUMENT = InstrumentId("BTCUSD.BINANCE")
+
+
+def limit_order(client_order_id: str, quantity: Quantity = Quantity.from_int(10)) -> LimitOrder:
+    return LimitOrder(
+        client_order_id=ClientOrderId(client_order_id),
+        strategy_id=STRATEGY,
+        instrument_id=INSTRUMENT,
+        order_side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=quantity,
+        price=Price.from_str("100.00", precision=2),
+        ts_init=UnixNanos(1_000),
+    )
+
+
+class TestOrderFills:
+    """Test fill application on Order."""
+
+    def test_partial_then_full_fill(self):
+        """Test quantities, average price and status across fills."""
+        order = limit_order("O-1")
+        assert order.leaves_qty == Quantity.from_int(10)
+        assert order.ts_last == order.ts_init
+
+        order.apply_fill(Quantity.from_int(4), Price.from_str("100.00", 2), ts=UnixNanos(2_000))
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.filled_qty == Quantity.from_int(4)
+        assert order.leaves_qty == Quantity.from_int(6)
+        assert order.avg_px == Price.from_str("100.00", 2)
+        assert order.ts_last == UnixNanos(2_000)
+
+        order.apply_fill(Quantity.from_int(6), Price.from_str("101.00", 2), ts=UnixNanos(3_000))
+        assert order.status == OrderStatus.FILLED
+        assert order.leaves_qty == Quantity.from_int(0)
+        assert order.avg_px == Price.from_str("100.60", 2)
+
+    def test_fractional_quantity_precision(self):
+        """Test orders whose quantity has decimal precision."""
+        order = limit_order("O-2", Quantity.from_str("1.5", precision=1))
+        assert order.filled_qty.precision == 1
+        assert order.leaves_qty == Quantity.from_str("1.5", 1)
+
+
+class TestOrderPool:
+    """Test OrderPool reuse."""
+
+    def test_acquire_matches_constructor(self):
+        """Test a pooled order is initialised like a constructed one."""
+        pool = OrderPool()
+        kwargs = dict(
+            client_order_id=ClientOrderId("O-1"),
+            strategy_id=STRATEGY,
+            instrument_id=INSTRUMENT,
+            order_side=OrderSide.SELL,
+            order_type=OrderType.MARKET,
+            quantity=Quantity.from_int(5),
+            init_id="init-1",
+            ts_init=UnixNanos(1_000),
+        )
+        order = pool.acquire(MarketOrder, **kwargs)
+        assert order == MarketOrder(**kwargs)
+
+    def test_release_reuses_and_resets(self):
+        """Test a released order is reused with none of its old state."""
+        pool = OrderPool()
+        order = pool.acquire(
+            LimitOrder,
+            client_order_id=ClientOrderId("O-1"),
+            strategy_id=STRATEGY,
+            instrument_id=INSTRUMENT,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            quantity=Quantity.from_int(10),
+            price=Price.from_str("100.00", 2),
+        )
+        order.apply_fill(Quantity.from_int(10), Price.from_str("100.00", 2))
+        order.add_tag("first")
+        pool.release(order)
+        assert len(pool) == 1
+
+        reused = pool.acquire(
+            LimitOrder,
+            client_order_id=ClientOrderId("O-2"),
+            strategy_id=STRATEGY,
+            instrument_id=INSTRUMENT,
+            order_side=OrderSide.BUY,
+            order_type=OrderType.LIMIT,
+            quantity=Quantity.from_int(3),
+            price=Price.from_str("99.00", 2),
+        )
+        assert reused is order
+        assert len(pool) == 0
+        assert reused.client_order_id == ClientOrderId("O-2")
+        assert reused.status == OrderStatus.INITIALIZED
+        assert reused.filled_qty == Quantity.from_int(0)
+        assert reused.leaves_qty == Quantity.from_int(3)
+        assert reused.avg_px is None
+        assert reused.tags is None
+
+    def test_subclass_validation_runs(self):
+        """Test acquire still applies the order class's validation."""
+        pool = OrderPool()
+        with pytest.raises(ValueError):
+            pool.acquire(
+                LimitOrder,
+                client_order_id=ClientOrderId("O-1"),
+                strategy_id=STRATEGY,
+                instrument_id=INSTRUMENT,
+                order_side=OrderSide.BUY,
+                order_type=OrderType.LIMIT,
+                quantity=Quantity.from_int(1),
+            )
+
+
+class TestOrderList:
+    """Test OrderList indexing and counters."""
+
+    def test_counters_follow_status_changes(self):
+        """Test working/filled counters track member status changes."""
+        first, second = limit_order("O-1"), limit_order("O-2")
+        order_list = OrderList("OL-1", [first], ContingencyType.OCO)
+        order_list.add_order(second)
+        assert order_list.orders_working == 0
+
+        first.set_status(OrderStatus.ACCEPTED)
+        second.set_status(OrderStatus.ACCEPTED)
+        assert order_list.orders_working == 2
+        assert order_list.is_working
+
+        first.apply_fill(Quantity.from_int(10), Price.from_str("100.00", 2))
+        assert order_list.orders_working == 1
+        assert order_list.orders_filled == 1
+
+        second.cancel(ts=UnixNanos(5_000))
+        assert order_list.orders_working == 0
+        assert not order_list.is_working
+
+    def test_get_and_remove_order(self):
+        """Test lookup by client order ID and removal."""
+        first, second = limit_order("O-1"), limit_order("O-2")
+        order_list = OrderList("OL-1", [first, second], ContingencyType.OTO)
+        second.set_status(OrderStatus.ACCEPTED)
+
+        assert order_list.get_order(ClientOrderId("O-2")) is second
+        assert order_list.remove_order(ClientOrderId("O-2")) is second
+        assert order_list.orders == [first]
+        assert order_list.orders_working == 0
+        assert order_list.get_order(ClientOrderId("O-2")) is None
+        assert order_list.remove_order(ClientOrderId("O-2")) is None
+
+        # A removed order no longer updates the list
+        second.set_status(OrderStatus.CANCELED)
+        assert order_list.orders_working == 0
+
+    def test_asdict(self):
+        """Test members and the list convert with dataclasses.asdict."""
+        order = limit_order("O-1")
+        order_list = OrderList("OL-1", [order], ContingencyType.OCO)
+
+        order_dict = dataclasses.asdict(order)
+        assert "_order_list" not in order_dict
+        assert order_dict["client_order_id"] == ClientOrderId("O-1")
+        assert len(dataclasses.asdict(order_list)["orders"]) == 1
+
+
+class TestOrderStore:
+    """Test the struct-of-arrays OrderStore."""
+
+    def create(self, store: OrderStore, client_order_id: str, quantity: int = 10) -> int:
+        return store.create(
+            ClientOrderId(client_order_id),
+            STRATEGY,
+            INSTRUMENT,
+            OrderSide.BUY,
+            OrderType.LIMIT,
+            Quantity.from_int(quantity),
+            Price.from_str("100.00", 2),
+            status=OrderStatus.ACCEPTED,
+            ts_init=1_000,
+        )
+
+    def test_create_and_grow(self):
+        """Test rows are appended and columns grow past the initial capacity."""
+        store = OrderStore(capacity=2)
+        rows = [self.create(store, f"O-{i}") for i in range(5)]
+        assert rows == [0, 1, 2, 3, 4]
+        assert len(store) == 5
+        assert ClientOrderId("O-3") in store
+        assert store.index(ClientOrderId("O-3")) == 3
+        np.testing.assert_array_equal(store.column("quantity"), [10] * 5)
+
+        with pytest.raises(ValueError):
+            self.create(store, "O-0")
+
+    def test_apply_fill_and_status_scans(self):
+        """Test fills update the columns and the status scans."""
+        store = OrderStore()
+        for i in range(3):
+            self.create(store, f"O-{i}")
+
+        store.apply_fill(0, 4, 10_000, 2_000)
+        store.apply_fill(0, 6, 10_100, 3_000)
+        store.apply_fill(1, 5, 10_000, 2_000)
+        store.set_status(2, OrderStatus.CANCELED)
+
+        np.testing.assert_array_equal(store.column("avg_px")[:2], [10_060, 10_000])
+        np.testing.assert_array_equal(store.leaves_qty(), [0, 5, 10])
+        np.testing.assert_array_equal(store.open_indices(), [1])
+        np.testing.assert_array_equal(store.closed_indices(), [0, 2])
+        assert store.count_open() == 1
+
+        with pytest.raises(ValueError):
+            store.apply_fill(1, 6, 10_000, 4_000)
+
+    def test_round_trip_through_order(self):
+        """Test add_order/to_order preserve an order's state."""
+        order = limit_order("O-1")
+        order.set_status(OrderStatus.ACCEPTED)
+        order.apply_fill(Quantity.from_int(4), Price.from_str("100.50", 2), ts=UnixNanos(2_000))
+
+        store = OrderStore()
+        row = store.add_order(order)
+        restored = store.to_order(row)
+
+        for name in ("client_order_id", "order_side", "quantity", "price", "status",
+                     "filled_qty", "leaves_qty", "avg_px", "ts_init", "ts_last"):
+            assert getattr(restored, name) == getattr(order, name), name